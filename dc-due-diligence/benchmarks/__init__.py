@@ -0,0 +1 @@
+"""Benchmarks for the conversion and redaction pipeline (not run by pytest)."""
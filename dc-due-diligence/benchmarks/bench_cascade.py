@@ -0,0 +1,107 @@
+"""
+Speed and recall of the two-stage PII cascade against the single full model.
+
+Runs GLiNER detection over a generated corpus (see ``benchmarks.pii_corpus``)
+with the full model alone, then with a small screening model in front of it
+(``redactor.set_cascade``).  Reports wall-clock time, recall per planted
+label, and every entity the single-stage run found that the cascade lost.
+Both runs use the regex candidate gate, as the pipeline does.
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_cascade [--documents 40] \\
+        [--screen-model urchade/gliner_small-v2.1] [--screen-threshold 0.1]
+
+Both models are loaded before timing starts.  Exits non-zero if the cascade
+loses an entity.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from benchmarks.pii_corpus import make_corpus, recall_by_label
+from converters import redactor
+
+
+def run(documents: int, seed: int, screen_model: str) -> int:
+    corpus = make_corpus(documents, seed=seed)
+    texts = [document.text for document in corpus]
+    chars = sum(len(text) for text in texts)
+
+    runs = {"single": "", "cascade": screen_model}
+    detections = {}
+    timings = {}
+    for name, screen in runs.items():
+        redactor.set_cascade(screen)
+        redactor._detect_pii_gliner_many(["Warm-up: SSN 123-45-6789."])
+        start = time.perf_counter()
+        detections[name] = redactor._detect_pii_gliner_many(texts)
+        timings[name] = time.perf_counter() - start
+
+    recall = {
+        name: recall_by_label(
+            corpus, [[(e["start"], e["end"]) for e in ents] for ents in found]
+        )
+        for name, found in detections.items()
+    }
+    labels = sorted(recall["single"])
+    lost = [
+        (index, entity)
+        for index, (single, cascade) in enumerate(
+            zip(detections["single"], detections["cascade"])
+        )
+        for entity in single
+        if not any(
+            c["start"] < entity["end"] and entity["start"] < c["end"] for c in cascade
+        )
+    ]
+
+    print()
+    print(f"{documents} synthetic documents, {chars:,} characters")
+    print(f"Screening model: {screen_model} (threshold {redactor._SCREEN_THRESHOLD})")
+    print(
+        f"{'run':<8} {'seconds':>8} {'chars/s':>9} {'speedup':>8}  "
+        + " ".join(f"{label[:10]:>10}" for label in labels)
+    )
+    for name in runs:
+        elapsed = timings[name]
+        print(
+            f"{name:<8} {elapsed:>8.1f} {chars / elapsed:>9,.0f} "
+            f"{timings['single'] / elapsed:>7.2f}x  "
+            + " ".join(f"{recall[name][label]:>10.3f}" for label in labels)
+        )
+    print()
+    if lost:
+        print(f"{len(lost)} entities found by the full model were lost by the cascade:")
+        for index, entity in lost:
+            print(f"  document {index}: {entity['label']} {entity['text']!r}")
+        print()
+        return 1
+    print("No entities lost by the cascade.")
+    print()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--screen-model", default=redactor._DEFAULT_SCREEN_MODEL)
+    parser.add_argument(
+        "--screen-threshold", type=float, default=redactor._SCREEN_THRESHOLD
+    )
+    parser.add_argument("--backend", default=None, help="torch or onnx")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    redactor.set_backend(args.backend)
+    redactor._SCREEN_THRESHOLD = args.screen_threshold
+    return run(args.documents, args.seed, args.screen_model)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
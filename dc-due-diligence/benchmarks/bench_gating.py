@@ -0,0 +1,109 @@
+"""
+Skip rate, speed and recall of the GLiNER candidate gate on synthetic PII.
+
+Runs GLiNER over a generated corpus (see ``benchmarks.pii_corpus``) twice:
+reading every chunk, and reading only the windows around candidate tokens
+(``redactor._model_windows``).  Reports the share of characters the gate
+kept from the model, wall-clock time, recall per planted label, and every
+entity the full scan found that the gated scan did not.
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_gating [--documents 40] [--backend torch]
+
+Broker documents are mostly prose, so the default corpus plants a few
+values of every redacted label in long filler text.  Exits non-zero if the
+gate loses an entity or lowers any label's recall.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from benchmarks.pii_corpus import make_corpus, recall_by_label
+from converters import redactor
+
+
+def run(documents: int, seed: int, filler: int, pii: int) -> int:
+    corpus = make_corpus(
+        documents, seed=seed, filler_sentences=filler, pii_sentences=pii
+    )
+    texts = [document.text for document in corpus]
+    chars = sum(len(text) for text in texts)
+    redactor._detect_pii_gliner("Warm-up: EIN 12-3456789.")
+
+    detections = {}
+    timings = {}
+    model_chars = {}
+    for gate in (False, True):
+        windows = [redactor._model_windows(text, gate) for text in texts]
+        model_chars[gate] = sum(e - s for spans in windows for s, e in spans)
+        start = time.perf_counter()
+        detections[gate] = redactor._detect_pii_gliner_many(texts, windows=windows)
+        timings[gate] = time.perf_counter() - start
+
+    lost = [
+        (index, entity)
+        for index, (full, gated) in enumerate(zip(detections[False], detections[True]))
+        for entity in full
+        if not any(
+            g["start"] < entity["end"] and entity["start"] < g["end"] for g in gated
+        )
+    ]
+
+    recall = {
+        gate: recall_by_label(
+            corpus,
+            [[(e["start"], e["end"]) for e in ents] for ents in detections[gate]],
+        )
+        for gate in (False, True)
+    }
+    labels = sorted(recall[False])
+
+    print()
+    print(f"{documents} synthetic documents, {chars:,} characters")
+    print(
+        f"{'scan':<6} {'to model':>10} {'skipped':>8} {'seconds':>8} {'speedup':>8}  "
+        + " ".join(f"{label[:10]:>10}" for label in labels)
+    )
+    for gate, name in ((False, "full"), (True, "gated")):
+        speedup = timings[False] / timings[gate] if timings[gate] else 0.0
+        print(
+            f"{name:<6} {model_chars[gate]:>10,} {1 - model_chars[gate] / chars:>8.1%} "
+            f"{timings[gate]:>8.1f} {speedup:>7.2f}x  "
+            + " ".join(f"{recall[gate][label]:>10.3f}" for label in labels)
+        )
+    print()
+    worse = [label for label in labels if recall[True][label] < recall[False][label]]
+    if lost or worse:
+        if worse:
+            print(f"Gated recall is lower for: {', '.join(worse)}")
+        print(f"{len(lost)} entities found by the full scan were lost by the gate:")
+        for index, entity in lost:
+            print(f"  document {index}: {entity['label']} {entity['text']!r}")
+        print()
+        return 1
+    print("No entities lost by the gate.")
+    print()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--filler", type=int, default=150, help="Prose sentences per document")
+    parser.add_argument("--pii", type=int, default=3, help="Planted values per document")
+    parser.add_argument("--backend", default=None, help="torch or onnx")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    redactor.set_backend(args.backend)
+    return run(args.documents, args.seed, args.filler, args.pii)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
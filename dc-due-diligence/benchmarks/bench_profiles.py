@@ -0,0 +1,133 @@
+"""
+Speed/quality trade-off of the conversion profiles on a real document folder.
+
+Converts every Docling-handled file in a folder once per profile and reports
+wall-clock time, throughput, and how closely each profile's markdown matches
+the ``accurate`` profile's output (word-level F1 and table-row recall).
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_profiles <folder> [--profiles fast,balanced,accurate]
+
+Model loading is done before timing starts so the numbers reflect steady-state
+conversion cost, not first-run downloads.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from converters.docling_converter import DoclingConverter, _get_converter
+from converters.profiles import PROFILES, get_profile
+from converters.scanner import scan_folder
+
+REFERENCE_PROFILE = "accurate"
+
+
+def word_f1(reference: str, candidate: str) -> float:
+    """Bag-of-words F1 of *candidate* against *reference*."""
+    ref = Counter(reference.split())
+    cand = Counter(candidate.split())
+    if not ref and not cand:
+        return 1.0
+    overlap = sum((ref & cand).values())
+    if overlap == 0:
+        return 0.0
+    precision = overlap / sum(cand.values())
+    recall = overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def table_row_recall(reference: str, candidate: str) -> float:
+    """Fraction of the reference's markdown table rows found in *candidate*."""
+    ref_rows = Counter(
+        line.strip() for line in reference.splitlines() if line.lstrip().startswith("|")
+    )
+    if not ref_rows:
+        return 1.0
+    cand_rows = Counter(
+        line.strip() for line in candidate.splitlines() if line.lstrip().startswith("|")
+    )
+    return sum((ref_rows & cand_rows).values()) / sum(ref_rows.values())
+
+
+def run(folder: Path, profile_names: list[str]) -> int:
+    scan = scan_folder(folder)
+    paths = [e.path for e in scan.supported if e.converter == "DoclingConverter"]
+    if not paths:
+        print(f"No Docling-handled files in {folder}")
+        return 1
+
+    outputs: dict[str, dict[Path, str]] = {}
+    timings: dict[str, float] = {}
+    pages: dict[str, int] = {}
+
+    for name in profile_names:
+        profile = get_profile(name)
+        _get_converter(profile, do_ocr=True)
+        _get_converter(profile, do_ocr=False)
+        converter = DoclingConverter(profile)
+
+        outputs[name] = {}
+        pages[name] = 0
+        start = time.perf_counter()
+        for path in paths:
+            result = converter.convert(path)
+            outputs[name][path] = result.text if result.success else ""
+            pages[name] += result.page_count
+        timings[name] = time.perf_counter() - start
+
+    reference = outputs.get(REFERENCE_PROFILE)
+    base_time = timings.get(REFERENCE_PROFILE)
+
+    print()
+    print(f"{len(paths)} files from {folder}")
+    print(
+        f"{'profile':<10} {'seconds':>9} {'pages/s':>8} {'speedup':>8} "
+        f"{'word F1':>8} {'table rows':>11}"
+    )
+    for name in profile_names:
+        elapsed = timings[name]
+        throughput = pages[name] / elapsed if elapsed else 0.0
+        speedup = f"{base_time / elapsed:.2f}x" if base_time and elapsed else "-"
+        if reference is not None:
+            f1 = sum(
+                word_f1(reference[p], outputs[name][p]) for p in paths
+            ) / len(paths)
+            rows = sum(
+                table_row_recall(reference[p], outputs[name][p]) for p in paths
+            ) / len(paths)
+            quality = f"{f1:>8.3f} {rows:>11.3f}"
+        else:
+            quality = f"{'-':>8} {'-':>11}"
+        print(
+            f"{name:<10} {elapsed:>9.1f} {throughput:>8.2f} {speedup:>8} {quality}"
+        )
+    print()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("folder", type=Path)
+    parser.add_argument(
+        "--profiles",
+        default=",".join(PROFILES),
+        help="Comma-separated profile names (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    names = [n.strip() for n in args.profiles.split(",") if n.strip()]
+    for name in names:
+        get_profile(name)
+    return run(args.folder, names)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
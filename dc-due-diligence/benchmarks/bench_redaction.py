@@ -0,0 +1,122 @@
+"""
+Throughput and recall of the GLiNER redaction backends on synthetic PII.
+
+Runs PII detection over a generated corpus (see ``benchmarks.pii_corpus``)
+once per backend and reports wall-clock time, characters per second, and
+recall per planted label -- for the model alone and for the full detector
+(model plus regex fallback).  The ``torch`` backend is the reference: a
+quantized backend should match its recall on SSNs, EINs and IBANs.
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_redaction [--documents 40] [--backends torch,onnx] [--batch-size 8]
+
+Models are loaded (and the ONNX model exported, on first use) before timing
+starts so the numbers reflect steady-state inference cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from benchmarks.pii_corpus import make_corpus, recall_by_label
+from converters import redactor
+
+REFERENCE_BACKEND = "torch"
+
+# Labels whose recall a faster backend must preserve.
+KEY_LABELS: list[str] = ["ssn", "ein", "iban"]
+
+
+def run(backends: list[str], documents: int, seed: int, batch_size: int) -> int:
+    corpus = make_corpus(documents, seed=seed)
+    chars = sum(len(document.text) for document in corpus)
+
+    timings: dict[str, float] = {}
+    model_recall: dict[str, dict[str, float]] = {}
+    full_recall: dict[str, dict[str, float]] = {}
+
+    for backend in backends:
+        redactor.set_backend(backend)
+        redactor._detect_pii_gliner("Warm-up: EIN 12-3456789.")
+
+        start = time.perf_counter()
+        detected = redactor._detect_pii_gliner_many(
+            [d.text for d in corpus], batch_size=batch_size
+        )
+        timings[backend] = time.perf_counter() - start
+
+        model_spans = [[(e["start"], e["end"]) for e in ents] for ents in detected]
+        model_recall[backend] = recall_by_label(corpus, model_spans)
+        full_spans = [
+            [
+                (e["start"], e["end"])
+                for e in redactor._merge_detections(
+                    ents, redactor._detect_pii_regex(d.text)
+                )
+            ]
+            for d, ents in zip(corpus, detected)
+        ]
+        full_recall[backend] = recall_by_label(corpus, full_spans)
+
+    labels = sorted({label for r in model_recall.values() for label in r})
+    base_time = timings.get(REFERENCE_BACKEND)
+
+    print()
+    print(f"{documents} synthetic documents, {chars:,} characters")
+    print(
+        f"{'backend':<8} {'seconds':>8} {'chars/s':>9} {'speedup':>8}  "
+        + " ".join(f"{label[:10]:>10}" for label in labels)
+    )
+    for backend in backends:
+        elapsed = timings[backend]
+        speedup = f"{base_time / elapsed:.2f}x" if base_time and elapsed else "-"
+        print(
+            f"{backend:<8} {elapsed:>8.1f} {chars / elapsed:>9,.0f} {speedup:>8}  "
+            + " ".join(f"{model_recall[backend][label]:>10.3f}" for label in labels)
+        )
+        print(
+            f"{'+ regex':<8} {'':>8} {'':>9} {'':>8}  "
+            + " ".join(f"{full_recall[backend][label]:>10.3f}" for label in labels)
+        )
+
+    reference = model_recall.get(REFERENCE_BACKEND)
+    status = 0
+    if reference is not None:
+        for backend in backends:
+            lost = [
+                label
+                for label in KEY_LABELS
+                if model_recall[backend].get(label, 1.0) < reference.get(label, 1.0)
+            ]
+            if lost:
+                print(f"{backend}: lower model recall than torch on {', '.join(lost)}")
+                status = 1
+    print()
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=redactor._BATCH_SIZE)
+    parser.add_argument(
+        "--backends",
+        default=",".join(redactor.REDACTION_BACKENDS),
+        help="Comma-separated backends (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    for backend in backends:
+        redactor.set_backend(backend)
+    return run(backends, args.documents, args.seed, args.batch_size)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Speed and precision of the single-pass regex scanner against the old one.
+
+The old scanner ran six patterns over the text, one ``finditer`` each, and
+kept every match; it is reproduced here as the reference.  Both run over a
+generated corpus (see ``benchmarks.pii_corpus``) with look-alike numbers
+mixed in: invoice and PO numbers of card, IBAN and routing number shape
+whose check digits do not validate.  Reports time, recall of the planted
+values with a fixed shape, and matches outside any planted value (false
+positives, which would become redactions).
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_regex [--documents 400] [--repeat 5]
+
+Exits non-zero if the scanner misses a planted value the reference found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from typing import Any
+
+from benchmarks.pii_corpus import FIXED_SHAPE_LABELS, SyntheticDocument, make_corpus
+from converters import redactor
+
+REFERENCE_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    ("ssn", re.compile(r"\b\d{3}[-\s]\d{2}[-\s]\d{4}\b")),
+    ("ein", re.compile(r"\b\d{2}-\d{7}\b")),
+    ("credit_card", re.compile(r"\b\d{4}[-\s]\d{4}[-\s]\d{4}[-\s]\d{4}\b")),
+    ("credit_card", re.compile(r"\b[3-6]\d{15}\b")),
+    ("iban", re.compile(r"\b[A-Z]{2}\d{2}[A-Z0-9]{4,30}\b")),
+    ("routing_number", re.compile(r"\b[0-3]\d{8}\b")),
+]
+
+LOOKALIKES: list[str] = [
+    "Invoice {card} covers the switchgear deposit.",
+    "Purchase order {routing} was issued to the general contractor.",
+    "Vendor reference {iban} appears on the remittance advice.",
+]
+
+
+def reference_detect(text: str) -> list[dict[str, Any]]:
+    """The six-pass scanner, without validation."""
+    entities = [
+        {"start": m.start(), "end": m.end(), "label": label}
+        for label, pattern in REFERENCE_PATTERNS
+        for m in pattern.finditer(text)
+    ]
+    entities.sort(key=lambda e: e["start"])
+    return entities
+
+
+def add_lookalikes(document: SyntheticDocument, rng: random.Random, count: int) -> str:
+    """Append *count* sentences with numbers that fail their check digits."""
+    sentences = []
+    for _ in range(count):
+        card = "4" + "".join(rng.choice(string.digits) for _ in range(15))
+        if redactor._luhn_valid(card):
+            card = card[:-1] + str((int(card[-1]) + 1) % 10)
+        routing = rng.choice("0123") + "".join(rng.choice(string.digits) for _ in range(8))
+        if redactor._routing_number_valid(routing):
+            routing = routing[:-1] + str((int(routing[-1]) + 1) % 10)
+        iban = "DE00" + "".join(rng.choice(string.digits) for _ in range(18))
+        sentences.append(
+            rng.choice(LOOKALIKES).format(card=card, routing=routing, iban=iban)
+        )
+    return document.text + " " + " ".join(sentences)
+
+
+def score(corpus, texts, detect) -> tuple[float, int, int, int]:
+    """(seconds, planted found, planted total, false positives) for *detect*."""
+    start = time.perf_counter()
+    detections = [detect(text) for text in texts]
+    elapsed = time.perf_counter() - start
+
+    found = total = false_positives = 0
+    for document, entities in zip(corpus, detections):
+        planted = [v for v in document.planted if v.label in FIXED_SHAPE_LABELS]
+        spans = {(e["start"], e["end"]) for e in entities}
+        total += len(planted)
+        found += sum((v.start, v.end) in spans for v in planted)
+        false_positives += sum(
+            not any(v.start < e["end"] and e["start"] < v.end for v in document.planted)
+            for e in entities
+        )
+    return elapsed, found, total, false_positives
+
+
+def run(documents: int, seed: int, lookalikes: int, repeat: int) -> int:
+    rng = random.Random(seed)
+    corpus = make_corpus(documents, seed=seed)
+    texts = [add_lookalikes(document, rng, lookalikes) for document in corpus]
+    chars = sum(len(text) for text in texts)
+
+    results = {}
+    for name, detect in (
+        ("six-pass", reference_detect),
+        ("one-pass", redactor._detect_pii_regex),
+    ):
+        runs = [score(corpus, texts, detect) for _ in range(repeat)]
+        best = min(elapsed for elapsed, *_ in runs)
+        results[name] = (best, *runs[0][1:])
+
+    print()
+    print(f"{documents} synthetic documents, {chars:,} characters, best of {repeat}")
+    print(f"{'scanner':<9} {'seconds':>8} {'MB/s':>7} {'recall':>7} {'false pos':>10}")
+    for name, (elapsed, found, total, false_positives) in results.items():
+        print(
+            f"{name:<9} {elapsed:>8.3f} {chars / elapsed / 1e6:>7.1f} "
+            f"{found / total:>7.3f} {false_positives:>10,}"
+        )
+    print()
+    if results["one-pass"][1] < results["six-pass"][1]:
+        print("The one-pass scanner missed planted values the reference found.")
+        print()
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lookalikes", type=int, default=3, help="Per document")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    return run(args.documents, args.seed, args.lookalikes, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Speed of merging detections and splicing placeholders on large documents.
+
+Builds one synthetic document of the requested size from the generated
+corpus (see ``benchmarks.pii_corpus``) and times ``redactor._apply_redactions``
+on it, with every regex match also passed in as a GLiNER entity so the merge
+has overlaps to resolve.  No model is loaded.
+
+The previous engine -- a ``set(range())`` per entity to test overlap and one
+string rebuild per replacement -- is kept here as a reference.  It is
+quadratic, so it only runs on documents up to ``--reference-mb``; the two
+must produce the same text wherever both run.
+
+Usage (from the plugin directory)::
+
+    .venv/bin/python3 -m benchmarks.bench_splice [--size-mb 10] [--reference-mb 1]
+
+Exits non-zero if the outputs differ.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any
+
+from benchmarks.pii_corpus import make_corpus
+from converters import redactor
+
+
+def reference_redact(text: str, gliner_entities: list[dict[str, Any]]) -> str:
+    """The per-entity set-and-rebuild engine, for comparison."""
+    regex_entities = redactor._detect_pii_regex(text)
+    covered: set[int] = set()
+    for ent in gliner_entities:
+        covered.update(range(ent["start"], ent["end"]))
+    merged = list(gliner_entities)
+    for ent in regex_entities:
+        if not set(range(ent["start"], ent["end"])) & covered:
+            merged.append(ent)
+
+    redacted = text
+    for ent in sorted(merged, key=lambda e: e["start"], reverse=True):
+        label = redactor._LABEL_MAP.get(ent["label"], ent["label"])
+        replacement = redactor._REDACT_FMT.format(label=label)
+        redacted = redacted[: ent["start"]] + replacement + redacted[ent["end"] :]
+    return redacted
+
+
+def make_document(size: int, seed: int) -> str:
+    """Join generated documents until *size* characters, then cut there."""
+    parts: list[str] = []
+    total = 0
+    while total < size:
+        for document in make_corpus(40, seed=seed + len(parts)):
+            parts.append(document.text)
+            total += len(document.text) + 2
+    text = "\n\n".join(parts)[:size]
+    # Do not end mid-value.
+    return text[: text.rfind(" ")]
+
+
+def run(size_mb: float, reference_mb: float, seed: int) -> int:
+    sizes = sorted({min(reference_mb, size_mb), size_mb})
+    failed = False
+
+    print()
+    print(f"{'size':>8} {'entities':>9} {'reference s':>12} {'sweep s':>9} {'speedup':>8}")
+    for mb in sizes:
+        text = make_document(int(mb * 1_000_000), seed)
+        # Regex matches posing as GLiNER spans: every one overlaps a regex match.
+        gliner = [
+            {**ent, "label": "social security number", "source": "gliner"}
+            for ent in redactor._detect_pii_regex(text)
+        ]
+
+        start = time.perf_counter()
+        result = redactor._apply_redactions(text, gliner)
+        sweep = time.perf_counter() - start
+
+        reference = None
+        if mb <= reference_mb:
+            start = time.perf_counter()
+            expected = reference_redact(text, gliner)
+            reference = time.perf_counter() - start
+            if expected != result.redacted_text:
+                failed = True
+
+        print(
+            f"{mb:>6.1f}MB {result.entities_found:>9,} "
+            + (
+                f"{reference:>12.2f} {sweep:>9.2f} {reference / sweep:>7.1f}x"
+                if reference is not None
+                else f"{'-':>12} {sweep:>9.2f} {'-':>8}"
+            )
+        )
+    print()
+    if failed:
+        print("The sweep and the reference engine produced different text.")
+        print()
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=10.0)
+    parser.add_argument(
+        "--reference-mb",
+        type=float,
+        default=1.0,
+        help="Largest document to run the quadratic reference engine on",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    return run(args.size_mb, args.reference_mb, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
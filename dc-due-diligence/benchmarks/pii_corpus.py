@@ -0,0 +1,324 @@
+"""
+Synthetic due-diligence documents with planted PII, for redaction benchmarks.
+
+Each document is filler prose of the kind found in data center offering
+memoranda and site packages, with sensitive values planted in realistic sentences: one label per label
+the redactor removes (SSNs, EINs, IBANs, account numbers, card numbers,
+expiry dates and CVVs, driver's licence, passport and health insurance
+IDs), plus ABA routing numbers.  The planted spans are recorded so
+benchmarks can measure recall without hand labelling.  Generated values
+are well-formed (IBAN check digits, ABA routing checksums and Luhn card
+numbers are valid, Medicare MBIs use the MBI alphabet) but random.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+from dataclasses import dataclass, field
+
+# Sentences with no PII; they include look-alikes (dates, MW figures, phone
+# numbers, parcel IDs) that a redactor must leave alone.
+FILLER: list[str] = [
+    "The site offers 120 MW of firm utility capacity from two substations.",
+    "Phase 1 delivers 36 MW of critical IT load by Q3 2027.",
+    "Zoning is M-2 heavy industrial; data centers are a by-right use.",
+    "The parcel (APN 044-120-37) spans 212 acres with rail access.",
+    "Fiber is available from three carriers within 2.4 miles of the gate.",
+    "Contact the broker at (512) 555-0143 to arrange a site walk.",
+    "The Phase I ESA dated 03/14/2025 found no recognized environmental conditions.",
+    "Water supply is 1.5 million gallons per day from the municipal system.",
+    "Asking price is $48,500,000, or approximately $228,000 per acre.",
+    "The interconnection agreement was executed on 2024-11-02.",
+    "Annual property taxes were $312,440 for the 2024 assessment year.",
+    "Cooling design assumes a PUE of 1.25 at full build-out.",
+    "The utility quoted a tariff of 6.1 cents per kWh for transmission service.",
+    "Title commitment No. 2025-88213 shows no liens on the property.",
+    "Seismic zone is 1 and the site lies outside the 500-year floodplain.",
+]
+
+# Sentence templates for each planted label.  ``{value}`` is replaced by a
+# generated value of that label.
+TEMPLATES: dict[str, list[str]] = {
+    "ssn": [
+        "The landowner's Social Security Number is {value}.",
+        "Guarantor SSN: {value}",
+        "Seller (SSN {value}) will sign the estoppel.",
+    ],
+    "ein": [
+        "Seller's federal EIN is {value}.",
+        "Tax ID (EIN): {value}",
+        "The operating company, EIN {value}, holds the lease.",
+    ],
+    "iban": [
+        "Wire the earnest money to IBAN {value}.",
+        "Beneficiary account (IBAN): {value}",
+    ],
+    "routing_number": [
+        "ABA routing number {value} for domestic wires.",
+        "Routing No.: {value}",
+    ],
+    "bank_account": [
+        "Deposit to checking account number {value} at First Regional Bank.",
+        "Escrow account no. {value}",
+        "Account No. {value}",
+    ],
+    "credit_card": [
+        "The application fee was paid with card {value}.",
+        "Corporate card number: {value}",
+    ],
+    "card_expiry": [
+        "Card expires {value}.",
+        "The corporate card (exp. {value}) is on file with the broker.",
+        "Visa ending 4242, valid thru {value}.",
+    ],
+    "cvv": [
+        "CVV {value} was provided by phone.",
+        "Card security code: {value}",
+    ],
+    "drivers_license": [
+        "The guarantor's driver's license number is {value}.",
+        "DL: {value}",
+    ],
+    "passport": [
+        "Beneficial owner passport No. {value} (United States).",
+        "Passport number: {value}",
+    ],
+    "health_insurance_id": [
+        "The seller's Medicare MBI is {value}.",
+        "Health plan member ID: {value}",
+    ],
+}
+
+# Labels whose values have a fixed shape the regex scanner looks for; the
+# rest are left to GLiNER.
+FIXED_SHAPE_LABELS: frozenset[str] = frozenset(
+    {"ssn", "ein", "iban", "routing_number", "credit_card"}
+)
+
+
+@dataclass
+class PlantedValue:
+    """One planted PII value: its label and character span."""
+
+    label: str
+    start: int
+    end: int
+
+
+@dataclass
+class SyntheticDocument:
+    """A generated document and the PII planted in it."""
+
+    text: str
+    planted: list[PlantedValue] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Value generators
+# ---------------------------------------------------------------------------
+
+def _digits(rng: random.Random, count: int) -> str:
+    return "".join(rng.choice(string.digits) for _ in range(count))
+
+
+def make_ssn(rng: random.Random) -> str:
+    return f"{rng.randint(100, 665)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+
+
+def make_ein(rng: random.Random) -> str:
+    return f"{rng.randint(10, 99)}-{_digits(rng, 7)}"
+
+
+def make_iban(rng: random.Random) -> str:
+    """A GB or DE IBAN with valid mod-97 check digits."""
+    country, bban = rng.choice([
+        ("GB", "".join(rng.choice(string.ascii_uppercase) for _ in range(4))
+         + _digits(rng, 14)),
+        ("DE", _digits(rng, 18)),
+    ])
+    numeric = "".join(
+        str(int(ch, 36)) for ch in bban + country + "00"
+    )
+    check = 98 - int(numeric) % 97
+    return f"{country}{check:02d}{bban}"
+
+
+def make_routing_number(rng: random.Random) -> str:
+    """A 9-digit ABA routing number with a valid checksum."""
+    digits = [rng.randint(0, 3)] + [rng.randint(0, 9) for _ in range(7)]
+    total = sum(w * d for w, d in zip([3, 7, 1, 3, 7, 1, 3, 7], digits))
+    digits.append(-total % 10)
+    return "".join(map(str, digits))
+
+
+def make_bank_account(rng: random.Random) -> str:
+    """6 to 12 digits, sometimes written in spaced pairs (``55 01 22``)."""
+    digits = _digits(rng, rng.randint(6, 12))
+    if rng.random() < 0.25:
+        return " ".join(digits[i : i + 2] for i in range(0, len(digits) - 1, 2))
+    return digits
+
+
+def make_credit_card(rng: random.Random) -> str:
+    """A 16-digit Visa-style number with a valid Luhn check digit."""
+    digits = [4] + [rng.randint(0, 9) for _ in range(14)]
+    total = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    digits.append((10 - total % 10) % 10)
+    number = "".join(map(str, digits))
+    return " ".join(number[i : i + 4] for i in range(0, 16, 4))
+
+
+def make_card_expiry(rng: random.Random) -> str:
+    return f"{rng.randint(1, 12):02d}/{rng.randint(25, 32)}"
+
+
+def make_cvv(rng: random.Random) -> str:
+    return _digits(rng, rng.choice([3, 3, 4]))
+
+
+def make_drivers_license(rng: random.Random) -> str:
+    """A state licence number: letter and 7 digits, or dashed groups."""
+    letter = rng.choice(string.ascii_uppercase)
+    return rng.choice([
+        f"{letter}{_digits(rng, 7)}",
+        f"{letter}{_digits(rng, 3)}-{_digits(rng, 3)}",
+        f"{letter}{_digits(rng, 3)}-{_digits(rng, 3)}-{_digits(rng, 2)}-"
+        f"{_digits(rng, 3)}-{_digits(rng, 1)}",
+    ])
+
+
+def make_passport(rng: random.Random) -> str:
+    """A US passport number: 9 digits, or a letter and 8 digits."""
+    if rng.random() < 0.5:
+        return _digits(rng, 9)
+    return rng.choice(string.ascii_uppercase) + _digits(rng, 8)
+
+
+# Medicare Beneficiary Identifier letters (no S, L, O, I, B or Z).
+_MBI_LETTERS = "ACDEFGHJKMNPQRTUVWXY"
+
+
+def make_health_insurance_id(rng: random.Random) -> str:
+    """A Medicare MBI, dashed (``1EG4-TE5-MK73``) or not."""
+    alnum = _MBI_LETTERS + string.digits
+    mbi = (
+        rng.choice("123456789")
+        + rng.choice(_MBI_LETTERS)
+        + rng.choice(alnum)
+        + _digits(rng, 1)
+        + rng.choice(_MBI_LETTERS)
+        + rng.choice(alnum)
+        + _digits(rng, 1)
+        + rng.choice(_MBI_LETTERS)
+        + rng.choice(_MBI_LETTERS)
+        + _digits(rng, 2)
+    )
+    if rng.random() < 0.5:
+        return f"{mbi[:4]}-{mbi[4:7]}-{mbi[7:]}"
+    return mbi
+
+
+GENERATORS = {
+    "ssn": make_ssn,
+    "ein": make_ein,
+    "iban": make_iban,
+    "routing_number": make_routing_number,
+    "bank_account": make_bank_account,
+    "credit_card": make_credit_card,
+    "card_expiry": make_card_expiry,
+    "cvv": make_cvv,
+    "drivers_license": make_drivers_license,
+    "passport": make_passport,
+    "health_insurance_id": make_health_insurance_id,
+}
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def make_document(
+    rng: random.Random,
+    filler_sentences: int = 40,
+    pii_sentences: int = 6,
+    labels: list[str] | None = None,
+) -> SyntheticDocument:
+    """One document: filler paragraphs with *pii_sentences* planted values."""
+    labels = labels or list(GENERATORS)
+    sentences: list[tuple[str, str | None, str | None]] = [
+        (rng.choice(FILLER), None, None) for _ in range(filler_sentences)
+    ]
+    for _ in range(pii_sentences):
+        label = rng.choice(labels)
+        value = GENERATORS[label](rng)
+        template = rng.choice(TEMPLATES[label])
+        sentences.insert(
+            rng.randint(0, len(sentences)), (template, label, value)
+        )
+
+    parts: list[str] = []
+    planted: list[PlantedValue] = []
+    length = 0
+    for index, (template, label, value) in enumerate(sentences):
+        if index and index % 5 == 0:
+            parts.append("\n\n")
+            length += 2
+        elif index:
+            parts.append(" ")
+            length += 1
+        if label is None:
+            sentence = template
+        else:
+            before = template.split("{value}")[0]
+            planted.append(PlantedValue(
+                label, length + len(before), length + len(before) + len(value)
+            ))
+            sentence = template.format(value=value)
+        parts.append(sentence)
+        length += len(sentence)
+
+    return SyntheticDocument("".join(parts), planted)
+
+
+def make_corpus(
+    documents: int = 40,
+    seed: int = 0,
+    filler_sentences: int = 40,
+    pii_sentences: int = 6,
+    labels: list[str] | None = None,
+) -> list[SyntheticDocument]:
+    """A reproducible corpus of *documents* synthetic documents."""
+    rng = random.Random(seed)
+    return [
+        make_document(rng, filler_sentences, pii_sentences, labels)
+        for _ in range(documents)
+    ]
+
+
+def recall_by_label(
+    corpus: list[SyntheticDocument],
+    detections: list[list[tuple[int, int]]],
+) -> dict[str, float]:
+    """Fraction of planted values, per label, overlapped by a detection.
+
+    *detections* holds each document's detected ``(start, end)`` spans.
+    Any overlapping detection counts, whatever its label: the value is
+    redacted either way.
+    """
+    found: dict[str, int] = {}
+    total: dict[str, int] = {}
+    for document, spans in zip(corpus, detections):
+        for value in document.planted:
+            total[value.label] = total.get(value.label, 0) + 1
+            if any(start < value.end and value.start < end for start, end in spans):
+                found[value.label] = found.get(value.label, 0) + 1
+    return {
+        label: found.get(label, 0) / count for label, count in sorted(total.items())
+    }
@@ -1,8 +1,9 @@
 """
 Document converters for data center due diligence processing.
 
-All conversion is handled by Docling (fully offline) and PII redaction
-is handled by GLiNER (fully offline).  No API calls are made during
+All conversion is handled by Docling (fully offline), with lightweight
+native converters for CSV, HTML and DOCX when a folder needs no layout
+analysis, and a streaming converter for Excel workbooks.  PII redaction is handled by GLiNER (fully offline).  No API calls are made during
 the conversion or redaction pipeline.
 
 The ``scanner`` module provides folder scanning and automatic file type
@@ -12,10 +13,40 @@ The ``pipeline`` module ties everything together: it scans a folder,
 converts all supported files via Docling, redacts PII via GLiNER,
 writes the results to a ``_converted/`` staging subfolder, and produces
 a JSON manifest for downstream agents.
+
+The ``document_store`` module regenerates markdown and other exports from
+the structured documents the pipeline can save next to the markdown.
+
+In progressive mode the pipeline writes instant text-layer drafts of PDFs
+(``draft_converter``) and the ``refine`` module replaces them with Docling
+conversions in the background.
+
+The ``image_prep`` module orients and downscales photos and image scans
+before OCR, and spots images without text and near-duplicate photos.
+
+The ``detection_cache`` module remembers what GLiNER found in each chunk
+of text, so boilerplate repeated across pages and files is read once.
+
+The ``resources`` module splits one CPU core budget between the thread
+pools of every model the pipeline runs.
+
+The ``manifest`` module holds the formats shared by everything that writes
+to ``_converted/``: the markdown header, manifest records and atomic JSON
+writes.
+
+The ``workspace`` module locates each opportunity folder's work folder,
+which keeps unredacted intermediates out of the agent-facing
+``_converted/``.
 """
 
 from converters.base import BaseConverter, ExtractionResult, ConfidenceLevel
+from converters.detection_cache import DetectionCache
 from converters.docling_converter import DoclingConverter
+from converters.document_store import load_document, regenerate
+from converters.draft_converter import TextLayerDraftConverter
+from converters.image_prep import PreparedImage, find_duplicates, prepare_image
+from converters.native_converter import CsvConverter, DocxConverter, HtmlConverter
+from converters.spreadsheet_converter import SpreadsheetConverter
 from converters.generate_pdf import (
     PDFResult,
     generate_pdf,
@@ -23,6 +54,7 @@ from converters.generate_pdf import (
     generate_client_pdf,
     generate_all_pdfs,
 )
+from converters.profiles import ConversionProfile, get_profile
 from converters.pipeline import (
     ConvertedFile,
     PipelineResult,
@@ -32,6 +64,7 @@ from converters.pipeline import (
     MANIFEST_FILENAME,
 )
 from converters.redactor import (
+    IndexedEntity,
     RedactedEntity,
     RedactionReport,
     RedactionResult,
@@ -39,25 +72,37 @@ from converters.redactor import (
     redact_file,
     redact_converted_folder,
 )
+from converters.resources import ThreadSettings
 from converters.scanner import FileEntry, FileType, ScanResult, scan_folder
 
 __all__ = [
     "BaseConverter",
     "ConfidenceLevel",
+    "ConversionProfile",
     "ConvertedFile",
     "CONVERTED_DIR_NAME",
     "convert_folder",
+    "CsvConverter",
+    "DetectionCache",
     "DoclingConverter",
+    "DocxConverter",
     "ExtractionResult",
     "FileEntry",
     "FileType",
+    "find_duplicates",
     "generate_all_pdfs",
     "generate_client_pdf",
     "generate_executive_pdf",
     "generate_pdf",
+    "get_profile",
+    "HtmlConverter",
+    "IndexedEntity",
+    "load_document",
     "MANIFEST_FILENAME",
     "PDFResult",
     "PipelineResult",
+    "prepare_image",
+    "PreparedImage",
     "print_status_report",
     "RedactedEntity",
     "RedactionReport",
@@ -65,6 +110,10 @@ __all__ = [
     "redact_converted_folder",
     "redact_file",
     "redact_text",
+    "regenerate",
     "ScanResult",
     "scan_folder",
+    "SpreadsheetConverter",
+    "TextLayerDraftConverter",
+    "ThreadSettings",
 ]
@@ -11,6 +11,7 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 
 class ConfidenceLevel(enum.Enum):
@@ -39,6 +40,9 @@ class ExtractionResult:
         is_scanned: True if the document appears to be scanned/image-based.
         metadata: Arbitrary extra info specific to the file type.
         error: Error message if success is False.
+        document: The converter's structured document (a Docling
+            ``DoclingDocument``) when it produces one, else None.  Kept out
+            of ``repr`` and comparisons.
     """
 
     source_path: Path
@@ -51,6 +55,7 @@ class ExtractionResult:
     is_scanned: bool = False
     metadata: dict = field(default_factory=dict)
     error: str | None = None
+    document: Any = field(default=None, repr=False, compare=False)
 
     @property
     def is_reliable(self) -> bool:
@@ -0,0 +1,177 @@
+"""
+On-demand conversion of PDF pages deferred by lazy mode.
+
+When the pipeline runs with ``lazy=True`` (see :mod:`converters.lazy`),
+oversized PDFs only convert their key pages and the manifest lists the rest
+under ``deferred_pages``.  Agents convert the pages they need with::
+
+    .venv/bin/python3 -m converters.deferred <opportunity_folder> <file> <pages>
+
+for example ``... "Environmental/Phase I ESA.pdf" 212-230,415``.  ``<file>``
+is the manifest's ``relative_path`` or ``converted_filename``.  The pages are
+converted with the file's original profile, run through PII redaction, and
+written to ``_converted/<name>.pages-<ranges>.md``, whose path is printed.
+If the folder has an ``entity-index.json``, the pages' preserved entities
+are added to it.  Repeating a request returns the existing file, and pages
+already converted are reused from the page cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from converters.docling_converter import DoclingConverter
+from converters.lazy import format_page_ranges, page_ranges, parse_page_ranges
+from converters.manifest import build_markdown, update_json
+from converters.page_cache import CACHE_DIR_NAME, PageCache
+from converters.pipeline import CONVERTED_DIR_NAME, MANIFEST_FILENAME
+from converters.redactor import (
+    ENTITY_INDEX_FILENAME,
+    redact_file,
+    update_entity_index,
+)
+from converters.scanner import FileEntry, FileType
+from converters.workspace import work_dir
+
+logger = logging.getLogger(__name__)
+
+
+def _find_entry(manifest: dict[str, Any], file: str) -> dict[str, Any]:
+    for entry in manifest.get("files", []):
+        if file in (entry.get("relative_path"), entry.get("converted_filename")):
+            return entry
+    raise ValueError(f"No file {file!r} in the manifest")
+
+
+def convert_deferred(
+    folder_path: str | Path,
+    file: str,
+    pages: str | Iterable[int],
+    index_entities: bool | None = None,
+) -> Path:
+    """Convert deferred pages of a lazily converted PDF.
+
+    Parameters
+    ----------
+    folder_path:
+        The opportunity folder the pipeline ran on.
+    file:
+        The file's ``relative_path`` or ``converted_filename`` from the
+        manifest.
+    pages:
+        Page numbers, or a range specification such as ``"21-40,55"``.
+    index_entities:
+        Add the pages' preserved entities to ``entity-index.json`` (see
+        :func:`converters.redactor.update_entity_index`).  None indexes
+        them when the folder already has an entity index.
+
+    Returns
+    -------
+    Path
+        The redacted markdown file holding the requested pages.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the folder has no pipeline manifest.
+    ValueError
+        If *file* is not in the manifest or *pages* is invalid.
+    RuntimeError
+        If Docling fails to convert the pages.
+    """
+    converted_dir = Path(folder_path).resolve() / CONVERTED_DIR_NAME
+    manifest_path = converted_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No manifest found: {manifest_path}")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    entry = _find_entry(manifest, file)
+    if not entry.get("success") or entry.get("file_type") != FileType.PDF.value:
+        raise ValueError(f"{file!r} is not a converted PDF")
+
+    requested = parse_page_ranges(pages) if isinstance(pages, str) else set(pages)
+    ranges = page_ranges(requested)
+    label = format_page_ranges(ranges).replace(",", "_")
+    stem = Path(entry["converted_filename"]).stem
+    output_path = converted_dir / f"{stem}.pages-{label}.md"
+    if output_path.exists():
+        return output_path
+
+    page_cache = PageCache(work_dir(converted_dir.parent) / CACHE_DIR_NAME / "pages")
+    converter = DoclingConverter(profile=entry.get("profile"), page_cache=page_cache)
+    extraction = converter.convert_pages(Path(entry["original_path"]), requested)
+    if not extraction.success:
+        raise RuntimeError(
+            f"Could not convert pages {format_page_ranges(ranges)} of "
+            f"{entry['relative_path']}: {extraction.error}"
+        )
+
+    source = FileEntry(
+        path=Path(entry["original_path"]),
+        relative_path=Path(entry["relative_path"]),
+        file_type=FileType.PDF,
+        converter=entry["converter"],
+        size_bytes=entry["size_bytes"],
+    )
+    if index_entities is None:
+        index_entities = (converted_dir / ENTITY_INDEX_FILENAME).exists()
+    # Redact before the file appears under its final name, so agents never
+    # read the pages unredacted.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.write_text(build_markdown(source, extraction), encoding="utf-8")
+    redaction = redact_file(tmp_path, index=index_entities)
+    os.replace(tmp_path, output_path)
+    update_entity_index(converted_dir, {output_path.name: redaction.indexed})
+
+    # Re-read the manifest under its lock: the conversion may have taken a
+    # while, and refinement or another page request may have changed it.
+    with update_json(manifest_path) as manifest:
+        entry = _find_entry(manifest, file)
+        remaining = {
+            n
+            for first, last in entry.get("deferred_pages") or []
+            for n in range(first, last + 1)
+        } - requested
+        entry["deferred_pages"] = [list(r) for r in page_ranges(remaining)] or None
+        entry.setdefault("on_demand", []).append(
+            {
+                "pages": [list(r) for r in ranges],
+                "converted_path": str(output_path),
+                "converted_filename": output_path.name,
+            }
+        )
+
+    logger.info("Converted pages %s of %s", label, entry["relative_path"])
+    return output_path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert deferred pages of a lazily converted PDF."
+    )
+    parser.add_argument("folder", type=Path, help="Opportunity folder")
+    parser.add_argument(
+        "file", help="relative_path or converted_filename from the manifest"
+    )
+    parser.add_argument("pages", help='Pages to convert, e.g. "21-40,55"')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    try:
+        path = convert_deferred(args.folder, args.file, args.pages)
+    except (FileNotFoundError, ValueError, RuntimeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Cache of GLiNER detections per chunk of text.
+
+Broker PDFs repeat the same headers, footers and confidentiality notices on
+every page, and the same boilerplate turns up in many files of a data room.
+Running the model over each copy is wasted work, so the entities found in a
+chunk are cached under a hash of the chunk's text and of everything else
+that decides the model's output (see ``redactor._cache_model_key``).
+
+Chunk text is normalized before hashing by collapsing runs of whitespace to
+one space.  GLiNER splits text into words and never sees whitespace, so the
+collapsed text gives the same detections, and copies that differ only in
+line wrapping or table padding share one entry.  The model reads the
+normalized text; :func:`normalize` also returns a map of where its
+characters came from, so entity offsets can be mapped back to the chunk.
+
+Entries hold only offsets (relative to the normalized chunk), labels and
+scores -- never the matched text -- and live in a bounded in-memory LRU,
+with an optional on-disk layer shared across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Chunks kept in memory.  An entry is a short list of small dicts, so the
+# default bounds memory to a few megabytes.
+_MAX_ENTRIES: int = 10_000
+
+_WHITESPACE = re.compile(r"\s+")
+# Runs that collapse to fewer characters; lone newlines and tabs do not.
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+class PositionMap:
+    """Maps indices in normalized text back to the text it came from.
+
+    Holds one entry per collapsed whitespace run rather than one per
+    character.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = [0]  # normalized index where a shift begins
+        self._shifts: list[int] = [0]  # characters removed before it
+
+    def _add(self, start: int, shift: int) -> None:
+        self._starts.append(start)
+        self._shifts.append(shift)
+
+    def __getitem__(self, index: int) -> int:
+        return index + self._shifts[bisect_right(self._starts, index) - 1]
+
+
+def normalize(text: str) -> tuple[str, PositionMap]:
+    """Collapse whitespace runs in *text* to single spaces.
+
+    Returns the normalized text and a :class:`PositionMap` from its indices
+    to indices in *text*.
+    """
+    positions = PositionMap()
+    removed = 0
+    for match in _WHITESPACE_RUN.finditer(text):
+        removed += match.end() - match.start() - 1
+        positions._add(match.end() - removed, removed)
+    return _WHITESPACE.sub(" ", text), positions
+
+
+class DetectionCache:
+    """Entities found in normalized chunks, by chunk and model.
+
+    Parameters
+    ----------
+    root:
+        Folder for the on-disk layer (created on first write), or None to
+        cache in memory only.
+    max_entries:
+        Entries kept in memory; the least recently used are dropped first.
+    """
+
+    def __init__(self, root: Path | None = None, max_entries: int = _MAX_ENTRIES) -> None:
+        self.root = Path(root) if root is not None else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def key(normalized_text: str, model_key: str) -> str:
+        """Cache key for a normalized chunk read by the model *model_key*."""
+        digest = hashlib.sha256(model_key.encode())
+        digest.update(b"\0")
+        digest.update(normalized_text.encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Return the cached entities for *key*, or None on a miss."""
+        entities = self._entries.get(key)
+        if entities is None and self.root is not None:
+            entities = self._read(key)
+            if entities is not None:
+                self._remember(key, entities)
+        if entities is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entities
+
+    def put(self, key: str, entities: list[dict[str, Any]]) -> None:
+        """Store the entities found in a chunk (offsets, labels, scores)."""
+        entities = [
+            {
+                "start": ent["start"],
+                "end": ent["end"],
+                "label": ent["label"],
+                "score": ent["score"],
+            }
+            for ent in entities
+        ]
+        self._remember(key, entities)
+        if self.root is not None:
+            self._write(key, entities)
+
+    def _remember(self, key: str, entities: list[dict[str, Any]]) -> None:
+        self._entries[key] = entities
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> list[dict[str, Any]] | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable detection cache entry %s: %s", path, exc)
+            return None
+
+    def _write(self, key: str, entities: list[dict[str, Any]]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(json.dumps(entities), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.warning("Cannot write detection cache entry %s: %s", path, exc)
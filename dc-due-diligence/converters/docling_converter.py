@@ -7,25 +7,51 @@ converter that handles all supported formats entirely offline -- no API calls,
 no cloud services.
 
 OCR for scanned PDFs and images runs locally via Apple Vision (macOS) or
-RapidOCR (cross-platform).  Table extraction uses Docling's TableFormer model.
+RapidOCR (cross-platform).  Born-digital PDF pages skip OCR entirely: each
+page's embedded text layer is checked first (see ``converters.text_layer``)
+and only image-only or garbled pages are routed through the OCR engine.
+Table extraction uses Docling's TableFormer model.  How much effort goes into
+tables and OCR is controlled by a named profile (see ``converters.profiles``).
+OCR is adaptive: pages are recognized once at a low render scale, and only
+pages whose per-page OCR confidence is low are recognized again at a higher
+scale with the engine's accurate model.  Per-page OCR confidence is reported
+in ``metadata["ocr_confidence"]`` and lowers the document's confidence.
+
+``DoclingConverter.convert_many`` feeds whole folders through Docling's
+batch API so documents share model calls instead of converting one at a
+time.  With a page cache (see ``converters.page_cache``), revised PDFs only
+convert the pages that changed; in lazy mode (see ``converters.lazy``),
+oversized PDFs only convert their key pages up front and the rest on demand.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import platform
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from docling.datamodel.accelerator_options import AcceleratorOptions
 from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     TableFormerMode,
     TableStructureOptions,
 )
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling_core.types.doc import DoclingDocument, Size
 
 from converters.base import BaseConverter, ConfidenceLevel, ExtractionResult
+from converters.lazy import LazyPolicy, page_ranges, select_eager_pages
+from converters.page_cache import PageCache, page_fingerprints
+from converters.profiles import ConversionProfile, get_profile
+from converters.resources import thread_settings
+from converters.text_layer import TextLayerReport, analyze_pdf_text_layer
 
 logger = logging.getLogger(__name__)
 
@@ -52,19 +78,48 @@ _EXTENSION_TO_FORMAT: dict[str, InputFormat] = {
 }
 
 
-def _build_pdf_pipeline_options() -> PdfPipelineOptions:
-    """Build PDF pipeline options with local-only OCR and table extraction."""
+# PDFs whose OCR/no-OCR pages alternate more often than this are converted in
+# one OCR pass instead of page-range segments -- past this point the per-call
+# overhead outweighs the OCR time saved.
+_MAX_OCR_SEGMENTS: int = 8
+
+# Mean OCR recognition confidence (0-1) below which a page is poorly read,
+# and below which a document's OCR is only fair (Docling's quality grades).
+_POOR_OCR_SCORE: float = 0.5
+_FAIR_OCR_SCORE: float = 0.8
+
+# Defaults for ``convert_many``: documents converted concurrently per batch,
+# and pages per batch sent through the layout, table and OCR models.
+_DEFAULT_DOC_BATCH_SIZE: int = 4
+_DEFAULT_PAGE_BATCH_SIZE: int = 8
+
+
+def _build_pdf_pipeline_options(
+    profile: ConversionProfile,
+    do_ocr: bool = True,
+    retry: bool = False,
+) -> PdfPipelineOptions:
+    """Build PDF pipeline options with local-only OCR and table extraction.
+
+    *retry* selects the profile's second OCR pass: a higher render scale
+    and the engine's accurate model.  The first pass uses the engine's
+    fast model only where the profile asks for it (``ocr_fast_first_pass``).
+    """
     opts = PdfPipelineOptions()
-    opts.do_ocr = True
+    opts.do_ocr = do_ocr
     opts.do_table_structure = True
     opts.enable_remote_services = False
 
-    # Table extraction: accurate mode for financial/spec documents.
+    # Table extraction: accurate mode for financial/spec documents unless
+    # the profile trades fidelity for speed.
     opts.table_structure_options = TableStructureOptions(
-        do_cell_matching=True,
-        mode=TableFormerMode.ACCURATE,
+        do_cell_matching=profile.do_cell_matching,
+        mode=TableFormerMode(profile.table_mode),
     )
 
+    if not do_ocr:
+        return opts
+
     # OCR: prefer macOS Vision on Apple Silicon, fall back to RapidOCR.
     if platform.system() == "Darwin":
         try:
@@ -72,28 +127,48 @@ def _build_pdf_pipeline_options() -> PdfPipelineOptions:
 
             opts.ocr_options = OcrMacOptions(
                 lang=["en-US"],
-                recognition="accurate",
+                recognition=(
+                    "fast" if profile.ocr_fast_first_pass and not retry else "accurate"
+                ),
             )
             logger.info("OCR engine: OcrMac (macOS Vision framework)")
         except ImportError:
-            _set_rapidocr(opts)
+            _set_rapidocr(opts, accurate=retry)
     else:
-        _set_rapidocr(opts)
+        _set_rapidocr(opts, accurate=retry)
+
+    # Render scale for OCR'd pages, where the Docling version supports it.
+    scale = profile.ocr_retry_scale if retry else profile.ocr_scale
+    if scale is not None and "scale" in type(opts.ocr_options).model_fields:
+        opts.ocr_options.scale = scale
 
     return opts
 
 
-def _set_rapidocr(opts: PdfPipelineOptions) -> None:
-    """Configure RapidOCR as the OCR engine."""
+def _set_rapidocr(opts: PdfPipelineOptions, accurate: bool = False) -> None:
+    """Configure RapidOCR as the OCR engine (its larger model if *accurate*)."""
     from docling.datamodel.pipeline_options import RapidOcrOptions
 
     opts.ocr_options = RapidOcrOptions(lang=["english"])
+    if accurate and "model_size" in RapidOcrOptions.model_fields:
+        opts.ocr_options.model_size = "medium"
     logger.info("OCR engine: RapidOCR")
 
 
-def _build_converter() -> DocumentConverter:
-    """Create a DocumentConverter configured for offline-only operation."""
-    pdf_options = _build_pdf_pipeline_options()
+def _build_converter(
+    profile: ConversionProfile,
+    do_ocr: bool = True,
+    retry: bool = False,
+) -> DocumentConverter:
+    """Create a DocumentConverter configured for offline-only operation.
+
+    The layout, table and OCR models get the thread count from the
+    process's core budget (see ``converters.resources``).
+    """
+    pdf_options = _build_pdf_pipeline_options(profile, do_ocr=do_ocr, retry=retry)
+    pdf_options.accelerator_options = AcceleratorOptions(
+        num_threads=thread_settings().intra_op_threads
+    )
 
     return DocumentConverter(
         allowed_formats=[
@@ -111,18 +186,222 @@ def _build_converter() -> DocumentConverter:
     )
 
 
-# Module-level singleton -- reused across calls to avoid re-loading models.
-_converter: DocumentConverter | None = None
+# Module-level converters, keyed by profile, whether OCR is enabled,
+# whether it is the OCR retry pass and the thread count -- reused across
+# calls to avoid re-loading models.
+_converters: dict[tuple[str, bool, bool, int], DocumentConverter] = {}
+
 
+def _get_converter(
+    profile: ConversionProfile | None = None,
+    do_ocr: bool = True,
+    retry: bool = False,
+) -> DocumentConverter:
+    """Return (and lazily create) the module-level DocumentConverter.
 
-def _get_converter() -> DocumentConverter:
-    """Return (and lazily create) the module-level DocumentConverter."""
-    global _converter
-    if _converter is None:
-        logger.info("Initializing Docling converter (first call, loading models)...")
-        _converter = _build_converter()
+    *retry* selects the converter for the profile's second OCR pass.
+    """
+    profile = get_profile(profile)
+    key = (profile.cache_key, do_ocr, retry, thread_settings().intra_op_threads)
+    if key not in _converters:
+        logger.info(
+            "Initializing Docling converter (profile %s, OCR %s, loading models)...",
+            profile.name,
+            "retry" if retry else "on" if do_ocr else "off",
+        )
+        _converters[key] = _build_converter(profile, do_ocr=do_ocr, retry=retry)
         logger.info("Docling converter ready.")
-    return _converter
+    return _converters[key]
+
+
+@contextmanager
+def _batch_settings(doc_batch_size: int, page_batch_size: int) -> Iterator[None]:
+    """Temporarily set Docling's global document and page batch sizes."""
+    perf = settings.perf
+    saved = (
+        perf.doc_batch_size,
+        perf.doc_batch_concurrency,
+        perf.page_batch_size,
+    )
+    perf.doc_batch_size = doc_batch_size
+    perf.doc_batch_concurrency = doc_batch_size
+    perf.page_batch_size = page_batch_size
+    try:
+        yield
+    finally:
+        (
+            perf.doc_batch_size,
+            perf.doc_batch_concurrency,
+            perf.page_batch_size,
+        ) = saved
+
+
+def _ocr_scores(result: Any) -> dict[int, float]:
+    """Per-page mean OCR recognition confidence from a conversion result.
+
+    Docling records a score for every page it OCR'd and found text on;
+    results without scores (cached pages, fakes) yield an empty dict.
+    """
+    scores = getattr(result, "ocr_scores", None)
+    if scores is not None:
+        return dict(scores)
+    confidence = getattr(result, "confidence", None)
+    if confidence is None:
+        return {}
+    return {
+        page_no: float(page.ocr_score)
+        for page_no, page in confidence.pages.items()
+        if not math.isnan(page.ocr_score)
+    }
+
+
+def _place_pages(parts: list[tuple[DoclingDocument, int]]) -> DoclingDocument:
+    """Join documents ``(document, first_page)``, keeping real page numbers.
+
+    Each document is renumbered so its lowest page becomes *first_page*;
+    the parts must be in page order and must not overlap, but may leave
+    gaps (lazy selections and cached pages rarely form one run).
+    Concatenation alone would renumber from 1 and close the gaps, so the
+    gaps are filled with blank pages that are dropped again afterwards.
+    """
+    documents: list[DoclingDocument] = []
+    placed_pages: set[int] = set()
+    next_page = 1
+    for document, first_page in parts:
+        if not document.pages:
+            documents.append(document)
+            continue
+        if first_page > next_page:
+            padding = DoclingDocument(name=document.name)
+            for page_no in range(next_page, first_page):
+                padding.add_page(page_no=page_no, size=Size(width=1, height=1))
+            documents.append(padding)
+        offset = first_page - min(document.pages)
+        placed_pages.update(n + offset for n in document.pages)
+        next_page = max(document.pages) + offset + 1
+        documents.append(document)
+    joined = DoclingDocument.concatenate(documents)
+    if len(placed_pages) < len(joined.pages):
+        joined = joined.filter(page_nrs=placed_pages)
+    return joined
+
+
+def _splice_pages(runs: list[tuple[DoclingDocument, int, int]]) -> DoclingDocument:
+    """Join inclusive page runs ``(document, first, last)`` into one document.
+
+    The result keeps the runs' page numbers.
+    """
+    return _place_pages([
+        (document.filter(page_nrs=set(range(first, last + 1))), first)
+        for document, first, last in runs
+    ])
+
+
+def _with_ocr_confidence(
+    confidence: ConfidenceLevel,
+    reason: str,
+    ocr_scores: dict[int, float],
+) -> tuple[ConfidenceLevel, str]:
+    """Lower *confidence* when OCR'd pages were recognized poorly.
+
+    A mean score below ``_POOR_OCR_SCORE`` makes the document LOW; any
+    poorly read page, or a mean below ``_FAIR_OCR_SCORE``, caps it at
+    MEDIUM.
+    """
+    mean = sum(ocr_scores.values()) / len(ocr_scores)
+    poor = [n for n, score in ocr_scores.items() if score < _POOR_OCR_SCORE]
+    if mean < _POOR_OCR_SCORE:
+        level = ConfidenceLevel.LOW
+        note = f"poor OCR confidence (mean {mean:.2f} over {len(ocr_scores)} pages)"
+    elif poor or mean < _FAIR_OCR_SCORE:
+        level = ConfidenceLevel.MEDIUM
+        note = (
+            f"OCR confidence mean {mean:.2f}, "
+            f"{len(poor)} of {len(ocr_scores)} pages below {_POOR_OCR_SCORE:g}"
+        )
+    else:
+        return confidence, reason
+
+    rank = {ConfidenceLevel.LOW: 0, ConfidenceLevel.MEDIUM: 1, ConfidenceLevel.HIGH: 2}
+    if rank[level] >= rank[confidence]:
+        return confidence, reason
+    return level, f"{reason}; {note}"
+
+
+class _SegmentedConversion:
+    """Docling results for page-range segments stitched into one document.
+
+    Exposes the same ``status``, ``errors`` and ``document`` attributes as
+    a Docling ``ConversionResult`` so it can be mapped the same way.
+    ``first_pages`` gives the PDF page number each result starts at; the
+    document keeps those numbers, even where the segments leave gaps.
+    """
+
+    def __init__(self, results: list[Any], first_pages: list[int]) -> None:
+        statuses = [r.status for r in results]
+        if all(s == ConversionStatus.SUCCESS for s in statuses):
+            self.status = ConversionStatus.SUCCESS
+        elif all(s == ConversionStatus.FAILURE for s in statuses):
+            self.status = ConversionStatus.FAILURE
+        else:
+            self.status = ConversionStatus.PARTIAL_SUCCESS
+
+        self.errors = [e for r in results for e in (r.errors or [])]
+        self.ocr_scores: dict[int, float] = {}
+        self.ocr_retried: list[int] = []
+        for r in results:
+            self.ocr_scores.update(_ocr_scores(r))
+            self.ocr_retried.extend(getattr(r, "ocr_retried", []))
+
+        parts = [
+            (r.document, first_page)
+            for r, first_page in zip(results, first_pages)
+            if r.status != ConversionStatus.FAILURE
+        ]
+        self.document = _place_pages(parts) if parts else None
+
+
+class _OcrRetried:
+    """A conversion whose weakly OCR'd pages were replaced by a retry pass.
+
+    Shaped like a ConversionResult, plus the merged per-page OCR scores and
+    the pages that were replaced.
+    """
+
+    def __init__(
+        self,
+        result: Any,
+        document: DoclingDocument,
+        ocr_scores: dict[int, float],
+        retried: list[int],
+    ) -> None:
+        self.status = result.status
+        self.errors = result.errors
+        self.document = document
+        self.ocr_scores = ocr_scores
+        self.ocr_retried = retried
+
+
+class _CachedPage:
+    """A page loaded from the page cache, shaped like a ConversionResult."""
+
+    def __init__(self, document: DoclingDocument) -> None:
+        self.status = ConversionStatus.SUCCESS
+        self.errors: list = []
+        self.document = document
+
+
+@dataclass
+class _PageCacheLookup:
+    """Page cache keys for one PDF and the pages already cached.
+
+    Attributes:
+        keys: Cache key of every page, in page order.
+        cached: Cached one-page documents keyed by 1-based page number.
+    """
+
+    keys: list[str]
+    cached: dict[int, DoclingDocument] = field(default_factory=dict)
 
 
 class DoclingConverter(BaseConverter):
@@ -130,15 +409,239 @@ class DoclingConverter(BaseConverter):
 
     All processing happens locally -- no API calls, no cloud services.
     Scanned PDFs and images are OCR'd using local engines (Apple Vision
-    on macOS, RapidOCR elsewhere).
+    on macOS, RapidOCR elsewhere); PDF pages with a usable embedded text
+    layer skip OCR.
+
+    Parameters
+    ----------
+    profile:
+        Default conversion profile (see :mod:`converters.profiles`).
+    page_cache:
+        Optional :class:`~converters.page_cache.PageCache`.  PDF pages whose
+        content is unchanged since an earlier conversion are loaded from it
+        instead of being converted again.
+    lazy:
+        Optional :class:`~converters.lazy.LazyPolicy`.  Large PDFs then
+        only convert their leading and keyword-matching pages; the rest
+        are reported as deferred and can be converted later with
+        :meth:`convert_pages`.
     """
 
     supported_extensions: list[str] = list(_EXTENSION_TO_FORMAT.keys())
 
-    def convert(self, path: Path) -> ExtractionResult:
-        """Convert a document to markdown text via Docling."""
+    def __init__(
+        self,
+        profile: str | ConversionProfile | None = None,
+        page_cache: PageCache | None = None,
+        lazy: LazyPolicy | None = None,
+    ) -> None:
+        self._profile = get_profile(profile)
+        self._page_cache = page_cache
+        self._lazy = lazy
+
+    @property
+    def profile(self) -> ConversionProfile:
+        """The default conversion profile for this converter."""
+        return self._profile
+
+    @property
+    def page_cache(self) -> PageCache | None:
+        """The page cache used for PDFs, if any."""
+        return self._page_cache
+
+    def convert(
+        self,
+        path: Path,
+        profile: str | ConversionProfile | None = None,
+    ) -> ExtractionResult:
+        """Convert a document to markdown text via Docling.
+
+        *profile* overrides the converter's default profile for this call
+        (see :mod:`converters.profiles`).
+        """
+        path = Path(path).resolve()
+        profile = get_profile(profile) if profile is not None else self._profile
+
+        failure = self._check_input(path)
+        if failure is not None:
+            return failure
+
+        text_layer = self._text_layer(path)
+        pages = self._lookup_pages(path, profile)
+        selected = self._lazy_selection(text_layer)
+        extraction = self._convert_one(path, text_layer, profile, pages, selected)
+        if selected is not None:
+            self._mark_deferred(extraction, text_layer.page_count, selected)
+        return extraction
+
+    def convert_pages(
+        self,
+        path: Path,
+        pages: Iterable[int],
+        profile: str | ConversionProfile | None = None,
+    ) -> ExtractionResult:
+        """Convert only the given 1-based *pages* of a PDF.
+
+        Used to convert pages deferred by lazy mode on demand (see
+        :mod:`converters.deferred`).  Pages past the end of the document
+        are ignored; cached pages are reused when there is a page cache.
+        """
         path = Path(path).resolve()
+        profile = get_profile(profile) if profile is not None else self._profile
+
+        failure = self._check_input(path)
+        if failure is not None:
+            return failure
+        if path.suffix.lower() != ".pdf":
+            return ExtractionResult(
+                source_path=path,
+                text="",
+                method="docling",
+                success=False,
+                confidence=ConfidenceLevel.LOW,
+                confidence_reason="unsupported file type",
+                error="Page selection is only supported for PDFs",
+            )
 
+        text_layer = analyze_pdf_text_layer(path)
+        lookup = self._lookup_pages(path, profile)
+        page_count = self._page_count(text_layer, lookup)
+        selected = {
+            n for n in pages
+            if n >= 1 and (page_count is None or n <= page_count)
+        }
+        if not selected:
+            return ExtractionResult(
+                source_path=path,
+                text="",
+                method="docling",
+                success=False,
+                confidence=ConfidenceLevel.LOW,
+                confidence_reason="no such pages",
+                error=f"No requested page exists in {path.name} "
+                f"({page_count} pages)",
+            )
+
+        extraction = self._convert_one(path, text_layer, profile, lookup, selected)
+        extraction.metadata["pages"] = [list(r) for r in page_ranges(selected)]
+        return extraction
+
+    def convert_many(
+        self,
+        paths: Iterable[Path],
+        profile: str | ConversionProfile | None = None,
+        doc_batch_size: int = _DEFAULT_DOC_BATCH_SIZE,
+        page_batch_size: int = _DEFAULT_PAGE_BATCH_SIZE,
+    ) -> Iterator[ExtractionResult]:
+        """Convert many documents through Docling's batch API.
+
+        Documents that need the same converter (same profile and OCR
+        setting) are handed to ``DocumentConverter.convert_all`` together,
+        so up to *doc_batch_size* documents are converted concurrently and
+        their pages go through the models *page_batch_size* at a time.
+        PDFs that need per-page OCR routing, have pages in the page cache,
+        or are converted lazily are converted one at a time.
+
+        Parameters
+        ----------
+        paths:
+            Documents to convert.
+        profile:
+            Overrides the converter's default profile for this call.
+        doc_batch_size:
+            Documents converted concurrently per batch.
+        page_batch_size:
+            Pages per model batch within a document.
+
+        Yields
+        ------
+        ExtractionResult
+            One result per path, in completion order (match them up by
+            ``source_path``).  Failures are yielded, never raised.
+        """
+        profile = get_profile(profile) if profile is not None else self._profile
+
+        groups: dict[
+            bool,
+            dict[Path, tuple[TextLayerReport | None, str, _PageCacheLookup | None]],
+        ] = {False: {}, True: {}}
+        singles: list[
+            tuple[
+                Path,
+                TextLayerReport | None,
+                _PageCacheLookup | None,
+                set[int] | None,
+            ]
+        ] = []
+
+        for path in paths:
+            path = Path(path).resolve()
+            failure = self._check_input(path)
+            if failure is not None:
+                yield failure
+                continue
+
+            text_layer = self._text_layer(path)
+            pages = self._lookup_pages(path, profile)
+            selected = self._lazy_selection(text_layer)
+            do_ocr, routing = self._plan_ocr(text_layer, profile)
+            if (
+                do_ocr is None
+                or selected is not None
+                or (pages is not None and pages.cached)
+            ):
+                singles.append((path, text_layer, pages, selected))
+            else:
+                groups[do_ocr][path] = (text_layer, routing, pages)
+
+        with _batch_settings(doc_batch_size, page_batch_size):
+            for do_ocr, pending in groups.items():
+                if not pending:
+                    continue
+                try:
+                    converter = _get_converter(profile, do_ocr=do_ocr)
+                    for result in converter.convert_all(
+                        list(pending), raises_on_error=False
+                    ):
+                        path = Path(result.input.file).resolve()
+                        text_layer, routing, pages = pending.pop(path)
+                        try:
+                            result = self._retry_weak_ocr(path, result, profile)
+                            extraction = self._finish(
+                                path,
+                                result,
+                                text_layer,
+                                routing,
+                                profile,
+                                self._cache_converted(result, pages),
+                            )
+                        except Exception as exc:
+                            # Only this document fails; the batch goes on.
+                            extraction = self._crashed(path, exc)
+                        yield extraction
+                except Exception as exc:
+                    # A crash aborts the rest of the batch; convert the
+                    # remaining documents individually so each one gets its
+                    # own result (and one bad file does not fail the rest).
+                    logger.error("Docling batch conversion crashed: %s", exc)
+                    for path in list(pending):
+                        pending.pop(path)
+                        yield self.convert(path, profile=profile)
+
+            for path, text_layer, pages, selected in singles:
+                extraction = self._convert_one(
+                    path, text_layer, profile, pages, selected
+                )
+                if selected is not None:
+                    self._mark_deferred(extraction, text_layer.page_count, selected)
+                yield extraction
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _check_input(self, path: Path) -> ExtractionResult | None:
+        """Return a failure result if *path* cannot be converted, else None."""
         if not path.exists():
             return ExtractionResult(
                 source_path=path,
@@ -161,34 +664,400 @@ class DoclingConverter(BaseConverter):
                 confidence_reason="unsupported file type",
                 error=f"Unsupported file type: {suffix}",
             )
+        return None
 
-        converter = _get_converter()
+    def _text_layer(self, path: Path) -> TextLayerReport | None:
+        if path.suffix.lower() == ".pdf":
+            # Lazy mode needs the page text for its keyword scan.
+            return analyze_pdf_text_layer(path, keep_text=self._lazy is not None)
+        return None
 
+    @staticmethod
+    def _crashed(path: Path, exc: Exception) -> ExtractionResult:
+        logger.error("Docling conversion crashed for %s: %s", path, exc)
+        return ExtractionResult(
+            source_path=path,
+            text="",
+            method="docling",
+            success=False,
+            confidence=ConfidenceLevel.LOW,
+            confidence_reason="converter crashed",
+            error=f"Docling conversion failed: {exc}",
+        )
+
+    def _convert_one(
+        self,
+        path: Path,
+        text_layer: TextLayerReport | None,
+        profile: ConversionProfile,
+        pages: _PageCacheLookup | None,
+        selected: set[int] | None = None,
+    ) -> ExtractionResult:
+        """Convert a single document, reusing cached PDF pages if any.
+
+        *selected* restricts a PDF conversion to those page numbers.
+        """
         try:
-            result = converter.convert(
-                source=path,
-                raises_on_error=False,
+            if selected is not None or (pages is not None and pages.cached):
+                result, routing, page_stats = self._run_pages(
+                    path, text_layer, profile, pages, selected
+                )
+            else:
+                result, routing = self._run(path, text_layer, profile)
+                page_stats = self._cache_converted(result, pages)
+            return self._finish(
+                path, result, text_layer, routing, profile, page_stats
             )
         except Exception as exc:
-            logger.error("Docling conversion crashed for %s: %s", path, exc)
-            return ExtractionResult(
-                source_path=path,
-                text="",
-                method="docling",
-                success=False,
-                confidence=ConfidenceLevel.LOW,
-                confidence_reason="converter crashed",
-                error=f"Docling conversion failed: {exc}",
+            return self._crashed(path, exc)
+
+    def _finish(
+        self,
+        path: Path,
+        result: Any,
+        text_layer: TextLayerReport | None,
+        ocr_routing: str,
+        profile: ConversionProfile,
+        page_stats: tuple[int, int] | None = None,
+    ) -> ExtractionResult:
+        """Map *result*, recording the profile and page cache usage.
+
+        *page_stats* is ``(pages reused, pages converted)`` when a page
+        cache was used.
+        """
+        extraction = self._to_extraction_result(
+            path, result, text_layer, ocr_routing
+        )
+        extraction.metadata["profile"] = profile.name
+        if page_stats is not None:
+            extraction.metadata["pages_reused"] = page_stats[0]
+            extraction.metadata["pages_converted"] = page_stats[1]
+        return extraction
+
+    # -- Lazy mode -------------------------------------------------------
+
+    def _lazy_selection(self, text_layer: TextLayerReport | None) -> set[int] | None:
+        """Pages to convert now in lazy mode, or None to convert everything."""
+        if self._lazy is None or text_layer is None or not text_layer.pages:
+            return None
+        return select_eager_pages(text_layer, self._lazy)
+
+    @staticmethod
+    def _mark_deferred(
+        extraction: ExtractionResult,
+        page_count: int,
+        selected: set[int],
+    ) -> None:
+        """Record the pages lazy mode left unconverted."""
+        if not extraction.success:
+            return
+        deferred = page_ranges(set(range(1, page_count + 1)) - selected)
+        extraction.page_count = page_count
+        extraction.metadata["converted_page_count"] = len(selected)
+        extraction.metadata["deferred_pages"] = [list(r) for r in deferred]
+
+    # -- Page cache ------------------------------------------------------
+
+    def _lookup_pages(
+        self,
+        path: Path,
+        profile: ConversionProfile,
+    ) -> _PageCacheLookup | None:
+        """Fingerprint a PDF's pages and load the ones already cached.
+
+        Returns None when there is no page cache, *path* is not a PDF, or
+        its pages cannot be fingerprinted.
+        """
+        if self._page_cache is None or path.suffix.lower() != ".pdf":
+            return None
+        fingerprints = page_fingerprints(path)
+        if fingerprints is None:
+            return None
+
+        lookup = _PageCacheLookup(
+            keys=[self._page_cache.key(fp, profile) for fp in fingerprints]
+        )
+        for page_no, key in enumerate(lookup.keys, start=1):
+            page = self._page_cache.get(key)
+            if page is not None:
+                lookup.cached[page_no] = page
+        return lookup
+
+    def _cache_converted(
+        self,
+        result: Any,
+        pages: _PageCacheLookup | None,
+    ) -> tuple[int, int] | None:
+        """Cache every page of a fully converted PDF; return its page stats."""
+        if pages is None:
+            return None
+        self._store_pages(result, pages.keys)
+        return 0, len(pages.keys)
+
+    def _store_pages(
+        self,
+        result: Any,
+        keys: list[str],
+        page_nos: Iterable[int] | None = None,
+    ) -> None:
+        """Split a successful result into one-page documents and cache them.
+
+        *page_nos* limits which pages are stored (default: every page in
+        the result).  Cache write failures are logged, never raised.
+        """
+        if (
+            self._page_cache is None
+            or result.status != ConversionStatus.SUCCESS
+            or result.document is None
+        ):
+            return
+        document = result.document
+        for page_no in (page_nos if page_nos is not None else list(document.pages)):
+            if page_no not in document.pages or not 1 <= page_no <= len(keys):
+                continue
+            try:
+                self._page_cache.put(
+                    keys[page_no - 1], document.filter(page_nrs={page_no})
+                )
+            except Exception as exc:
+                logger.warning("Could not cache page %d: %s", page_no, exc)
+
+    @staticmethod
+    def _page_count(
+        text_layer: TextLayerReport | None,
+        pages: _PageCacheLookup | None,
+    ) -> int | None:
+        if pages is not None:
+            return len(pages.keys)
+        if text_layer is not None and text_layer.pages:
+            return text_layer.page_count
+        return None
+
+    def _run_pages(
+        self,
+        path: Path,
+        text_layer: TextLayerReport | None,
+        profile: ConversionProfile,
+        pages: _PageCacheLookup | None,
+        selected: set[int] | None = None,
+    ) -> tuple[Any, str, tuple[int, int] | None]:
+        """Convert the *selected* pages of a PDF and reassemble them.
+
+        Cached pages are loaded from the page cache; the rest are converted
+        in contiguous page ranges (split where the OCR decision changes),
+        cached, and stitched together with the cached pages in page order.
+        Pages outside *selected* (None means every page) are left out.
+
+        Returns the result, the OCR routing label and the page stats.
+        """
+        page_count = self._page_count(text_layer, pages) or max(selected or {1})
+        wanted = sorted(
+            n for n in (selected or range(1, page_count + 1))
+            if 1 <= n <= page_count
+        )
+        cached = pages.cached if pages is not None else {}
+
+        _, routing = self._plan_ocr(text_layer, profile)
+        if routing == "full-document":
+            routing = "per-page"
+
+        def needs_ocr(page_no: int) -> bool:
+            if (
+                profile.ocr == "always"
+                or text_layer is None
+                or text_layer.page_count != page_count
+            ):
+                return True
+            return text_layer.pages[page_no - 1].needs_ocr
+
+        runs: list[tuple[bool | None, int, int]] = []
+        for page_no in wanted:
+            # None marks a cached page; True/False an uncached page's OCR.
+            tag = None if page_no in cached else needs_ocr(page_no)
+            if runs and runs[-1][0] == tag and runs[-1][2] == page_no - 1:
+                runs[-1] = (tag, runs[-1][1], page_no)
+            else:
+                runs.append((tag, page_no, page_no))
+
+        parts: list[Any] = []
+        first_pages: list[int] = []
+        for tag, first, last in runs:
+            if tag is None:
+                # A cached page may carry its number from an older revision.
+                parts.extend(
+                    _CachedPage(cached[n]) for n in range(first, last + 1)
+                )
+                first_pages.extend(range(first, last + 1))
+                continue
+            result = self._retry_weak_ocr(
+                path,
+                _get_converter(profile, do_ocr=tag).convert(
+                    source=path,
+                    raises_on_error=False,
+                    page_range=(first, last),
+                ),
+                profile,
             )
+            if pages is not None:
+                self._store_pages(result, pages.keys, range(first, last + 1))
+            parts.append(result)
+            first_pages.append(first)
+
+        reused = sum(1 for n in wanted if n in cached)
+        logger.info(
+            "Converted %d of %d pages of %s (%d from the page cache)",
+            len(wanted),
+            page_count,
+            path.name,
+            reused,
+        )
+        page_stats = (reused, len(wanted) - reused) if pages is not None else None
+        return _SegmentedConversion(parts, first_pages), routing, page_stats
 
-        return self._to_extraction_result(path, result)
+    @staticmethod
+    def _plan_ocr(
+        text_layer: TextLayerReport | None,
+        profile: ConversionProfile,
+    ) -> tuple[bool | None, str]:
+        """Decide whether to OCR a document, from its text layer.
 
-    # ------------------------------------------------------------------
-    # Internal
-    # ------------------------------------------------------------------
+        Returns ``(do_ocr, routing)``.  ``do_ocr`` is None when the
+        document should be split into OCR and non-OCR page ranges.  The
+        routing label is ``"none"`` (every page had a usable text layer),
+        ``"all"`` (every page needed OCR, or the text layer could not be
+        read), ``"per-page"`` (OCR and non-OCR page ranges converted
+        separately), or ``"full-document"`` (mixed pages, too fragmented
+        to split).  Profiles with ``ocr="always"`` skip the routing and
+        OCR everything.
+        """
+        if profile.ocr == "always":
+            return True, "all"
+        if text_layer is None or not text_layer.pages:
+            return True, "all"
+        if not text_layer.ocr_pages:
+            return False, "none"
+        if len(text_layer.ocr_pages) == text_layer.page_count:
+            return True, "all"
+        if len(text_layer.ocr_segments()) > _MAX_OCR_SEGMENTS:
+            return True, "full-document"
+        return None, "per-page"
+
+    def _run(
+        self,
+        path: Path,
+        text_layer: TextLayerReport | None,
+        profile: ConversionProfile,
+    ) -> tuple[Any, str]:
+        """Convert *path*, routing OCR per page when a text layer is known.
+
+        Returns the Docling result and the routing label from
+        :meth:`_plan_ocr`.
+        """
+        do_ocr, routing = self._plan_ocr(text_layer, profile)
+        if do_ocr is None:
+            segments = text_layer.ocr_segments()
+            results = [
+                self._retry_weak_ocr(
+                    path,
+                    _get_converter(profile, do_ocr=needs_ocr).convert(
+                        source=path,
+                        raises_on_error=False,
+                        page_range=(first, last),
+                    ),
+                    profile,
+                )
+                for needs_ocr, first, last in segments
+            ]
+            first_pages = [first for _, first, _ in segments]
+            return _SegmentedConversion(results, first_pages), routing
+
+        result = _get_converter(profile, do_ocr=do_ocr).convert(
+            source=path,
+            raises_on_error=False,
+        )
+        return self._retry_weak_ocr(path, result, profile), routing
+
+    # -- Adaptive OCR ----------------------------------------------------
+
+    @staticmethod
+    def _retry_weak_ocr(
+        path: Path,
+        result: Any,
+        profile: ConversionProfile,
+    ) -> Any:
+        """OCR the pages Docling read with low confidence again, more carefully.
+
+        *result* is a raw Docling result (original page numbers).  Pages
+        whose OCR score is below the profile's ``ocr_retry_below`` are
+        converted again with its retry pass (higher render scale, accurate
+        model); a retried page replaces the original only if it was read
+        with higher confidence.  Returns *result* itself when no page needs
+        a retry or none improved.
+        """
+        if (
+            profile.ocr_retry_scale is None
+            or result.status == ConversionStatus.FAILURE
+            or result.document is None
+        ):
+            return result
+        scores = _ocr_scores(result)
+        weak = sorted(
+            n for n, score in scores.items() if score < profile.ocr_retry_below
+        )
+        if not weak:
+            return result
+
+        better: dict[int, DoclingDocument] = {}
+        for first, last in page_ranges(weak):
+            try:
+                retry = _get_converter(profile, do_ocr=True, retry=True).convert(
+                    source=path,
+                    raises_on_error=False,
+                    page_range=(first, last),
+                )
+            except Exception as exc:
+                logger.warning(
+                    "OCR retry of pages %d-%d of %s failed: %s",
+                    first,
+                    last,
+                    path.name,
+                    exc,
+                )
+                continue
+            if retry.status == ConversionStatus.FAILURE or retry.document is None:
+                continue
+            retry_scores = _ocr_scores(retry)
+            for page_no in range(first, last + 1):
+                if retry_scores.get(page_no, 0.0) > scores.get(page_no, 1.0):
+                    better[page_no] = retry.document
+                    scores[page_no] = retry_scores[page_no]
+
+        logger.info(
+            "Re-OCR'd %d low-confidence pages of %s (%d improved)",
+            len(weak),
+            path.name,
+            len(better),
+        )
+        if not better:
+            return result
+
+        runs: list[tuple[DoclingDocument, int, int]] = []
+        for page_no in sorted(result.document.pages):
+            document = better.get(page_no, result.document)
+            if runs and runs[-1][0] is document and runs[-1][2] == page_no - 1:
+                runs[-1] = (document, runs[-1][1], page_no)
+            else:
+                runs.append((document, page_no, page_no))
+        return _OcrRetried(
+            result, _splice_pages(runs), scores, sorted(better)
+        )
 
     def _to_extraction_result(
-        self, path: Path, result: Any
+        self,
+        path: Path,
+        result: Any,
+        text_layer: TextLayerReport | None = None,
+        ocr_routing: str = "all",
     ) -> ExtractionResult:
         """Map a Docling ConversionResult to our ExtractionResult."""
         status = result.status
@@ -235,19 +1104,50 @@ class DoclingConverter(BaseConverter):
             if page_count > 0:
                 confidence_reason = f"successful extraction ({total_chars} chars, {page_count} pages)"
 
-        # Check if this was likely a scanned document.
-        # Docling handles OCR transparently, but we note it in metadata.
-        is_scanned = False
-        suffix = path.suffix.lower()
-        if suffix in (".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".webp"):
-            is_scanned = True
-
         metadata: dict[str, Any] = {
             "total_chars": total_chars,
             "conversion_engine": "docling",
             "partial": is_partial,
         }
 
+        # Per-page OCR confidence can only lower the document's confidence.
+        ocr_scores = _ocr_scores(result)
+        if ocr_scores:
+            metadata["ocr_confidence"] = {
+                page_no: round(score, 3)
+                for page_no, score in sorted(ocr_scores.items())
+            }
+            metadata["ocr_retried_pages"] = list(getattr(result, "ocr_retried", []))
+            confidence, confidence_reason = _with_ocr_confidence(
+                confidence, confidence_reason, ocr_scores
+            )
+
+        # Scanned status comes from the page analysis, not the extension.
+        if text_layer is not None and text_layer.pages:
+            is_scanned = text_layer.is_scanned
+            if ocr_routing in ("none", "per-page"):
+                ocr_pages = text_layer.ocr_pages
+            else:
+                ocr_pages = [p.page_no for p in text_layer.pages]
+            metadata["ocr_routing"] = ocr_routing
+            metadata["ocr_pages"] = ocr_pages
+            metadata["ocr_page_count"] = len(ocr_pages)
+        elif _EXTENSION_TO_FORMAT[path.suffix.lower()] == InputFormat.IMAGE:
+            # Images have no text layer, so they are always OCR'd.
+            is_scanned = True
+            metadata["ocr_routing"] = "all"
+            metadata["ocr_page_count"] = max(page_count, 1)
+        elif path.suffix.lower() == ".pdf":
+            # Unreadable text layer: everything went through OCR, but we
+            # can't tell whether the document was actually scanned.
+            is_scanned = False
+            metadata["ocr_routing"] = "all"
+            metadata["ocr_page_count"] = page_count
+        else:
+            is_scanned = False
+            metadata["ocr_routing"] = "none"
+            metadata["ocr_page_count"] = 0
+
         return ExtractionResult(
             source_path=path,
             text=markdown_text,
@@ -258,4 +1158,5 @@ class DoclingConverter(BaseConverter):
             page_count=page_count,
             is_scanned=is_scanned,
             metadata=metadata,
+            document=result.document,
         )
@@ -0,0 +1,122 @@
+"""
+Persist Docling's structured document next to the converted markdown.
+
+Markdown is a lossy export of Docling's ``DoclingDocument``: page numbers,
+table cell structure and element provenance are gone once it is written.
+When the pipeline runs with ``save_documents=True`` each Docling conversion
+also stores the full document as gzip-compressed JSON under ``documents/``
+in the folder's work folder (see :mod:`converters.workspace`), and
+:func:`regenerate` turns it back into
+markdown, plain text, HTML, per-page markdown or table data in milliseconds
+-- no models are loaded and nothing is re-converted.
+
+The stored documents hold the *unredacted* source content, exactly like the
+original files in the opportunity folder, which is why they are not kept
+in the agent-facing ``_converted/``.  Run anything regenerated from them
+through :func:`converters.redactor.redact_text` before handing it to
+agents.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from docling_core.types.doc import DoclingDocument
+
+logger = logging.getLogger(__name__)
+
+# Subfolder of a folder's work folder that holds the serialized documents.
+DOCUMENTS_DIR_NAME = "documents"
+
+# Suffix of a serialized document file.
+DOCUMENT_SUFFIX = ".json.gz"
+
+# Export formats understood by :func:`regenerate`.
+EXPORT_FORMATS: tuple[str, ...] = ("markdown", "text", "html", "pages", "tables")
+
+
+def document_filename(markdown_filename: str) -> str:
+    """Name of the document file that pairs with a converted markdown file.
+
+    >>> document_filename("financials--budget.md")
+    'financials--budget.json.gz'
+    """
+    return Path(markdown_filename).stem + DOCUMENT_SUFFIX
+
+
+def save_document(document: DoclingDocument, path: Path) -> Path:
+    """Write *document* to *path* as gzip-compressed JSON.
+
+    The file is written to a temporary name first and then renamed, so a
+    crash never leaves a truncated document behind.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(document.export_to_dict(), ensure_ascii=False)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as fh:
+        fh.write(payload)
+    tmp_path.replace(path)
+    return path
+
+
+def load_document(path: Path) -> DoclingDocument:
+    """Load a document written by :func:`save_document`."""
+    with gzip.open(Path(path), "rt", encoding="utf-8") as fh:
+        return DoclingDocument.model_validate_json(fh.read())
+
+
+def regenerate(
+    source: Path | DoclingDocument,
+    fmt: str = "markdown",
+    **options: Any,
+) -> Any:
+    """Re-export a stored document without re-running the conversion.
+
+    Parameters
+    ----------
+    source:
+        Path to a ``.json.gz`` document, or an already loaded document.
+    fmt:
+        ``"markdown"``, ``"text"`` or ``"html"`` return a string;
+        ``"pages"`` returns ``{page_no: markdown}``; ``"tables"`` returns
+        one list of rows (lists of cell strings) per table.
+    **options:
+        Passed to Docling's ``export_to_markdown`` / ``export_to_text`` /
+        ``export_to_html`` (e.g. ``compact_tables=True``).
+
+    Raises
+    ------
+    ValueError
+        If *fmt* is not one of :data:`EXPORT_FORMATS`.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format: {fmt!r} "
+            f"(expected one of: {', '.join(EXPORT_FORMATS)})"
+        )
+
+    document = (
+        source if isinstance(source, DoclingDocument) else load_document(source)
+    )
+
+    if fmt == "markdown":
+        return document.export_to_markdown(**options)
+    if fmt == "text":
+        return document.export_to_text(**options)
+    if fmt == "html":
+        return document.export_to_html(**options)
+    if fmt == "pages":
+        return {
+            page_no: document.export_to_markdown(page_no=page_no, **options)
+            for page_no in sorted(document.pages)
+        }
+    return [
+        [[cell.text for cell in row] for row in table.data.grid]
+        for table in document.tables
+    ]
@@ -0,0 +1,105 @@
+"""
+Instant draft conversion of born-digital PDFs from their text layer.
+
+A full Docling run over an opportunity folder takes tens of minutes, but the
+embedded text layer of a born-digital PDF can be read in milliseconds.  In
+progressive mode (``convert_folder(progressive=True)``) the pipeline writes
+a draft per PDF with :class:`TextLayerDraftConverter` so agents can start
+straight away, then :mod:`converters.refine` replaces each draft with the
+Docling conversion in the background.
+
+Drafts are plain text: no headings, tables or reading-order repair.  Pages
+whose text layer is unusable (scans, broken fonts) are left as placeholders
+until Docling's OCR fills them in.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+
+from converters.base import BaseConverter, ConfidenceLevel, ExtractionResult
+from converters.text_layer import analyze_pdf_text_layer
+
+logger = logging.getLogger(__name__)
+
+# Method label recorded in the manifest for draft conversions.
+DRAFT_METHOD = "text-layer-draft"
+
+
+def _clean_page_text(text: str) -> str:
+    """Normalize pdfium's line endings and drop trailing whitespace."""
+    lines = [line.rstrip() for line in text.replace("\r\n", "\n").split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+class TextLayerDraftConverter(BaseConverter):
+    """Draft markdown for a PDF straight from its embedded text layer.
+
+    Fails (``success=False``) when no page has a usable text layer, since
+    a draft of a scanned document would be empty.
+    """
+
+    supported_extensions = [".pdf"]
+
+    def convert(self, path: Path) -> ExtractionResult:
+        path = Path(path).resolve()
+        report = analyze_pdf_text_layer(path, keep_text=True)
+        if report is None:
+            return ExtractionResult(
+                source_path=path,
+                text="",
+                method=DRAFT_METHOD,
+                success=False,
+                confidence=ConfidenceLevel.LOW,
+                confidence_reason="unreadable PDF",
+                error=f"Could not read the text layer of {path.name}",
+            )
+
+        usable = [page for page in report.pages if not page.needs_ocr]
+        if not usable:
+            return ExtractionResult(
+                source_path=path,
+                text="",
+                method=DRAFT_METHOD,
+                success=False,
+                confidence=ConfidenceLevel.LOW,
+                confidence_reason="no usable text layer",
+                page_count=report.page_count,
+                is_scanned=True,
+                error="Every page needs OCR; no draft possible",
+            )
+
+        blocks = []
+        for page in report.pages:
+            if page.needs_ocr:
+                blocks.append(
+                    f"<!-- page {page.page_no}: no usable text layer, "
+                    "awaiting OCR -->"
+                )
+            else:
+                blocks.append(_clean_page_text(page.text))
+
+        ocr_pages = report.ocr_pages
+        reason = f"draft from embedded text layer ({report.page_count} pages"
+        if ocr_pages:
+            reason += f", {len(ocr_pages)} awaiting OCR"
+        reason += "); Docling refinement pending"
+
+        logger.debug(
+            "Drafted %s from its text layer (%d/%d pages)",
+            path.name,
+            len(usable),
+            report.page_count,
+        )
+        return ExtractionResult(
+            source_path=path,
+            text="\n\n".join(blocks),
+            method=DRAFT_METHOD,
+            success=True,
+            confidence=ConfidenceLevel.MEDIUM,
+            confidence_reason=reason,
+            page_count=report.page_count,
+            metadata={"ocr_pages": ocr_pages},
+        )
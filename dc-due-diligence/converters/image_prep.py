@@ -0,0 +1,254 @@
+"""
+Pre-processing of photos and image scans before OCR.
+
+Site photos and scanned exhibits arrive as 20-50 MP phone images, and most
+are pictures of equipment with no text at all.  Before images reach Docling
+the pipeline runs each one through :func:`prepare_image`, which
+
+* reads the header and EXIF cheaply (JPEGs are decoded at a reduced scale),
+* applies the EXIF orientation so text is upright for OCR,
+* downsamples to at most ``_MAX_LONG_EDGE`` pixels -- a letter page at
+  300 DPI, plenty for OCR,
+* checks for text with a fast row-transition heuristic (no models), and
+* computes a perceptual difference hash (dHash).
+
+Images without text skip OCR entirely (:func:`textless_result`), and
+near-identical photos are recorded as duplicates of the first one found
+(:func:`find_duplicates`) instead of being converted again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from converters.base import ConfidenceLevel, ExtractionResult
+from converters.scanner import FileType
+
+logger = logging.getLogger(__name__)
+
+# Longest edge, in pixels, of an image handed to OCR (11 in at 300 DPI).
+_MAX_LONG_EDGE: int = 3300
+
+# Width, in pixels, the text detector works at.
+_DETECT_WIDTH: int = 1000
+
+# A row looks like text when at least this fraction of its pixels are
+# strong horizontal brightness changes (glyph strokes).
+_TEXT_ROW_TRANSITIONS: float = 0.04
+_EDGE_CONTRAST: int = 48
+
+# Text forms bands of such rows, one per line, between these heights (in
+# detector pixels); an image needs this many bands to count as text.
+_MIN_LINE_HEIGHT: int = 3
+_MAX_LINE_HEIGHT: int = 60
+_MIN_TEXT_LINES: int = 3
+
+# Photos whose dHashes differ in at most this many of 64 bits are
+# near-duplicates (the same shot resaved, resized or recompressed).  Scans
+# of different forms on one template hash alike, so images with text must
+# match almost exactly.
+_DUPLICATE_DISTANCE: int = 6
+_TEXT_DUPLICATE_DISTANCE: int = 2
+
+# File types that are pre-processed before conversion.
+IMAGE_TYPES: frozenset[FileType] = frozenset({
+    FileType.IMAGE_PNG,
+    FileType.IMAGE_JPG,
+    FileType.IMAGE_TIFF,
+    FileType.IMAGE_BMP,
+    FileType.IMAGE_WEBP,
+})
+
+# Method label for images recorded without OCR.
+TEXTLESS_METHOD = "image-no-text"
+
+
+@dataclass
+class PreparedImage:
+    """An image ready for conversion.
+
+    Attributes:
+        source: The original image file.
+        path: The file to convert: *source* itself, or an upright,
+            downscaled PNG copy.
+        original_size: ``(width, height)`` of the original, as stored.
+        size: ``(width, height)`` of *path*.
+        rotated: True if an EXIF orientation was applied.
+        has_text: Whether the text detector found text.
+        dhash: 64-bit perceptual difference hash.
+    """
+
+    source: Path
+    path: Path
+    original_size: tuple[int, int]
+    size: tuple[int, int]
+    rotated: bool
+    has_text: bool
+    dhash: int
+
+
+def prepare_image(path: Path, work_dir: Path) -> PreparedImage | None:
+    """Orient, downscale, hash and text-check one image.
+
+    A processed copy is written to *work_dir* only when the image had to be
+    rotated or downscaled.  Returns None when the image cannot be read or
+    has several frames (multi-page TIFF scans go to Docling untouched).
+    """
+    path = Path(path).resolve()
+    try:
+        with Image.open(path) as image:
+            if getattr(image, "n_frames", 1) > 1:
+                return None
+            original_size = image.size
+            orientation = image.getexif().get(0x0112, 1)
+            scale = min(1.0, _MAX_LONG_EDGE / max(original_size))
+            if scale < 1.0:
+                # JPEG only: decode directly at a reduced size (cheap).
+                image.draft(
+                    "RGB",
+                    (int(original_size[0] * scale), int(original_size[1] * scale)),
+                )
+            image.load()
+            upright = ImageOps.exif_transpose(image)
+            if max(upright.size) > _MAX_LONG_EDGE:
+                upright.thumbnail((_MAX_LONG_EDGE, _MAX_LONG_EDGE), Image.LANCZOS)
+
+            rotated = orientation not in (None, 1)
+            output = path
+            if rotated or scale < 1.0:
+                work_dir.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha1(str(path).encode()).hexdigest()[:16]
+                output = work_dir / f"{digest}-{path.stem}.png"
+                # Low compression: the copy is a short-lived work file.
+                _normalize_mode(upright).save(output, format="PNG", compress_level=1)
+
+            prepared = PreparedImage(
+                source=path,
+                path=output,
+                original_size=original_size,
+                size=upright.size,
+                rotated=rotated,
+                has_text=has_text(upright),
+                dhash=dhash(upright),
+            )
+    except Exception as exc:
+        logger.warning("Could not pre-process image %s: %s", path.name, exc)
+        return None
+
+    logger.debug(
+        "Prepared %s: %dx%d -> %dx%d, text %s",
+        path.name,
+        *original_size,
+        *prepared.size,
+        "yes" if prepared.has_text else "no",
+    )
+    return prepared
+
+
+def _normalize_mode(image: Image.Image) -> Image.Image:
+    if image.mode in ("1", "L", "RGB", "RGBA"):
+        return image
+    return image.convert("RGB")
+
+
+# ---------------------------------------------------------------------------
+# Text detection and hashing
+# ---------------------------------------------------------------------------
+
+def has_text(image: Image.Image) -> bool:
+    """Fast check for lines of text, in either orientation.
+
+    Text rows are full of sharp light/dark transitions and come in bands
+    about one line tall separated by gaps; photos either lack the
+    transitions or have them in tall, unbroken regions.
+    """
+    gray = image.convert("L")
+    if gray.width > _DETECT_WIDTH:
+        height = max(1, round(gray.height * _DETECT_WIDTH / gray.width))
+        gray = gray.resize((_DETECT_WIDTH, height), Image.BILINEAR)
+    pixels = np.asarray(gray, dtype=np.int16)
+    return _text_lines(pixels) >= _MIN_TEXT_LINES or (
+        _text_lines(pixels.T) >= _MIN_TEXT_LINES
+    )
+
+
+def _text_lines(pixels: np.ndarray) -> int:
+    """Count bands of text-like rows of line height."""
+    if pixels.shape[1] < 2:
+        return 0
+    edges = np.abs(np.diff(pixels, axis=1)) > _EDGE_CONTRAST
+    texty = edges.mean(axis=1) >= _TEXT_ROW_TRANSITIONS
+
+    lines = 0
+    run = 0
+    for row in texty:
+        if row:
+            run += 1
+            continue
+        if _MIN_LINE_HEIGHT <= run <= _MAX_LINE_HEIGHT:
+            lines += 1
+        run = 0
+    if _MIN_LINE_HEIGHT <= run <= _MAX_LINE_HEIGHT:
+        lines += 1
+    return lines
+
+
+def dhash(image: Image.Image) -> int:
+    """64-bit difference hash: brighter-than-right-neighbour bits on 9x8."""
+    small = np.asarray(
+        image.convert("L").resize((9, 8), Image.BILINEAR), dtype=np.int16
+    )
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def find_duplicates(images: list[PreparedImage]) -> dict[Path, Path]:
+    """Map each near-duplicate image to the first image it duplicates.
+
+    *images* is in scan order; the first of each group of near-identical
+    images is kept and does not appear in the result.  Photos are only
+    compared with photos and images with text with images with text.
+    """
+    kept: list[PreparedImage] = []
+    duplicates: dict[Path, Path] = {}
+    for image in images:
+        limit = _TEXT_DUPLICATE_DISTANCE if image.has_text else _DUPLICATE_DISTANCE
+        original = next(
+            (
+                k for k in kept
+                if k.has_text == image.has_text
+                and hamming(k.dhash, image.dhash) <= limit
+            ),
+            None,
+        )
+        if original is None:
+            kept.append(image)
+        else:
+            duplicates[image.source] = original.source
+    return duplicates
+
+
+def textless_result(prepared: PreparedImage) -> ExtractionResult:
+    """The extraction recorded for an image the text detector found empty."""
+    width, height = prepared.original_size
+    return ExtractionResult(
+        source_path=prepared.source,
+        text=f"_Image ({width}x{height} px) with no detectable text; OCR skipped._",
+        method=TEXTLESS_METHOD,
+        success=True,
+        confidence=ConfidenceLevel.MEDIUM,
+        confidence_reason="no text detected; OCR skipped",
+        page_count=1,
+        metadata={"original_size": [width, height], "rotated": prepared.rotated},
+    )
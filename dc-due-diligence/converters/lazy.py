@@ -0,0 +1,157 @@
+"""
+Page selection for lazy conversion of oversized PDFs.
+
+Environmental reports with thousand-page appendices and title packages are
+mostly read for their summary, table of contents and a handful of sections.
+In lazy mode (``DoclingConverter(lazy=LazyPolicy())``) a PDF with at least
+``min_pages`` pages is only partly converted up front: the first
+``head_pages`` pages, plus the pages whose text layer mentions due-diligence
+keywords.  Every other page is *deferred* -- listed in the manifest and
+converted on demand with ``python -m converters.deferred`` (see
+:mod:`converters.deferred`).
+
+Selection only reads the embedded text layer (see ``converters.text_layer``),
+so image-only pages beyond the head are always deferred.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from converters.text_layer import TextLayerReport
+
+# Terms that mark a page as worth converting eagerly.  Matched as whole
+# words, case-insensitively, against each page's text layer.
+DOMAIN_KEYWORDS: tuple[str, ...] = (
+    "executive summary",
+    "table of contents",
+    "summary of findings",
+    "conclusion",
+    "conclusions",
+    "recommendation",
+    "recommendations",
+    "recognized environmental condition",
+    "substation",
+    "interconnection",
+    "transmission",
+    "utility",
+    "megawatt",
+    "MW",
+    "water supply",
+    "wastewater",
+    "fiber",
+    "zoning",
+    "entitlement",
+    "easement",
+    "encumbrance",
+    "lien",
+    "exception",
+    "flood zone",
+    "wetland",
+    "purchase price",
+    "incentive",
+)
+
+
+@dataclass(frozen=True)
+class LazyPolicy:
+    """Which pages of a large PDF to convert eagerly.
+
+    Attributes:
+        min_pages: PDFs with fewer pages are always converted in full.
+        head_pages: Leading pages always converted (cover, summary, TOC).
+        keywords: Terms that pull a page into the eager set.
+        max_keyword_pages: Cap on keyword-selected pages; the pages with
+            the most keyword hits win.
+    """
+
+    min_pages: int = 150
+    head_pages: int = 25
+    keywords: tuple[str, ...] = DOMAIN_KEYWORDS
+    max_keyword_pages: int = 75
+
+    def pattern(self) -> re.Pattern[str]:
+        """Compiled whole-word, case-insensitive pattern for the keywords."""
+        alternatives = "|".join(
+            re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+        )
+        return re.compile(rf"\b(?:{alternatives})\b", re.IGNORECASE)
+
+
+def select_eager_pages(
+    report: TextLayerReport,
+    policy: LazyPolicy,
+) -> set[int] | None:
+    """Pick the pages of *report* to convert now.
+
+    *report* must have been built with ``keep_text=True``.  Returns None
+    when the document is too small for lazy conversion (convert it all).
+    """
+    if report.page_count < policy.min_pages:
+        return None
+
+    eager = set(range(1, min(policy.head_pages, report.page_count) + 1))
+    pattern = policy.pattern()
+    hits = [
+        (len(pattern.findall(page.text)), page.page_no)
+        for page in report.pages
+        if page.page_no not in eager and page.text
+    ]
+    ranked = sorted((h for h in hits if h[0] > 0), key=lambda h: (-h[0], h[1]))
+    eager.update(page_no for _, page_no in ranked[: policy.max_keyword_pages])
+    return eager
+
+
+def page_ranges(pages: Iterable[int]) -> list[tuple[int, int]]:
+    """Collapse page numbers into sorted, inclusive ``(first, last)`` runs.
+
+    >>> page_ranges([5, 1, 2, 3, 9])
+    [(1, 3), (5, 5), (9, 9)]
+    """
+    ranges: list[tuple[int, int]] = []
+    for page_no in sorted(set(pages)):
+        if ranges and ranges[-1][1] == page_no - 1:
+            ranges[-1] = (ranges[-1][0], page_no)
+        else:
+            ranges.append((page_no, page_no))
+    return ranges
+
+
+def format_page_ranges(ranges: Iterable[tuple[int, int]]) -> str:
+    """Render ranges the way :func:`parse_page_ranges` reads them.
+
+    >>> format_page_ranges([(1, 3), (5, 5)])
+    '1-3,5'
+    """
+    return ",".join(
+        str(first) if first == last else f"{first}-{last}"
+        for first, last in ranges
+    )
+
+
+def parse_page_ranges(spec: str) -> set[int]:
+    """Parse ``"21-40,55,60-62"`` into a set of page numbers.
+
+    Raises
+    ------
+    ValueError
+        If *spec* is malformed or contains a page number below 1.
+    """
+    pages: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d+)(?:\s*-\s*(\d+))?", part)
+        if match is None:
+            raise ValueError(f"Invalid page range: {part!r}")
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range: {part!r}")
+        pages.update(range(first, last + 1))
+    if not pages:
+        raise ValueError(f"No pages in range specification: {spec!r}")
+    return pages
@@ -0,0 +1,146 @@
+"""
+Writers for the files the pipeline stages in ``_converted/``.
+
+The pipeline, the background refinement (:mod:`converters.refine`) and
+on-demand page conversion (:mod:`converters.deferred`) all write converted
+markdown and update the same JSON manifest, so the formats live here
+rather than in any one of them:
+
+- :func:`build_markdown` renders an extraction with the metadata header
+  agents rely on.
+- :func:`manifest_entry` is the manifest's JSON record for one file.
+- :func:`write_json_atomic` replaces a JSON file without ever leaving a
+  partial one for a reader to find.
+- :func:`update_json` is the read-modify-write every writer uses to change
+  a JSON file that another process may be changing at the same time.
+
+A progressive run's background refinement, on-demand page conversions and
+a newer pipeline run can all update the manifest at once.  Each update
+re-reads the file and rewrites it while holding :func:`json_lock`, an
+exclusive ``flock`` on the folder the file lives in, so no writer clobbers
+another's change.  Locking the folder rather than the file keeps the lock
+valid across the atomic renames and leaves no lock file behind.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from converters.base import ExtractionResult
+from converters.lazy import format_page_ranges
+from converters.scanner import FileEntry, FileType
+
+if TYPE_CHECKING:
+    from converters.pipeline import ConvertedFile
+
+
+def build_markdown(entry: FileEntry, extraction: ExtractionResult) -> str:
+    """Build the final markdown content with a metadata header.
+
+    The header gives agents context about the source file without needing
+    to read the manifest separately.
+    """
+    header_lines = [
+        f"# {entry.relative_path}",
+        "",
+        f"- **Source:** `{entry.relative_path}`",
+        f"- **Type:** {entry.file_type.value}",
+        f"- **Method:** {extraction.method}",
+        f"- **Confidence:** {extraction.confidence.value} -- {extraction.confidence_reason}",
+    ]
+    if extraction.page_count > 0:
+        label = "pages" if entry.file_type == FileType.PDF else "sheets/slides"
+        header_lines.append(f"- **Pages:** {extraction.page_count} {label}")
+    if extraction.metadata.get("pages"):
+        selection = format_page_ranges(extraction.metadata["pages"])
+        header_lines.append(f"- **Page selection:** {selection}")
+    if extraction.metadata.get("deferred_pages"):
+        deferred = format_page_ranges(extraction.metadata["deferred_pages"])
+        header_lines.append(
+            f"- **Deferred pages:** {deferred} (not converted yet -- run "
+            f"`python -m converters.deferred <opportunity_folder> "
+            f'"{entry.relative_path}" <pages>` from the plugin directory)'
+        )
+    if extraction.is_scanned:
+        header_lines.append("- **Note:** Scanned/image-based document (OCR extracted locally)")
+
+    header_lines.append("")
+    header_lines.append("---")
+    header_lines.append("")
+
+    return "\n".join(header_lines) + extraction.text + "\n"
+
+
+def manifest_entry(f: ConvertedFile) -> dict[str, Any]:
+    """The manifest's JSON record for one file."""
+    return {
+        "original_path": f.original_path,
+        "relative_path": f.relative_path,
+        "converted_path": f.converted_path,
+        "converted_filename": f.converted_filename,
+        "file_type": f.file_type,
+        "converter": f.converter,
+        "method": f.method,
+        "success": f.success,
+        "confidence": f.confidence,
+        "confidence_reason": f.confidence_reason,
+        "error": f.error,
+        "size_bytes": f.size_bytes,
+        "page_count": f.page_count,
+        "elapsed_seconds": f.elapsed_seconds,
+        "profile": f.profile,
+        "document_path": f.document_path,
+        "pages_reused": f.pages_reused,
+        "pages_converted": f.pages_converted,
+        "deferred_pages": f.deferred_pages,
+        "refinement": f.refinement,
+        "duplicate_of": f.duplicate_of,
+    }
+
+
+def write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Write *data* to *path* as JSON, atomically (no partial files)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def json_lock(path: Path) -> Iterator[None]:
+    """Hold the exclusive lock for writing the JSON file at *path*.
+
+    Blocks until every other writer in the same folder has finished.
+    """
+    fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock.
+        os.close(fd)
+
+
+@contextmanager
+def update_json(path: Path) -> Iterator[dict[str, Any]]:
+    """Read the JSON file at *path* for changing it in place, under the lock.
+
+    Yields the parsed object (empty if the file does not exist yet); when
+    the block exits normally and the object was changed, it is written back
+    atomically before the lock is released.  An exception leaves the file
+    untouched.
+    """
+    with json_lock(path):
+        text = path.read_text(encoding="utf-8") if path.exists() else "{}"
+        data = json.loads(text)
+        yield data
+        if data != json.loads(text):
+            write_json_atomic(path, data)
@@ -0,0 +1,387 @@
+"""
+Lightweight converters for formats that need no layout analysis.
+
+CSV, HTML and DOCX files are already structured text, so they can be turned
+into markdown directly with the standard library and python-docx (a Docling
+dependency) -- no Docling ``DocumentConverter``, no ML models.  The scanner
+routes these types here when nothing in the folder needs Docling's layout
+models (see ``converters.scanner``).
+
+The markdown mirrors Docling's output: ``#`` headings, ``-`` list items,
+blank-line separated paragraphs and GitHub pipe tables.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from html.parser import HTMLParser
+from pathlib import Path
+
+import docx
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from converters.base import BaseConverter, ConfidenceLevel, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the start of a CSV to sniff its delimiter.
+_SNIFF_BYTES: int = 64 * 1024
+
+# Encodings tried in order when reading CSV and HTML files.
+_ENCODINGS: tuple[str, ...] = ("utf-8-sig", "cp1252", "latin-1")
+
+
+# ---------------------------------------------------------------------------
+# Shared helpers
+# ---------------------------------------------------------------------------
+
+def _escape_cell(value: str) -> str:
+    """Make a value safe to place inside a markdown table cell."""
+    value = re.sub(r"\s+", " ", value).strip()
+    return value.replace("|", "\\|")
+
+
+def _rows_to_markdown(rows: Iterable[list[str]], width: int) -> Iterator[str]:
+    """Yield markdown table lines for *rows*; the first row is the header.
+
+    Rows are padded (or truncated) to *width* columns.  Yields nothing when
+    there are no rows.
+    """
+    first = True
+    for row in rows:
+        cells = [_escape_cell(c) for c in row[:width]]
+        cells.extend([""] * (width - len(cells)))
+        yield "| " + " | ".join(cells) + " |"
+        if first:
+            yield "|" + "|".join(["---"] * width) + "|"
+            first = False
+
+
+def _join_blocks(blocks: list[str]) -> str:
+    """Join markdown blocks with blank lines, keeping list items together."""
+    out: list[str] = []
+    for block in blocks:
+        if out:
+            tight = block.startswith("- ") and out[-1].startswith("- ")
+            out.append("\n" if tight else "\n\n")
+        out.append(block)
+    return "".join(out)
+
+
+def _read_text(path: Path) -> str:
+    """Read a text file, trying common encodings before giving up."""
+    for encoding in _ENCODINGS:
+        try:
+            return path.read_text(encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def _detect_encoding(path: Path) -> str:
+    """Pick the first encoding that can decode the head of *path*."""
+    with path.open("rb") as fh:
+        head = fh.read(_SNIFF_BYTES)
+    for encoding in _ENCODINGS:
+        try:
+            head.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def _result(
+    path: Path,
+    text: str,
+    method: str,
+    metadata: dict | None = None,
+) -> ExtractionResult:
+    """Build a successful ExtractionResult with text-length based confidence."""
+    total_chars = len(text)
+    if total_chars == 0:
+        confidence = ConfidenceLevel.LOW
+        reason = "no text extracted"
+    else:
+        confidence = ConfidenceLevel.HIGH
+        reason = f"successful extraction ({total_chars} chars)"
+
+    return ExtractionResult(
+        source_path=path,
+        text=text,
+        method=method,
+        success=True,
+        confidence=confidence,
+        confidence_reason=reason,
+        metadata={
+            "total_chars": total_chars,
+            "conversion_engine": "native",
+            "partial": False,
+            **(metadata or {}),
+        },
+    )
+
+
+def _failure(path: Path, method: str, reason: str, error: str) -> ExtractionResult:
+    return ExtractionResult(
+        source_path=path,
+        text="",
+        method=method,
+        success=False,
+        confidence=ConfidenceLevel.LOW,
+        confidence_reason=reason,
+        error=error,
+    )
+
+
+class _NativeConverter(BaseConverter):
+    """Shared ``convert`` wrapper: existence check and crash handling."""
+
+    method: str = "native"
+
+    def convert(self, path: Path) -> ExtractionResult:
+        path = Path(path).resolve()
+
+        if not path.exists():
+            return _failure(
+                path, self.method, "file not found", f"File not found: {path}"
+            )
+
+        try:
+            return self._convert(path)
+        except Exception as exc:
+            logger.error("%s crashed for %s: %s", type(self).__name__, path, exc)
+            return _failure(
+                path,
+                self.method,
+                "converter crashed",
+                f"Conversion failed: {exc}",
+            )
+
+    def _convert(self, path: Path) -> ExtractionResult:
+        raise NotImplementedError
+
+
+# ---------------------------------------------------------------------------
+# CSV
+# ---------------------------------------------------------------------------
+
+class CsvConverter(_NativeConverter):
+    """Stream a CSV file into a markdown table with the ``csv`` module.
+
+    The file is read twice -- once to find the widest row, once to write
+    the table -- so memory use does not grow with the number of rows
+    beyond the markdown being produced.
+    """
+
+    supported_extensions: list[str] = [".csv"]
+    method = "native-csv"
+
+    def _convert(self, path: Path) -> ExtractionResult:
+        encoding = _detect_encoding(path)
+        dialect = self._sniff(path, encoding)
+
+        width = 0
+        row_count = 0
+        with path.open(newline="", encoding=encoding, errors="replace") as fh:
+            for row in csv.reader(fh, dialect):
+                if row:
+                    width = max(width, len(row))
+                    row_count += 1
+
+        out = io.StringIO()
+        with path.open(newline="", encoding=encoding, errors="replace") as fh:
+            rows = (row for row in csv.reader(fh, dialect) if row)
+            for line in _rows_to_markdown(rows, width):
+                out.write(line)
+                out.write("\n")
+
+        return _result(
+            path,
+            out.getvalue().rstrip("\n"),
+            self.method,
+            {"rows": row_count, "columns": width},
+        )
+
+    @staticmethod
+    def _sniff(path: Path, encoding: str) -> type[csv.Dialect] | csv.Dialect:
+        with path.open(newline="", encoding=encoding, errors="replace") as fh:
+            sample = fh.read(_SNIFF_BYTES)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",;\t|")
+        except csv.Error:
+            return csv.excel
+
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+
+class _HtmlToMarkdown(HTMLParser):
+    """Minimal HTML-to-markdown translator for headings, lists and tables."""
+
+    _SKIP_TAGS = {"script", "style", "head", "noscript", "template"}
+    _BLOCK_TAGS = {
+        "p", "div", "section", "article", "header", "footer", "br",
+        "blockquote", "pre", "main", "aside", "nav",
+    }
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[str] = []
+        self._buffer: list[str] = []
+        self._prefix = ""
+        self._skip_depth = 0
+        self._tables: list[list[list[str]]] = []
+        self._cell: list[str] | None = None
+        self._emphasis = 0
+
+    # -- Parser callbacks ------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+
+        if tag == "table":
+            self._flush()
+            self._tables.append([])
+        elif tag == "tr" and self._tables:
+            self._tables[-1].append([])
+        elif tag in ("td", "th") and self._tables:
+            self._cell = []
+        elif re.fullmatch(r"h[1-6]", tag):
+            self._flush()
+            self._prefix = "#" * int(tag[1]) + " "
+        elif tag == "li":
+            self._flush()
+            self._prefix = "- "
+        elif tag in ("b", "strong"):
+            self._emphasis += 1
+            self._write("**")
+        elif tag in self._BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth:
+            return
+
+        if tag in ("td", "th") and self._cell is not None and self._tables:
+            if self._tables[-1]:
+                self._tables[-1][-1].append("".join(self._cell))
+            self._cell = None
+        elif tag == "table" and self._tables:
+            rows = [r for r in self._tables.pop() if r]
+            if rows:
+                width = max(len(r) for r in rows)
+                self.blocks.append("\n".join(_rows_to_markdown(rows, width)))
+        elif tag in ("b", "strong") and self._emphasis:
+            self._emphasis -= 1
+            self._write("**")
+        elif re.fullmatch(r"h[1-6]", tag) or tag == "li" or tag in self._BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._write(data)
+
+    # -- Helpers ---------------------------------------------------------
+
+    def _write(self, data: str) -> None:
+        if self._cell is not None:
+            self._cell.append(data)
+        elif not self._tables:
+            self._buffer.append(data)
+
+    def _flush(self) -> None:
+        text = re.sub(r"\s+", " ", "".join(self._buffer)).strip()
+        if text.strip("*"):
+            self.blocks.append(self._prefix + text)
+        self._buffer = []
+        self._prefix = ""
+
+    def markdown(self) -> str:
+        self._flush()
+        return _join_blocks(self.blocks)
+
+
+class HtmlConverter(_NativeConverter):
+    """Convert HTML to markdown with the standard library's HTML parser."""
+
+    supported_extensions: list[str] = [".html", ".htm"]
+    method = "native-html"
+
+    def _convert(self, path: Path) -> ExtractionResult:
+        parser = _HtmlToMarkdown()
+        parser.feed(_read_text(path))
+        parser.close()
+        return _result(path, parser.markdown(), self.method)
+
+
+# ---------------------------------------------------------------------------
+# DOCX
+# ---------------------------------------------------------------------------
+
+class DocxConverter(_NativeConverter):
+    """Convert Word documents to markdown with python-docx.
+
+    Body paragraphs and tables are emitted in document order.  Heading
+    levels follow Docling (``Title`` is ``#``, ``Heading N`` is N+1 hashes).
+    """
+
+    supported_extensions: list[str] = [".docx", ".dotx"]
+    method = "native-docx"
+
+    def _convert(self, path: Path) -> ExtractionResult:
+        document = docx.Document(str(path))
+        blocks: list[str] = []
+        table_count = 0
+
+        for child in document.element.body.iterchildren():
+            tag = child.tag.rsplit("}", 1)[-1]
+            if tag == "p":
+                block = self._paragraph(Paragraph(child, document))
+                if block:
+                    blocks.append(block)
+            elif tag == "tbl":
+                rows = [
+                    [cell.text for cell in row.cells]
+                    for row in Table(child, document).rows
+                ]
+                rows = [r for r in rows if any(c.strip() for c in r)]
+                if rows:
+                    width = max(len(r) for r in rows)
+                    blocks.append("\n".join(_rows_to_markdown(rows, width)))
+                    table_count += 1
+
+        return _result(
+            path, _join_blocks(blocks), self.method, {"tables": table_count}
+        )
+
+    @staticmethod
+    def _paragraph(paragraph: Paragraph) -> str:
+        text = re.sub(r"\s+", " ", paragraph.text).strip()
+        if not text:
+            return ""
+
+        style = (paragraph.style.name if paragraph.style is not None else "") or ""
+        if style == "Title":
+            return f"# {text}"
+        match = re.match(r"Heading (\d)", style)
+        if match:
+            level = min(int(match.group(1)) + 1, 6)
+            return f"{'#' * level} {text}"
+        p_pr = paragraph._p.pPr
+        if style.startswith("List") or (p_pr is not None and p_pr.numPr is not None):
+            return f"- {text}"
+        return text
@@ -0,0 +1,116 @@
+"""
+Page-level cache of Docling output for PDFs.
+
+Brokers routinely resend a 200-page offering memorandum with two pages
+changed.  A whole-file cache misses on any edit, so instead each PDF page is
+fingerprinted from what actually draws it -- its content stream, the images
+and form XObjects it paints, and the fonts it uses -- and Docling's output
+for that page is cached under the fingerprint.  On the next run only pages
+with a new fingerprint are converted; the rest are loaded from the cache and
+the document is reassembled in page order.
+
+Fingerprints deliberately ignore PDF object numbers, which change whenever a
+file is re-saved, so an untouched page keeps its fingerprint across
+revisions.  Cache keys also include the conversion profile's
+:attr:`~converters.profiles.ConversionProfile.cache_key` and the Docling
+version, so output from different settings never mixes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import fitz
+from docling_core.types.doc import DoclingDocument
+
+from converters.document_store import DOCUMENT_SUFFIX, load_document, save_document
+from converters.profiles import ConversionProfile
+
+logger = logging.getLogger(__name__)
+
+# Subfolder of a folder's work folder (:func:`converters.workspace.work_dir`)
+# that holds conversion caches.  Cached pages are not redacted, so they are
+# never kept in ``_converted/``.
+CACHE_DIR_NAME = "cache"
+
+
+def _docling_version() -> str:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def page_fingerprints(path: Path) -> list[str] | None:
+    """Return one content fingerprint per page of the PDF at *path*.
+
+    Returns None if the file cannot be opened with PyMuPDF.
+    """
+    try:
+        document = fitz.open(str(path))
+    except Exception as exc:
+        logger.debug("Cannot fingerprint %s: %s", path, exc)
+        return None
+
+    fingerprints: list[str] = []
+    with document:
+        for page in document:
+            digest = hashlib.sha256()
+            digest.update(f"{tuple(page.rect)}:{page.rotation}".encode())
+            digest.update(page.read_contents())
+            for image in page.get_images(full=True):
+                digest.update(image[7].encode())
+                digest.update(hashlib.sha256(document.xref_stream_raw(image[0])).digest())
+            for xobject in page.get_xobjects():
+                digest.update(xobject[1].encode())
+                digest.update(document.xref_stream_raw(xobject[0]) or b"")
+            for font in page.get_fonts(full=True):
+                # Type, base font, resource name and encoding -- not the xref.
+                digest.update(repr(font[1:6]).encode())
+            fingerprints.append(digest.hexdigest())
+    return fingerprints
+
+
+class PageCache:
+    """Docling output for single PDF pages, stored under a cache folder.
+
+    Each entry is a one-page ``DoclingDocument`` saved as gzip-compressed
+    JSON.  The page keeps the number it had in the PDF it was converted
+    from, which need not be its position in a later revision that reuses
+    it.
+
+    Parameters
+    ----------
+    root:
+        Folder to store cache entries in (created on first write).
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._docling_version = _docling_version()
+
+    def key(self, fingerprint: str, profile: ConversionProfile) -> str:
+        """Cache key for a page fingerprint converted with *profile*."""
+        raw = f"{fingerprint}|{profile.cache_key}|docling={self._docling_version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{DOCUMENT_SUFFIX}"
+
+    def get(self, key: str) -> DoclingDocument | None:
+        """Return the cached page for *key*, or None on a miss."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return load_document(path)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable page cache entry %s: %s", path, exc)
+            return None
+
+    def put(self, key: str, page: DoclingDocument) -> None:
+        """Store a one-page document under *key*."""
+        save_document(page, self._path(key))
@@ -12,18 +12,57 @@ All processing is local -- no API calls for conversion or redaction.
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 import re
+import shutil
+import subprocess
+import sys
 import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from converters.base import ConfidenceLevel, ExtractionResult
+from converters.base import BaseConverter, ConfidenceLevel, ExtractionResult
 from converters.docling_converter import DoclingConverter
+from converters.draft_converter import TextLayerDraftConverter
+from converters.document_store import (
+    DOCUMENTS_DIR_NAME,
+    document_filename,
+    save_document,
+)
+from converters.image_prep import (
+    IMAGE_TYPES,
+    PreparedImage,
+    find_duplicates,
+    prepare_image,
+    textless_result,
+)
+from converters.native_converter import CsvConverter, DocxConverter, HtmlConverter
+from converters.lazy import LazyPolicy
+from converters.manifest import (
+    build_markdown,
+    json_lock,
+    manifest_entry,
+    write_json_atomic,
+)
+from converters.page_cache import CACHE_DIR_NAME, PageCache
+from converters.profiles import (
+    DEFAULT_PROFILE,
+    ConversionProfile,
+    get_profile,
+    resolve_profile,
+)
+from converters.redactor import get_backend as redaction_backend_in_use
+from converters.redactor import get_cascade as redaction_cascade_in_use
 from converters.redactor import redact_converted_folder
+from converters.redactor import set_backend as set_redaction_backend
+from converters.redactor import set_cascade as set_redaction_cascade
+from converters.resources import configure as configure_threads
 from converters.scanner import FileEntry, FileType, ScanResult, scan_folder
+from converters.spreadsheet_converter import SpreadsheetConverter
+from converters.workspace import work_dir
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +72,13 @@ CONVERTED_DIR_NAME = "_converted"
 # Name of the manifest file written inside the staging subfolder.
 MANIFEST_FILENAME = "manifest.json"
 
+# Log of the background refinement process started in progressive mode.
+REFINE_LOG_FILENAME = "refine.log"
+
+# Subfolders of ``_converted/`` where earlier versions kept unredacted data;
+# it now lives in the folder's work folder (see converters.workspace).
+_LEGACY_UNREDACTED_DIRS: tuple[str, ...] = ("_documents", "_cache")
+
 
 def print_status_report(result: PipelineResult, verbose: bool = True) -> None:
     """Print a detailed human-readable status report.
@@ -59,6 +105,7 @@ def print_status_report(result: PipelineResult, verbose: bool = True) -> None:
     print(f"Folder: {result.root}")
     print(f"Processing time: {result.elapsed_seconds:.1f} seconds")
     print(f"Conversion engine: Docling (fully offline)")
+    print(f"Conversion profile: {result.profile}")
     print()
 
     total = result.total_files
@@ -75,6 +122,20 @@ def print_status_report(result: PipelineResult, verbose: bool = True) -> None:
         print(f"  ✗ Failed to convert: {failed}")
     if skipped > 0:
         print(f"  - Skipped (unsupported type): {skipped}")
+    if result.deferred_page_count > 0:
+        print(
+            f"  … Deferred pages (lazy mode): {result.deferred_page_count} "
+            "-- convert on demand with `python -m converters.deferred`"
+        )
+    if result.duplicate_count > 0:
+        print(
+            f"  ≈ Near-duplicate images (not converted): {result.duplicate_count}"
+        )
+    if result.pending_count > 0:
+        print(
+            f"  … Refining in background: {result.pending_count} "
+            f"(drafts are replaced as Docling finishes; see {REFINE_LOG_FILENAME})"
+        )
     print()
 
     # Redaction summary
@@ -105,7 +166,7 @@ def print_status_report(result: PipelineResult, verbose: bool = True) -> None:
         return
 
     # Failed conversions
-    failed_files = [f for f in result.files if not f.success and f.converter is not None]
+    failed_files = result.failed_files
     if failed_files:
         print("FAILED CONVERSIONS")
         print("-" * 70)
@@ -212,6 +273,23 @@ class ConvertedFile:
         size_bytes: Original file size in bytes.
         page_count: Number of pages/sheets extracted, or 0.
         elapsed_seconds: Wall-clock seconds the conversion took.
+        profile: Name of the conversion profile used, or None if the file
+            was not converted.
+        document_path: Absolute path to the serialized DoclingDocument
+            (see :mod:`converters.document_store`), or None if it was not
+            saved.
+        pages_reused: PDF pages loaded from the page cache, or None if the
+            page cache was not used for this file.
+        pages_converted: PDF pages converted by Docling on this run, or
+            None if the page cache was not used for this file.
+        deferred_pages: Inclusive ``[first, last]`` page ranges that lazy
+            mode left unconverted (see :mod:`converters.deferred`), or None.
+        refinement: Progressive mode only: ``"pending"`` while the Docling
+            conversion is queued behind a draft (or behind nothing, for
+            files that cannot be drafted), then ``"done"`` or ``"failed"``
+            (see :mod:`converters.refine`).  None otherwise.
+        duplicate_of: For an image skipped as a near-duplicate of an
+            earlier one, that image's relative path; otherwise None.
     """
 
     original_path: str
@@ -228,6 +306,13 @@ class ConvertedFile:
     size_bytes: int
     page_count: int
     elapsed_seconds: float
+    profile: str | None = None
+    document_path: str | None = None
+    pages_reused: int | None = None
+    pages_converted: int | None = None
+    deferred_pages: list[list[int]] | None = None
+    refinement: str | None = None
+    duplicate_of: str | None = None
 
 
 @dataclass
@@ -241,10 +326,16 @@ class PipelineResult:
         files: Record for every file encountered (supported and unsupported).
         total_files: Total number of files encountered.
         converted_count: Number of files successfully converted.
-        failed_count: Number of files where conversion was attempted but failed.
+        failed_count: Number of files where conversion was attempted but
+            failed (files still waiting for background refinement and
+            near-duplicate images are not counted).
         skipped_count: Number of unsupported files that were skipped.
         elapsed_seconds: Total wall-clock time for the entire pipeline.
         redaction_summary: Summary of PII redaction results.
+        profile: Name of the run-wide conversion profile.
+        profile_overrides: Per-file-type profile overrides for this run.
+        thread_settings: How the run's CPU core budget was split between
+            model threads (see :mod:`converters.resources`).
     """
 
     root: Path
@@ -253,6 +344,9 @@ class PipelineResult:
     files: list[ConvertedFile] = field(default_factory=list)
     elapsed_seconds: float = 0.0
     redaction_summary: dict[str, Any] = field(default_factory=dict)
+    profile: str = DEFAULT_PROFILE
+    profile_overrides: dict[str, str] = field(default_factory=dict)
+    thread_settings: dict[str, int] = field(default_factory=dict)
 
     @property
     def total_files(self) -> int:
@@ -262,17 +356,44 @@ class PipelineResult:
     def converted_count(self) -> int:
         return sum(1 for f in self.files if f.success)
 
+    @property
+    def failed_files(self) -> list[ConvertedFile]:
+        """Files that could not be converted (not pending or duplicates)."""
+        return [
+            f for f in self.files
+            if not f.success
+            and f.converter is not None
+            and f.refinement != "pending"
+            and f.duplicate_of is None
+        ]
+
     @property
     def failed_count(self) -> int:
-        return sum(
-            1 for f in self.files
-            if not f.success and f.converter is not None
-        )
+        return len(self.failed_files)
+
+    @property
+    def duplicate_count(self) -> int:
+        """Images skipped as near-duplicates of another image."""
+        return sum(1 for f in self.files if f.duplicate_of is not None)
+
+    @property
+    def pending_count(self) -> int:
+        """Files queued for background Docling refinement."""
+        return sum(1 for f in self.files if f.refinement == "pending")
 
     @property
     def skipped_count(self) -> int:
         return sum(1 for f in self.files if f.converter is None)
 
+    @property
+    def deferred_page_count(self) -> int:
+        """Total PDF pages deferred by lazy mode across all files."""
+        return sum(
+            last - first + 1
+            for f in self.files
+            for first, last in (f.deferred_pages or [])
+        )
+
     @property
     def low_confidence_count(self) -> int:
         """Count of successfully converted files with low confidence."""
@@ -299,10 +420,36 @@ class PipelineResult:
 # Module-level Docling converter instance (reused across calls).
 _docling_converter = DoclingConverter()
 
+# Converter instances keyed by the class name the scanner assigns.
+_CONVERTERS: dict[str, BaseConverter] = {
+    "DoclingConverter": _docling_converter,
+    "CsvConverter": CsvConverter(),
+    "HtmlConverter": HtmlConverter(),
+    "DocxConverter": DocxConverter(),
+    "SpreadsheetConverter": SpreadsheetConverter(),
+}
+
+# Writes the instant drafts in progressive mode.
+_draft_converter = TextLayerDraftConverter()
+
 
 def convert_folder(
     folder_path: str | Path,
     api_key: str | None = None,
+    profile: str | None = None,
+    profile_overrides: dict[str, str] | None = None,
+    save_documents: bool = False,
+    use_page_cache: bool = True,
+    lazy: bool = False,
+    progressive: bool = False,
+    prepare_images: bool = True,
+    cpu_cores: int | None = None,
+    redaction_backend: str | None = None,
+    redaction_screen_model: str | None = None,
+    force_redaction: bool = False,
+    redaction_cache: bool = True,
+    redaction_workers: int = 1,
+    index_entities: bool = False,
 ) -> PipelineResult:
     """Scan an opportunity folder, convert all supported files, and redact PII.
 
@@ -310,7 +457,10 @@ def convert_folder(
 
     1. Scans the folder using :func:`~converters.scanner.scan_folder`.
     2. Creates a ``_converted/`` subfolder for staging output.
-    3. Runs each supported file through Docling (fully offline).
+    3. Runs the supported files through Docling in batches (see
+       :meth:`~converters.docling_converter.DoclingConverter.convert_many`),
+       or through a native converter for CSV/HTML/DOCX when the folder
+       needs no layout analysis (fully offline either way).
     4. Writes converted text as individual markdown files.
     5. Runs PII redaction on all converted files (fully offline).
     6. Records unsupported files in the manifest without converting.
@@ -323,6 +473,80 @@ def convert_folder(
     api_key:
         Ignored. Kept for backward compatibility with existing callers.
         Conversion is now fully offline via Docling.
+    profile:
+        Conversion profile for the run: ``"fast"``, ``"balanced"``
+        (default), or ``"accurate"``.  See :mod:`converters.profiles`.
+    profile_overrides:
+        Optional per-file-type profiles keyed by file type label, e.g.
+        ``{"pptx": "fast", "pdf": "accurate"}``.
+    save_documents:
+        Also store each Docling conversion's structured document as
+        compressed JSON so other exports can be regenerated later without
+        re-converting (see :mod:`converters.document_store`).  The stored
+        documents are not redacted, so they go to the folder's work folder
+        outside ``_converted/`` (see :mod:`converters.workspace`).
+    use_page_cache:
+        Cache Docling's output per PDF page and reuse it for pages whose
+        content has not changed, so a revised PDF only converts its new or
+        edited pages (see :mod:`converters.page_cache`).  Cached pages are
+        not redacted, so the cache is kept in the folder's work folder
+        outside ``_converted/`` (see :mod:`converters.workspace`).
+    lazy:
+        Convert only the leading and keyword-matching pages of very large
+        PDFs; the rest are listed as ``deferred_pages`` in the manifest and
+        converted on demand with ``python -m converters.deferred`` (see
+        :mod:`converters.lazy`).
+    progressive:
+        Instead of waiting for Docling, write a draft of each born-digital
+        PDF from its text layer right away (``method="text-layer-draft"``)
+        and return.  A background process (:mod:`converters.refine`) then
+        converts every Docling file and replaces each draft as soon as its
+        refined version lands, updating the manifest atomically each time.
+        Files that cannot be drafted are listed with
+        ``refinement="pending"`` until then.
+    prepare_images:
+        Orient and downscale photos and image scans before OCR, record
+        images without text without OCR'ing them, and skip near-duplicate
+        images (listed with ``duplicate_of``).  In progressive mode the
+        background refinement orients and downscales the images it
+        converts the same way.  See :mod:`converters.image_prep`.
+    cpu_cores:
+        CPU cores Docling, OCR and GLiNER may use between them.  None for
+        ``DD_CPU_CORES`` or every available core.  Each model's thread
+        pools are sized from this budget instead of claiming every core
+        (see :mod:`converters.resources`).
+    redaction_backend:
+        GLiNER inference backend for PII redaction: ``"torch"`` or
+        ``"onnx"`` (int8-quantized, faster on CPU).  None keeps the
+        process's current choice (``DD_REDACTION_BACKEND``, else
+        ``"torch"``).  See :mod:`converters.redactor`.
+    redaction_screen_model:
+        Small GLiNER model that screens chunks before the full PII model
+        reads them (a two-stage cascade), or ``""`` to send every chunk to
+        the full model.  None keeps the process's current choice
+        (``DD_REDACTION_SCREEN_MODEL``, else no cascade).
+    force_redaction:
+        Redact every converted file again.  By default, files whose content
+        and redaction settings are unchanged since the last run are skipped
+        (see :func:`~converters.redactor.redact_converted_folder`).
+    redaction_cache:
+        Keep GLiNER's detections per chunk of text on disk, in the folder's
+        work folder, so boilerplate already read in an earlier run is not
+        read again (see :mod:`converters.detection_cache`).  Entries hold
+        offsets and labels, never text.  With False, detections are only
+        shared within this run.
+    redaction_workers:
+        Processes GLiNER runs in during redaction.  They share the loaded
+        model and split the *cpu_cores* budget between them; the redacted
+        files and report are the same for any count.
+    index_entities:
+        Have the redaction pass also extract organizations, people,
+        addresses, parcel numbers and utilities into
+        ``_converted/entity-index.json`` (type, normalized value, file and
+        offset of each).  GLiNER then reads every file in full instead of
+        only the text around ID-shaped tokens.  Progressive refinement and
+        :mod:`converters.deferred` keep the index up to date for the files
+        they write.
 
     Returns
     -------
@@ -332,36 +556,129 @@ def convert_folder(
     """
     pipeline_start = time.monotonic()
 
+    # Validate profile names up front rather than failing mid-run.
+    run_profile = get_profile(profile)
+    overrides = dict(profile_overrides or {})
+    for override in overrides.values():
+        get_profile(override)
+    threads = configure_threads(cpu_cores)
+    if redaction_backend is not None:
+        set_redaction_backend(redaction_backend)
+    if redaction_screen_model is not None:
+        set_redaction_cascade(redaction_screen_model)
+
     scan = scan_folder(folder_path)
     converted_dir = scan.root / CONVERTED_DIR_NAME
     converted_dir.mkdir(exist_ok=True)
 
     manifest_path = converted_dir / MANIFEST_FILENAME
+    _remove_unredacted_dirs(converted_dir)
+    folder_work_dir = work_dir(scan.root)
+    documents_dir = folder_work_dir / DOCUMENTS_DIR_NAME if save_documents else None
+    cache_dir = folder_work_dir / CACHE_DIR_NAME
+    if use_page_cache or lazy:
+        docling = DoclingConverter(
+            page_cache=(
+                PageCache(cache_dir / "pages")
+                if use_page_cache
+                else None
+            ),
+            lazy=LazyPolicy() if lazy else None,
+        )
+    else:
+        docling = _docling_converter
 
     result = PipelineResult(
         root=scan.root,
         converted_dir=converted_dir,
         manifest_path=manifest_path,
+        profile=run_profile.name,
+        profile_overrides=overrides,
+        thread_settings=threads.as_dict(),
     )
 
     # Track filenames to handle duplicates within the staging folder.
     used_filenames: dict[str, int] = {}
 
-    # --- Phase 1: Convert all files via Docling ---
+    # --- Phase 1: Convert all files ---
+    # Output filenames are assigned in scan order, so they do not depend on
+    # the order in which batched Docling conversions finish.
+    records: dict[Path, ConvertedFile] = {}
+    docling_batches: dict[ConversionProfile, list[tuple[FileEntry, Path]]] = {}
+    images: dict[Path, PreparedImage] = {}
+    duplicates: dict[Path, Path] = {}
+    if prepare_images:
+        images, duplicates = _prepare_images(
+            scan.files, cache_dir / "images"
+        )
+    entries = {entry.path: entry for entry in scan.files}
     for entry in scan.files:
-        file_record = _process_file(entry, converted_dir, used_filenames)
-        result.files.append(file_record)
+        if entry.path in duplicates:
+            records[entry.path] = _duplicate_record(
+                entry, entries[duplicates[entry.path]].relative_path
+            )
+        elif entry.converter == "DoclingConverter":
+            entry_profile = resolve_profile(
+                entry.file_type.value, run_profile, overrides
+            )
+            output_path = converted_dir / _unique_filename(
+                _safe_filename(entry.relative_path), used_filenames
+            )
+            image = images.get(entry.path)
+            if image is not None and not image.has_text:
+                records[entry.path] = record_extraction(
+                    entry, output_path, textless_result(image), 0.0, None
+                )
+                continue
+            docling_batches.setdefault(entry_profile, []).append(
+                (entry, output_path)
+            )
+        else:
+            records[entry.path] = _process_file(
+                entry, converted_dir, used_filenames, documents_dir=documents_dir
+            )
+
+    sources = {
+        path: image.path for path, image in images.items() if image.path != path
+    }
+    for entry_profile, batch in docling_batches.items():
+        if progressive:
+            for entry, output_path in batch:
+                records[entry.path] = _draft_file(
+                    entry, output_path, entry_profile.name
+                )
+            continue
+        for entry, file_record in _convert_docling_batch(
+            docling, batch, entry_profile, documents_dir, sources
+        ):
+            records[entry.path] = file_record
+
+    result.files = [records[entry.path] for entry in scan.files]
 
     # --- Phase 2: Redact PII from converted markdown files ---
     if result.converted_count > 0:
         logger.info("Starting PII redaction on %d converted files...", result.converted_count)
         print("\nRunning PII redaction (offline, local model)...")
-        redaction_report = redact_converted_folder(converted_dir)
+        redaction_report = redact_converted_folder(
+            converted_dir,
+            cache_dir=(
+                cache_dir / "redaction" if redaction_cache else None
+            ),
+            force=force_redaction,
+            workers=redaction_workers,
+            index=index_entities,
+        )
         result.redaction_summary = {
             "files_scanned": redaction_report.files_scanned,
+            "files_skipped": redaction_report.files_skipped,
             "files_redacted": redaction_report.files_redacted,
             "total_entities_redacted": redaction_report.total_entities,
             "entities_by_type": redaction_report.entities_by_type,
+            "chars_per_second": round(redaction_report.chars_per_second),
+            "cache_hit_rate": round(redaction_report.cache_hit_rate, 4),
+            "entities_indexed": redaction_report.entities_indexed,
+            "backend": redaction_backend_in_use(),
+            "screen_model": redaction_cascade_in_use(),
         }
 
     result.elapsed_seconds = time.monotonic() - pipeline_start
@@ -369,6 +686,20 @@ def convert_folder(
     # Write the manifest.
     _write_manifest(result)
 
+    # --- Phase 3 (progressive mode): refine drafts in the background ---
+    if result.pending_count > 0:
+        _start_refinement(
+            result.root,
+            save_documents=save_documents,
+            use_page_cache=use_page_cache,
+            lazy=lazy,
+            prepare_images=prepare_images,
+            cpu_cores=threads.cores,
+            redaction_backend=redaction_backend_in_use(),
+            screen_model=redaction_cascade_in_use(),
+            index_entities=index_entities,
+        )
+
     logger.info(
         "Pipeline complete: %d converted, %d failed, %d skipped in %.1fs",
         result.converted_count,
@@ -383,16 +714,28 @@ def convert_folder(
     return result
 
 
+def _remove_unredacted_dirs(converted_dir: Path) -> None:
+    """Delete unredacted data that older runs kept inside *converted_dir*."""
+    for name in _LEGACY_UNREDACTED_DIRS:
+        path = converted_dir / name
+        if path.is_dir():
+            logger.info("Removing unredacted %s from %s", name, converted_dir)
+            shutil.rmtree(path, ignore_errors=True)
+
+
 def _process_file(
     entry: FileEntry,
     converted_dir: Path,
     used_filenames: dict[str, int],
+    profile: ConversionProfile | None = None,
+    documents_dir: Path | None = None,
 ) -> ConvertedFile:
     """Convert a single file and write the result to the staging folder.
 
     Unsupported files are recorded with ``success=False`` and no
     conversion is attempted.  Converter errors are caught and recorded
-    without stopping the pipeline.
+    without stopping the pipeline.  When *documents_dir* is given, the
+    converter's structured document (if any) is saved there too.
     """
     # Handle unsupported files.
     if entry.converter is None:
@@ -419,10 +762,22 @@ def _process_file(
     unique_name = _unique_filename(base_name, used_filenames)
     output_path = converted_dir / unique_name
 
-    # Run the Docling converter.
+    converter = _CONVERTERS[entry.converter]
+    # Profiles only apply to Docling; native converters have no knobs.
+    profile = (
+        get_profile(profile) if isinstance(converter, DoclingConverter) else None
+    )
+    profile_name = profile.name if profile is not None else None
+
+    # Run the converter the scanner picked.
     start = time.monotonic()
     try:
-        extraction: ExtractionResult = _docling_converter.convert(entry.path)
+        if profile is not None:
+            extraction: ExtractionResult = converter.convert(
+                entry.path, profile=profile
+            )
+        else:
+            extraction = converter.convert(entry.path)
     except Exception as exc:
         elapsed = time.monotonic() - start
         logger.error(
@@ -443,10 +798,210 @@ def _process_file(
             size_bytes=entry.size_bytes,
             page_count=0,
             elapsed_seconds=round(elapsed, 3),
+            profile=profile_name,
         )
 
     elapsed = time.monotonic() - start
 
+    return record_extraction(
+        entry, output_path, extraction, elapsed, profile_name, documents_dir
+    )
+
+
+def _convert_docling_batch(
+    converter: DoclingConverter,
+    batch: list[tuple[FileEntry, Path]],
+    profile: ConversionProfile,
+    documents_dir: Path | None = None,
+    sources: dict[Path, Path] | None = None,
+) -> Iterator[tuple[FileEntry, ConvertedFile]]:
+    """Convert *batch* with *converter*'s :meth:`~DoclingConverter.convert_many`.
+
+    *batch* pairs each entry with its (already unique) output path.  Yields
+    each entry with its record as Docling finishes it.  Documents in a
+    batch are converted together, so a file's elapsed time is the time
+    since the previous file finished.  *sources* maps an entry's path to
+    the file to convert in its place (a pre-processed image).
+    """
+    sources = sources or {}
+    paths = [sources.get(entry.path, entry.path) for entry, _ in batch]
+    pending = {
+        path.resolve(): item for path, item in zip(paths, batch)
+    }
+    start = time.monotonic()
+    for extraction in converter.convert_many(paths, profile=profile):
+        elapsed = time.monotonic() - start
+        entry, output_path = pending.pop(extraction.source_path)
+        extraction.source_path = entry.path
+        yield entry, record_extraction(
+            entry, output_path, extraction, elapsed, profile.name, documents_dir
+        )
+        start = time.monotonic()
+
+
+def _prepare_images(
+    entries: list[FileEntry],
+    work_dir: Path,
+) -> tuple[dict[Path, PreparedImage], dict[Path, Path]]:
+    """Pre-process the images bound for Docling and find near-duplicates.
+
+    Returns the prepared images and a map of each duplicate's path to the
+    path of the image it duplicates, both keyed by ``FileEntry.path``.
+    """
+    prepared: dict[Path, PreparedImage] = {}
+    for entry in entries:
+        if entry.file_type in IMAGE_TYPES and entry.converter == "DoclingConverter":
+            image = prepare_image(entry.path, work_dir)
+            if image is not None:
+                prepared[entry.path] = image
+
+    by_source = {image.source: path for path, image in prepared.items()}
+    duplicates = {
+        by_source[duplicate]: by_source[original]
+        for duplicate, original in find_duplicates(list(prepared.values())).items()
+    }
+    if prepared:
+        logger.info(
+            "Prepared %d images: %d without text, %d near-duplicates",
+            len(prepared),
+            sum(1 for image in prepared.values() if not image.has_text),
+            len(duplicates),
+        )
+    return prepared, duplicates
+
+
+def _duplicate_record(entry: FileEntry, original: Path) -> ConvertedFile:
+    """Record an image skipped as a near-duplicate of *original*."""
+    logger.info("Skipping %s: near-duplicate of %s", entry.relative_path, original)
+    return ConvertedFile(
+        original_path=str(entry.path),
+        relative_path=str(entry.relative_path),
+        converted_path=None,
+        converted_filename=None,
+        file_type=entry.file_type.value,
+        converter=entry.converter,
+        method=None,
+        success=False,
+        confidence="low",
+        confidence_reason=f"near-duplicate of {original}",
+        error=None,
+        size_bytes=entry.size_bytes,
+        page_count=0,
+        elapsed_seconds=0.0,
+        duplicate_of=str(original),
+    )
+
+
+def _draft_file(
+    entry: FileEntry,
+    output_path: Path,
+    profile_name: str,
+) -> ConvertedFile:
+    """Write a text-layer draft of a Docling-bound file and queue refinement.
+
+    Only born-digital PDFs can be drafted.  Everything else is recorded as
+    not yet converted; its output filename is reserved in the record so the
+    refinement lands under the same name.
+    """
+    start = time.monotonic()
+    if entry.file_type == FileType.PDF:
+        extraction = _draft_converter.convert(entry.path)
+        if extraction.success:
+            record = record_extraction(
+                entry, output_path, extraction, time.monotonic() - start,
+                profile_name,
+            )
+            record.refinement = "pending"
+            return record
+
+    return ConvertedFile(
+        original_path=str(entry.path),
+        relative_path=str(entry.relative_path),
+        converted_path=None,
+        converted_filename=output_path.name,
+        file_type=entry.file_type.value,
+        converter=entry.converter,
+        method=None,
+        success=False,
+        confidence="low",
+        confidence_reason="awaiting background Docling conversion",
+        error=None,
+        size_bytes=entry.size_bytes,
+        page_count=0,
+        elapsed_seconds=0.0,
+        profile=profile_name,
+        refinement="pending",
+    )
+
+
+def _start_refinement(
+    root: Path,
+    save_documents: bool = False,
+    use_page_cache: bool = True,
+    lazy: bool = False,
+    prepare_images: bool = True,
+    cpu_cores: int | None = None,
+    redaction_backend: str | None = None,
+    screen_model: str | None = None,
+    index_entities: bool = False,
+) -> None:
+    """Launch ``python -m converters.refine`` detached from this process.
+
+    Output goes to ``_converted/refine.log``.  The refinement outlives the
+    caller, so agents can read drafts while it runs.
+    """
+    command = [sys.executable, "-m", "converters.refine", str(root)]
+    if save_documents:
+        command.append("--save-documents")
+    if not use_page_cache:
+        command.append("--no-page-cache")
+    if lazy:
+        command.append("--lazy")
+    if not prepare_images:
+        command.append("--no-image-prep")
+    if cpu_cores is not None:
+        command.extend(["--cpu-cores", str(cpu_cores)])
+    if redaction_backend is not None:
+        command.extend(["--redaction-backend", redaction_backend])
+    if screen_model is not None:
+        command.extend(["--screen-model", screen_model])
+    if index_entities:
+        command.append("--index-entities")
+
+    log_path = root / CONVERTED_DIR_NAME / REFINE_LOG_FILENAME
+    with open(log_path, "ab") as log:
+        process = subprocess.Popen(
+            command,
+            cwd=Path(__file__).resolve().parent.parent,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    logger.info("Background refinement started (pid %d): %s", process.pid, log_path)
+
+
+def record_extraction(
+    entry: FileEntry,
+    output_path: Path,
+    extraction: ExtractionResult,
+    elapsed: float,
+    profile_name: str | None,
+    documents_dir: Path | None = None,
+    redact: Callable[[Path], Any] | None = None,
+) -> ConvertedFile:
+    """Write a successful extraction to *output_path* and build its record.
+
+    Failed extractions are recorded without writing an output file.  When
+    *documents_dir* is given and the extraction carries a structured
+    document, it is serialized there alongside the markdown.
+
+    The markdown is written to a temporary file and renamed over
+    *output_path*, so readers never see a partial file.  *redact*, if
+    given, is called on the temporary file first (used when replacing a
+    file that agents may already be reading, as :mod:`converters.refine`
+    does).
+    """
     # If the converter reports failure, record it but don't write an output file.
     if not extraction.success:
         logger.warning(
@@ -469,16 +1024,35 @@ def _process_file(
             size_bytes=entry.size_bytes,
             page_count=extraction.page_count,
             elapsed_seconds=round(elapsed, 3),
+            profile=profile_name,
         )
 
     # Write the converted markdown file with a metadata header.
-    markdown_content = _build_markdown(entry, extraction)
-    output_path.write_text(markdown_content, encoding="utf-8")
+    markdown_content = build_markdown(entry, extraction)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.write_text(markdown_content, encoding="utf-8")
+    if redact is not None:
+        redact(tmp_path)
+    os.replace(tmp_path, output_path)
+
+    document_path: Path | None = None
+    if documents_dir is not None and extraction.document is not None:
+        try:
+            document_path = save_document(
+                extraction.document,
+                documents_dir / document_filename(output_path.name),
+            )
+        except Exception as exc:
+            # The markdown is already written; a missing document only
+            # means later exports need a fresh conversion.
+            logger.warning(
+                "Could not save document for %s: %s", entry.relative_path, exc
+            )
 
     logger.info(
         "Converted %s -> %s (%s, %s confidence)",
         entry.relative_path,
-        unique_name,
+        output_path.name,
         extraction.method,
         extraction.confidence.value,
     )
@@ -487,7 +1061,7 @@ def _process_file(
         original_path=str(entry.path),
         relative_path=str(entry.relative_path),
         converted_path=str(output_path),
-        converted_filename=unique_name,
+        converted_filename=output_path.name,
         file_type=entry.file_type.value,
         converter=entry.converter,
         method=extraction.method,
@@ -498,36 +1072,14 @@ def _process_file(
         size_bytes=entry.size_bytes,
         page_count=extraction.page_count,
         elapsed_seconds=round(elapsed, 3),
+        profile=profile_name,
+        document_path=str(document_path) if document_path is not None else None,
+        pages_reused=extraction.metadata.get("pages_reused"),
+        pages_converted=extraction.metadata.get("pages_converted"),
+        deferred_pages=extraction.metadata.get("deferred_pages"),
     )
 
 
-def _build_markdown(entry: FileEntry, extraction: ExtractionResult) -> str:
-    """Build the final markdown content with a metadata header.
-
-    The header gives agents context about the source file without needing
-    to read the manifest separately.
-    """
-    header_lines = [
-        f"# {entry.relative_path}",
-        "",
-        f"- **Source:** `{entry.relative_path}`",
-        f"- **Type:** {entry.file_type.value}",
-        f"- **Method:** {extraction.method}",
-        f"- **Confidence:** {extraction.confidence.value} -- {extraction.confidence_reason}",
-    ]
-    if extraction.page_count > 0:
-        label = "pages" if entry.file_type == FileType.PDF else "sheets/slides"
-        header_lines.append(f"- **Pages:** {extraction.page_count} {label}")
-    if extraction.is_scanned:
-        header_lines.append("- **Note:** Scanned/image-based document (OCR extracted locally)")
-
-    header_lines.append("")
-    header_lines.append("---")
-    header_lines.append("")
-
-    return "\n".join(header_lines) + extraction.text + "\n"
-
-
 def _unique_filename(base_name: str, used: dict[str, int]) -> str:
     """Ensure a filename is unique within the staging folder.
 
@@ -552,6 +1104,7 @@ def _write_manifest(result: PipelineResult) -> None:
     what failed.  Agents read this file to know which documents are
     available and how reliable each extraction is.
     """
+    profiles_used = sorted({result.profile, *result.profile_overrides.values()})
     manifest: dict[str, Any] = {
         "opportunity_folder": str(result.root),
         "converted_dir": str(result.converted_dir),
@@ -560,34 +1113,22 @@ def _write_manifest(result: PipelineResult) -> None:
             "converted": result.converted_count,
             "failed": result.failed_count,
             "skipped_unsupported": result.skipped_count,
+            "duplicate_images": result.duplicate_count,
             "elapsed_seconds": round(result.elapsed_seconds, 3),
         },
+        "conversion_profile": {
+            "default": result.profile,
+            "overrides": result.profile_overrides,
+            "settings": {
+                name: get_profile(name).cache_key for name in profiles_used
+            },
+        },
+        "thread_settings": result.thread_settings,
         "redaction_summary": result.redaction_summary,
-        "files": [],
+        "files": [manifest_entry(f) for f in result.files],
     }
-
-    for f in result.files:
-        entry: dict[str, Any] = {
-            "original_path": f.original_path,
-            "relative_path": f.relative_path,
-            "converted_path": f.converted_path,
-            "converted_filename": f.converted_filename,
-            "file_type": f.file_type,
-            "converter": f.converter,
-            "method": f.method,
-            "success": f.success,
-            "confidence": f.confidence,
-            "confidence_reason": f.confidence_reason,
-            "error": f.error,
-            "size_bytes": f.size_bytes,
-            "page_count": f.page_count,
-            "elapsed_seconds": f.elapsed_seconds,
-        }
-        manifest["files"].append(entry)
-
-    result.manifest_path.write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Background refinement may be updating the previous run's manifest.
+    with json_lock(result.manifest_path):
+        write_json_atomic(result.manifest_path, manifest)
 
     logger.info("Manifest written: %s", result.manifest_path)
@@ -7,6 +7,25 @@ A regex fallback catches structured patterns (EINs, SSNs, etc.) that NER
 models sometimes miss.
 
 All processing is local -- the GLiNER model runs on CPU, no API calls.
+It runs either as the full-precision PyTorch checkpoint (``torch``, the
+default) or as an int8-quantized ONNX export under ONNX Runtime (``onnx``,
+several times faster on CPU-only hosts).  The ONNX model is exported once
+and cached under ``~/.cache/dc-due-diligence`` (``DD_MODEL_CACHE``).  The
+backend is chosen with :func:`set_backend` or ``DD_REDACTION_BACKEND``;
+``benchmarks/bench_redaction.py`` compares the two.
+
+Two cheaper stages can run before it.  A regex candidate gate keeps text
+without ID-shaped tokens away from the model entirely, and an optional
+cascade (:func:`set_cascade`) lets a small GLiNER model screen the
+remaining chunks at a low threshold so only flagged ones reach the full
+model (``benchmarks/bench_cascade.py`` measures the recall cost).  Chunks
+already seen -- page headers, footers, disclaimers -- are answered from a
+detection cache (:mod:`converters.detection_cache`) instead.
+
+The same forward passes can also extract what is preserved: with indexing
+on, GLiNER is asked for organizations, people, addresses, parcel numbers
+and utilities as well, and :func:`redact_converted_folder` lists them in
+an ``entity-index.json`` for the agents instead of replacing them.
 
 Design decisions:
 - **Redact**: bank accounts, routing numbers, EINs/TINs, SSNs, credit cards,
@@ -18,12 +37,23 @@ Design decisions:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import re
+import shutil
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+from converters.detection_cache import DetectionCache, normalize
+from converters.manifest import json_lock, write_json_atomic
+from converters.resources import apply_thread_settings, configure, thread_settings
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +61,29 @@ logger = logging.getLogger(__name__)
 # Configuration
 # ---------------------------------------------------------------------------
 
+# GLiNER checkpoint used for PII detection.
+_MODEL_NAME = "urchade/gliner_multi_pii-v1"
+
+# Inference backends for the model, the environment variable selecting one,
+# and the default.
+REDACTION_BACKENDS: tuple[str, ...] = ("torch", "onnx")
+REDACTION_BACKEND_ENV = "DD_REDACTION_BACKEND"
+_DEFAULT_BACKEND = "torch"
+
+# Optional first stage of a two-stage cascade: a small GLiNER model screens
+# every chunk at a low threshold and only flagged chunks go on to
+# _MODEL_NAME.  Off unless a screening model is configured (set_cascade()
+# or DD_REDACTION_SCREEN_MODEL); _DEFAULT_SCREEN_MODEL is the suggested one.
+SCREEN_MODEL_ENV = "DD_REDACTION_SCREEN_MODEL"
+_DEFAULT_SCREEN_MODEL = "urchade/gliner_small-v2.1"
+_SCREEN_THRESHOLD: float = 0.1
+
+# Where exported models are cached (``DD_MODEL_CACHE`` overrides), and the
+# int8 ONNX file within the export.
+MODEL_CACHE_ENV = "DD_MODEL_CACHE"
+_DEFAULT_MODEL_CACHE = Path.home() / ".cache" / "dc-due-diligence"
+_ONNX_MODEL_FILE = "model_quantized.onnx"
+
 # GLiNER entity labels to detect (only the ones we want to REDACT).
 _REDACT_LABELS: list[str] = [
     "social security number",
@@ -49,9 +102,51 @@ _REDACT_LABELS: list[str] = [
 # 0.3 is recommended for PII where recall matters more than precision.
 _THRESHOLD: float = 0.3
 
-# Maximum characters per chunk for GLiNER (model limit ~384 tokens).
-_CHUNK_MAX_CHARS: int = 1000
-_CHUNK_OVERLAP: int = 200
+# GLiNER reads text as words (its default splitter, below) and truncates
+# past config.max_len of them; the encoder under it also stops at
+# _ENCODER_MAX_TOKENS subwords, label prompt included.  Chunks are packed up
+# to both limits, taken from the loaded model where it reports them.
+_WORD_PATTERN: re.Pattern[str] = re.compile(r"\w+(?:[-_]\w+)*|\S")
+_CHUNK_MAX_WORDS: int = 384
+_ENCODER_MAX_TOKENS: int = 512
+
+# Words repeated across a chunk boundary: enough for the longest value we
+# redact (an IBAN in 4-character groups is up to 9 words) plus its label.
+_CHUNK_OVERLAP_WORDS: int = 12
+
+# Chunks per GLiNER forward pass.  Chunks from every file in a folder are
+# pooled and sorted by length before batching, so each batch pads little.
+_BATCH_SIZE: int = 8
+
+# Characters of markdown held in memory at once by redact_converted_folder;
+# files are read and redacted in groups of about this size.
+_GROUP_MAX_CHARS: int = 2_000_000
+
+# Candidate gate: every label we redact needs a digit run (6+ digits,
+# optionally spaced or dashed: short account numbers, "55 01 22"), a mixed
+# letter/digit ID token, dash-separated groups that each hold a digit
+# (licences such as "D123-456", Medicare MBIs such as "1EG4-TE5-MK73"),
+# or -- for CVVs and expiry dates -- a card keyword.  GLiNER only sees
+# windows of _GATE_CONTEXT characters either side of such candidates; prose
+# and narrative tables without one cannot contain anything to redact.
+_CANDIDATE_PATTERN: re.Pattern[str] = re.compile(
+    r"\d(?:[ \-]?\d){5,}"
+    r"|\b(?=[A-Za-z0-9]*\d)(?=[A-Za-z0-9]*[A-Za-z])[A-Za-z0-9]{6,}\b"
+    r"|\b(?=[A-Za-z0-9-]*[A-Za-z])(?=(?:[A-Za-z0-9]-?){6})"
+    r"[A-Za-z]*\d[A-Za-z0-9]*(?:-[A-Za-z]*\d[A-Za-z0-9]*)+\b"
+    r"|\b(?:cvv2?|cvc|csc|security code|exp(?:iry|iration|ires?)?|valid thru)\b",
+    re.IGNORECASE,
+)
+_GATE_CONTEXT: int = 250
+
+# Files larger than _STREAM_MIN_BYTES are redacted as a stream (see
+# _redact_stream), _STREAM_BLOCK_CHARS at a time, so memory stays flat
+# however large the file.  The _STREAM_CONTEXT characters either side of
+# each block boundary are read with both blocks, so no gate window or
+# entity is cut short by the boundary.
+_STREAM_MIN_BYTES: int = 8_000_000
+_STREAM_BLOCK_CHARS: int = 1_000_000
+_STREAM_CONTEXT: int = 4 * _GATE_CONTEXT
 
 # Placeholder format for redacted values.
 _REDACT_FMT = "[REDACTED: {label}]"
@@ -70,24 +165,87 @@ _LABEL_MAP: dict[str, str] = {
     "health insurance id number": "health_insurance_id",
 }
 
+# Entities worth knowing about that are preserved, not redacted.  With
+# indexing on (redact_converted_folder's *index*), GLiNER is asked for these
+# in the same forward passes as the labels above and each one found is
+# listed in ``entity-index.json`` under its friendly name, so agents look
+# owners, utilities and parcels up instead of re-reading every document.
+_INDEX_LABELS: list[str] = [
+    "organization",
+    "person",
+    "address",
+    "parcel number",
+    "utility company",
+]
+_INDEX_LABEL_MAP: dict[str, str] = {
+    "organization": "organization",
+    "person": "person",
+    "address": "address",
+    "parcel number": "parcel_number",
+    "utility company": "utility",
+}
+
+# Index of preserved entities written next to the converted files.
+ENTITY_INDEX_FILENAME = "entity-index.json"
+
+# Punctuation trimmed from indexed values before they are compared.
+_INDEX_VALUE_STRIP = " .,;:!?()[]{}\"'*_#|"
+
 # ---------------------------------------------------------------------------
 # Regex fallback patterns for structured PII
 # ---------------------------------------------------------------------------
 
-_REGEX_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+# One alternation, scanned once: each match is the first alternative that
+# fits at the leftmost position, so matches never overlap.  Group names are
+# the labels; longer shapes come first.
+_REGEX_PATTERN: re.Pattern[str] = re.compile(
+    r"\b(?:"
+    # Credit card: 4 groups of 4 digits separated by spaces or dashes,
+    # or 16 consecutive digits (Visa, MC, Discover)
+    r"(?P<credit_card>\d{4}[-\s]\d{4}[-\s]\d{4}[-\s]\d{4}|[3-6]\d{15})"
+    # IBAN: 2 letter country code + 2 check digits + up to 30 alphanumeric
+    r"|(?P<iban>[A-Z]{2}\d{2}[A-Z0-9]{4,30})"
     # SSN: 123-45-6789 or 123 45 6789
-    ("ssn", re.compile(r"\b\d{3}[-\s]\d{2}[-\s]\d{4}\b")),
+    r"|(?P<ssn>\d{3}[-\s]\d{2}[-\s]\d{4})"
     # EIN: 12-3456789
-    ("ein", re.compile(r"\b\d{2}-\d{7}\b")),
-    # Credit card: 4 groups of 4 digits separated by spaces or dashes
-    ("credit_card", re.compile(r"\b\d{4}[-\s]\d{4}[-\s]\d{4}[-\s]\d{4}\b")),
-    # Credit card: 16 consecutive digits (Visa, MC, Discover)
-    ("credit_card", re.compile(r"\b[3-6]\d{15}\b")),
-    # IBAN: 2 letter country code + 2 check digits + up to 30 alphanumeric
-    ("iban", re.compile(r"\b[A-Z]{2}\d{2}[A-Z0-9]{4,30}\b")),
+    r"|(?P<ein>\d{2}-\d{7})"
     # US bank routing number: 9 digits (starts with 0-3)
-    ("routing_number", re.compile(r"\b[0-3]\d{8}\b")),
-]
+    r"|(?P<routing_number>[0-3]\d{8})"
+    r")\b"
+)
+
+
+def _luhn_valid(value: str) -> bool:
+    """Luhn check digit, as on every payment card number."""
+    total = 0
+    for index, char in enumerate(reversed([c for c in value if c.isdigit()])):
+        digit = int(char)
+        if index % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def _iban_valid(value: str) -> bool:
+    """ISO 13616 mod-97 check: the rearranged IBAN leaves remainder 1."""
+    rearranged = value[4:] + value[:4]
+    return int("".join(str(int(char, 36)) for char in rearranged)) % 97 == 1
+
+
+def _routing_number_valid(value: str) -> bool:
+    """ABA checksum: digits weighted 3, 7, 1 sum to a multiple of 10."""
+    digits = [int(char) for char in value]
+    return sum(w * d for w, d in zip([3, 7, 1] * 3, digits)) % 10 == 0
+
+
+# Labels whose values carry check digits; matches that fail are not PII.
+_REGEX_VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "credit_card": _luhn_valid,
+    "iban": _iban_valid,
+    "routing_number": _routing_number_valid,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -106,6 +264,20 @@ class RedactedEntity:
     source: str  # "gliner" or "regex"
 
 
+@dataclass
+class IndexedEntity:
+    """A preserved entity listed in the entity index.
+
+    ``offset`` and ``length`` locate it in the redacted text.
+    """
+
+    label: str
+    value: str  # normalized for lookup (see _normalize_value)
+    offset: int
+    length: int
+    score: float
+
+
 @dataclass
 class RedactionResult:
     """Result of redacting a single document."""
@@ -114,6 +286,8 @@ class RedactionResult:
     redacted_text: str
     entities_found: int
     entities: list[RedactedEntity] = field(default_factory=list)
+    model_chars: int = 0  # characters GLiNER had to read (see _model_windows)
+    indexed: list[IndexedEntity] = field(default_factory=list)
 
     @property
     def was_redacted(self) -> bool:
@@ -126,59 +300,361 @@ class RedactionReport:
 
     files_scanned: int = 0
     files_redacted: int = 0
+    files_skipped: int = 0  # unchanged since an earlier run
     total_entities: int = 0
     entities_by_type: dict[str, int] = field(default_factory=dict)
     file_details: list[dict[str, Any]] = field(default_factory=list)
+    characters_scanned: int = 0
+    characters_to_model: int = 0
+    cache_hits: int = 0  # chunks answered by the detection cache
+    cache_lookups: int = 0
+    entities_indexed: int = 0  # preserved entities in entity-index.json
+    elapsed_seconds: float = 0.0
+
+    @property
+    def model_skip_rate(self) -> float:
+        """Fraction of characters the candidate gate kept from GLiNER."""
+        if self.characters_scanned <= 0:
+            return 0.0
+        return 1.0 - self.characters_to_model / self.characters_scanned
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of chunks whose detections came from the cache."""
+        if self.cache_lookups <= 0:
+            return 0.0
+        return self.cache_hits / self.cache_lookups
+
+    @property
+    def chars_per_second(self) -> float:
+        """Redaction throughput over the whole folder."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.characters_scanned / self.elapsed_seconds
 
 
 # ---------------------------------------------------------------------------
 # GLiNER model management
 # ---------------------------------------------------------------------------
 
-_model: Any = None
+# Loaded models, keyed by backend.
+_models: dict[str, Any] = {}
+
+# Backend selected with set_backend() (None: environment or default).
+_backend: str | None = None
+
+# Screening model selected with set_cascade() ("" for none, None: environment).
+_screen_model: str | None = None
+
+# Detections per chunk for callers that do not pass their own cache.
+_detection_cache = DetectionCache()
+
+# Worker processes running GLiNER batches while a _worker_pool is open.
+_pool: Any = None
+
+
+def set_backend(backend: str | None) -> str:
+    """Select the GLiNER inference backend for this process.
+
+    Parameters
+    ----------
+    backend:
+        ``"torch"`` or ``"onnx"``; None restores the default
+        (``DD_REDACTION_BACKEND``, else ``"torch"``).
+
+    Returns
+    -------
+    str
+        The backend now in use.
+
+    Raises
+    ------
+    ValueError
+        If *backend* is not a known backend.
+    """
+    global _backend
+    if backend is not None:
+        backend = _validate_backend(backend)
+    _backend = backend
+    return get_backend()
+
+
+def get_backend() -> str:
+    """The GLiNER inference backend in use."""
+    if _backend is not None:
+        return _backend
+    return _validate_backend(
+        os.environ.get(REDACTION_BACKEND_ENV) or _DEFAULT_BACKEND
+    )
+
+
+def _validate_backend(backend: str) -> str:
+    key = backend.strip().lower()
+    if key not in REDACTION_BACKENDS:
+        raise ValueError(
+            f"Unknown redaction backend {backend!r}. "
+            f"Choose one of: {', '.join(REDACTION_BACKENDS)}"
+        )
+    return key
 
 
 def _get_model() -> Any:
-    """Lazily load the GLiNER PII model."""
-    global _model
-    if _model is None:
-        logger.info("Loading GLiNER PII model (first call, downloading if needed)...")
+    """Lazily load the GLiNER PII model for the selected backend."""
+    backend = get_backend()
+    if backend not in _models:
+        logger.info(
+            "Loading GLiNER PII model, %s backend (first call, downloading if needed)...",
+            backend,
+        )
+        # Size torch's and ONNX Runtime's thread pools to the core budget
+        # before inference.
+        apply_thread_settings()
+        if backend == "onnx":
+            _models[backend] = _load_onnx_model()
+        else:
+            from gliner import GLiNER
+
+            _models[backend] = GLiNER.from_pretrained(_MODEL_NAME)
+        logger.info("GLiNER PII model ready.")
+    return _models[backend]
+
+
+def set_cascade(screen_model: str | None) -> str | None:
+    """Configure the two-stage cascade for this process.
+
+    Parameters
+    ----------
+    screen_model:
+        Hugging Face id of a small GLiNER model that screens chunks before
+        ``urchade/gliner_multi_pii-v1`` reads them, ``""`` to disable the
+        cascade, or None to restore the default (``DD_REDACTION_SCREEN_MODEL``,
+        else disabled).
+
+    Returns
+    -------
+    str | None
+        The screening model now in use, or None if the cascade is off.
+    """
+    global _screen_model
+    _screen_model = screen_model
+    return get_cascade()
+
+
+def get_cascade() -> str | None:
+    """The cascade's screening model, or None when every chunk goes to the
+    full model."""
+    name = _screen_model
+    if name is None:
+        name = os.environ.get(SCREEN_MODEL_ENV, "")
+    return name.strip() or None
+
+
+def _get_screen_model(name: str) -> Any:
+    """Lazily load the cascade's first-stage model (PyTorch)."""
+    key = f"screen:{name}"
+    if key not in _models:
+        logger.info("Loading GLiNER screening model %s...", name)
         from gliner import GLiNER
 
-        _model = GLiNER.from_pretrained("urchade/gliner_multi_pii-v1")
-        logger.info("GLiNER PII model ready.")
-    return _model
+        apply_thread_settings()
+        _models[key] = GLiNER.from_pretrained(name)
+    return _models[key]
+
+
+@contextmanager
+def _worker_pool(workers: int) -> Iterator[None]:
+    """Spread GLiNER batches over *workers* processes until exit.
+
+    The models are loaded before the workers are forked, so they share the
+    parent's weights copy-on-write instead of each loading a copy, and each
+    worker sizes its thread pools to its share of the core budget (see
+    :func:`converters.resources.split_budget`).  With one worker, or where
+    processes cannot be forked, batches run in this process.
+    """
+    global _pool
+    if workers <= 1 or _pool is not None:
+        yield
+        return
+    if "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning("Cannot fork redaction workers here; using one process")
+        yield
+        return
+
+    _get_model()
+    screen_model = get_cascade()
+    if screen_model is not None:
+        _get_screen_model(screen_model)
+    cores = thread_settings().cores
+    logger.info("Redacting with %d worker processes (%d cores)", workers, cores)
+    context = multiprocessing.get_context("fork")
+    with context.Pool(workers, _init_worker, (cores, workers)) as pool:
+        _pool = pool
+        try:
+            yield
+        finally:
+            _pool = None
+
+
+def _init_worker(cores: int, workers: int) -> None:
+    """Set up a forked redaction worker."""
+    configure(cores, workers)
+    # ONNX Runtime sessions keep thread pools that do not survive fork;
+    # the worker opens its own from the exported model.
+    _models.pop("onnx", None)
+
+
+def _onnx_model_dir() -> Path:
+    """Directory holding the cached ONNX export of the model."""
+    cache = Path(os.environ.get(MODEL_CACHE_ENV) or _DEFAULT_MODEL_CACHE)
+    return cache / "gliner-onnx" / _MODEL_NAME.replace("/", "--")
+
+
+def _load_onnx_model() -> Any:
+    """Load the int8 ONNX model, exporting it on first use."""
+    import onnxruntime
+    from gliner import GLiNER
+
+    model_dir = _onnx_model_dir()
+    if not (model_dir / _ONNX_MODEL_FILE).exists():
+        _export_onnx_model(model_dir)
+
+    threads = thread_settings()
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = threads.intra_op_threads
+    options.inter_op_num_threads = threads.inter_op_threads
+    options.graph_optimization_level = (
+        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    return GLiNER.from_pretrained(
+        _MODEL_NAME,
+        model_dir=str(model_dir),
+        load_onnx_model=True,
+        onnx_model_file=_ONNX_MODEL_FILE,
+        session_options=options,
+        local_files_only=True,
+    )
+
+
+def _export_onnx_model(model_dir: Path) -> None:
+    """Export the PyTorch checkpoint to ONNX with int8 dynamic quantization.
+
+    The export is built next to *model_dir* and renamed into place, so an
+    interrupted export is never mistaken for a complete one.
+    """
+    from gliner import GLiNER
+
+    logger.info("Exporting GLiNER to ONNX (int8, one-time): %s", model_dir)
+    staging = model_dir.with_name(f"{model_dir.name}.partial")
+    shutil.rmtree(staging, ignore_errors=True)
+
+    paths = GLiNER.from_pretrained(_MODEL_NAME).export_to_onnx(
+        staging, quantize=True, quantized_filename=_ONNX_MODEL_FILE
+    )
+    if paths.get("quantized_path") is None:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise RuntimeError("ONNX Runtime could not quantize the GLiNER export")
+    # Only the quantized graph is loaded; drop the full-precision one.
+    (staging / "model.onnx").unlink(missing_ok=True)
+
+    shutil.rmtree(model_dir, ignore_errors=True)
+    os.replace(staging, model_dir)
 
 
 # ---------------------------------------------------------------------------
-# Text chunking (GLiNER has a ~384 token limit)
+# Text chunking (GLiNER has a ~384 word limit)
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True)
+class _ChunkLimits:
+    """How much text one GLiNER forward pass can read."""
+
+    max_words: int = _CHUNK_MAX_WORDS
+    max_tokens: int | None = None  # subword budget for the text, if known
+    words_splitter: Any = None  # the model's own splitter, if any
+    tokenizer: Any = None  # the model's fast tokenizer, if any
+
+
+def _chunk_limits(model: Any, index: bool = False) -> _ChunkLimits:
+    """Read the word and subword limits from a loaded GLiNER *model*.
+
+    The label prompt, which shares the encoder with the text, is longer
+    with *index* (see :func:`_model_labels`).  Models without a data
+    processor (older GLiNER releases, test fakes) get the default word
+    limit and no subword budget.
+    """
+    config = getattr(model, "config", None)
+    max_words = getattr(config, "max_len", None) or _CHUNK_MAX_WORDS
+    processor = getattr(model, "data_processor", None)
+    splitter = getattr(processor, "words_splitter", None)
+    tokenizer = getattr(processor, "transformer_tokenizer", None)
+    if tokenizer is None or not getattr(tokenizer, "is_fast", False):
+        return _ChunkLimits(max_words, None, splitter, None)
+
+    # Every pass carries the label prompt: <<ENT>> label ... <<SEP>>.
+    ent_token = getattr(processor, "ent_token", "<<ENT>>")
+    prompt = [word for label in _model_labels(index) for word in (ent_token, label)]
+    prompt.append(getattr(processor, "sep_token", "<<SEP>>"))
+    prompt_tokens = len(
+        tokenizer(prompt, is_split_into_words=True, add_special_tokens=False)[
+            "input_ids"
+        ]
+    )
+    limit = min(tokenizer.model_max_length, _ENCODER_MAX_TOKENS)
+    # Two more for the encoder's own start and end tokens.
+    max_tokens = max(1, limit - prompt_tokens - 2)
+    return _ChunkLimits(max_words, max_tokens, splitter, tokenizer)
+
+
 def _chunk_text(
     text: str,
-    max_chars: int = _CHUNK_MAX_CHARS,
-    overlap: int = _CHUNK_OVERLAP,
+    limits: _ChunkLimits | None = None,
+    overlap: int = _CHUNK_OVERLAP_WORDS,
 ) -> list[dict[str, Any]]:
-    """Split text into overlapping chunks with character offset tracking."""
-    chunks: list[dict[str, Any]] = []
-    start = 0
-
-    while start < len(text):
-        end = min(start + max_chars, len(text))
+    """Split text into model-sized chunks with character offset tracking.
 
-        # Try to break at a sentence boundary in the last 20% of the chunk.
-        if end < len(text):
-            search_start = start + int(max_chars * 0.8)
-            match = None
-            for m in re.finditer(r"[.!?]\s+", text[search_start:end]):
-                match = m
-            if match:
-                end = search_start + match.end()
+    Words are found in one pass (with the model's splitter when *limits*
+    carries one) and packed greedily until either the word limit or the
+    subword budget is reached.  Consecutive chunks share *overlap* words,
+    so an entity cut by one boundary is whole in the next chunk.  Each
+    chunk runs from the start of its first word to the end of its last.
+    """
+    limits = limits or _ChunkLimits()
+    if limits.words_splitter is not None:
+        spans = [(start, end) for _, start, end in limits.words_splitter(text)]
+    else:
+        spans = [match.span() for match in _WORD_PATTERN.finditer(text)]
+    if not spans:
+        return []
+
+    costs: list[int] | None = None
+    if limits.tokenizer is not None and limits.max_tokens is not None:
+        word_ids = limits.tokenizer(
+            [text[start:end] for start, end in spans],
+            is_split_into_words=True,
+            add_special_tokens=False,
+        ).word_ids()
+        costs = [0] * len(spans)
+        for word_id in word_ids:
+            if word_id is not None:
+                costs[word_id] += 1
 
+    chunks: list[dict[str, Any]] = []
+    first = 0
+    while True:
+        last = first
+        tokens = 0
+        while last < len(spans) and last - first < limits.max_words:
+            if costs is not None:
+                if last > first and tokens + costs[last] > limits.max_tokens:
+                    break
+                tokens += costs[last]
+            last += 1
+
+        start, end = spans[first][0], spans[last - 1][1]
         chunks.append({"text": text[start:end], "offset": start})
-        start = end - overlap if end < len(text) else end
-
-    return chunks
+        if last == len(spans):
+            return chunks
+        first = max(first + 1, last - overlap)
 
 
 # ---------------------------------------------------------------------------
@@ -187,55 +663,315 @@ def _chunk_text(
 
 def _detect_pii_gliner(text: str) -> list[dict[str, Any]]:
     """Run GLiNER PII detection on text of any length."""
-    model = _get_model()
+    return _detect_pii_gliner_many([text])[0]
 
-    if len(text) < _CHUNK_MAX_CHARS:
-        return model.predict_entities(text, _REDACT_LABELS, threshold=_THRESHOLD)
 
-    # Long text: chunk, detect, deduplicate.
-    chunks = _chunk_text(text)
-    all_entities: list[dict[str, Any]] = []
-    seen: set[tuple[int, int, str]] = set()
+def _model_windows(text: str, gate: bool = True) -> list[tuple[int, int]]:
+    """The ``(start, end)`` spans of *text* GLiNER has to read.
+
+    With *gate*, only windows around candidate tokens (see
+    ``_CANDIDATE_PATTERN``), widened to word boundaries and merged where
+    they overlap; otherwise the whole text.
+    """
+    if not gate:
+        return [(0, len(text))] if text else []
+
+    windows: list[tuple[int, int]] = []
+    for match in _CANDIDATE_PATTERN.finditer(text):
+        start = max(0, match.start() - _GATE_CONTEXT)
+        end = min(len(text), match.end() + _GATE_CONTEXT)
+        # Do not cut a word in half (bounded, for text without spaces).
+        limit = start - _GATE_CONTEXT // 4
+        while start > max(0, limit) and not text[start - 1].isspace():
+            start -= 1
+        limit = end + _GATE_CONTEXT // 4
+        while end < min(len(text), limit) and not text[end].isspace():
+            end += 1
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(end, windows[-1][1]))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def _detect_pii_gliner_many(
+    texts: list[str],
+    batch_size: int = _BATCH_SIZE,
+    gate: bool = True,
+    windows: list[list[tuple[int, int]]] | None = None,
+    cache: DetectionCache | None = None,
+    index: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """Run GLiNER PII detection on several texts in shared batches.
+
+    Only each text's candidate windows are read (all of it without *gate*;
+    *windows* may pass in precomputed :func:`_model_windows`).  Windows are
+    cut into chunks that fill the model's context (:func:`_chunk_text`),
+    the chunks of all texts are sorted by length and run *batch_size* at a
+    time, and each entity is mapped back to its text and absolute offset.
+    Entities found twice in overlapping chunks are kept once.  With a
+    cascade configured, the screening model reads every chunk first and
+    only the chunks it flags go to the full model.
+
+    Chunks are looked up in *cache* (the module's in-memory cache by
+    default) first; only chunks it has not seen reach a model, and each
+    distinct chunk is read once however often it repeats.  Returns one
+    entity list per text, sorted by position.
+
+    With *index*, the preserved labels (``_INDEX_LABELS``) are requested in
+    the same passes and their entities returned too, and every chunk goes
+    to the full model.  Preserved entities can be anywhere, so callers
+    indexing should read the whole text (``gate=False``).
+    """
+    if windows is None:
+        windows = [_model_windows(text, gate) for text in texts]
+
+    # (text index, offset of the chunk in its text, chunk text)
+    chunks: list[tuple[int, int, str]] = []
+    limits: _ChunkLimits | None = None
+    for text_index, text in enumerate(texts):
+        for start, end in windows[text_index]:
+            if limits is None:
+                limits = _chunk_limits(_get_model(), index)
+            chunks.extend(
+                (text_index, start + piece["offset"], piece["text"])
+                for piece in _chunk_text(text[start:end], limits)
+            )
+    if cache is None:
+        cache = _detection_cache
+    model_key = _cache_model_key(index)
+
+    # The models read normalized chunks (see converters.detection_cache);
+    # ``todo`` holds the distinct ones the cache cannot answer.
+    normalized = [normalize(chunk[2]) for chunk in chunks]
+    keys = [DetectionCache.key(text, model_key) for text, _ in normalized]
+    found: dict[str, list[dict[str, Any]]] = {}
+    todo: dict[str, str] = {}
+    for key, (text, _) in zip(keys, normalized):
+        if key in todo:
+            cache.hits += 1  # a repeat of a chunk read below
+            continue
+        entities = cache.get(key)
+        if entities is None:
+            todo[key] = text
+        else:
+            found[key] = entities
+
+    if todo:
+        predictions = _predict_uncached(list(todo.values()), batch_size, index)
+        for key, entities in zip(todo, predictions):
+            cache.put(key, entities)
+            found[key] = entities
+        logger.debug(
+            "Detection cache: %d of %d chunks read by the model",
+            len(todo),
+            len(chunks),
+        )
+
+    # Map back in chunk order, so overlaps resolve the same way however the
+    # chunks were batched.
+    results: list[list[dict[str, Any]]] = [[] for _ in texts]
+    seen: list[set[tuple[int, int, str]]] = [set() for _ in texts]
+    for (text_index, offset, _), key, (_, positions) in zip(chunks, keys, normalized):
+        for ent in found[key]:
+            if ent["end"] <= ent["start"]:
+                continue
+            abs_start = offset + positions[ent["start"]]
+            abs_end = offset + positions[ent["end"] - 1] + 1
+            dedupe_key = (abs_start, abs_end, ent["label"])
+            if dedupe_key in seen[text_index]:
+                continue
+            seen[text_index].add(dedupe_key)
+            results[text_index].append({
+                "start": abs_start,
+                "end": abs_end,
+                "text": texts[text_index][abs_start:abs_end],
+                "label": ent["label"],
+                "score": ent["score"],
+                "source": "gliner",
+            })
+
+    for entities in results:
+        entities.sort(key=lambda e: e["start"])
+    return results
+
+
+def _predict_uncached(
+    texts: list[str],
+    batch_size: int,
+    index: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """GLiNER entities for each of *texts*, through the cascade if set.
+
+    The screening model only looks for PII, so with *index* every chunk
+    goes to the full model.
+    """
+    flagged = list(range(len(texts)))
+    screen_model = None if index else get_cascade()
+    if screen_model is not None:
+        screened = _predict_chunks(
+            texts, batch_size, _SCREEN_THRESHOLD, screen_model=screen_model
+        )
+        flagged = [i for i, entities in enumerate(screened) if entities]
+        logger.debug(
+            "Cascade: %d of %d chunks flagged by %s",
+            len(flagged),
+            len(texts),
+            screen_model,
+        )
 
-    for chunk in chunks:
-        entities = model.predict_entities(
-            chunk["text"], _REDACT_LABELS, threshold=_THRESHOLD
+    predictions: list[list[dict[str, Any]]] = [[] for _ in texts]
+    if flagged:
+        flagged_predictions = _predict_chunks(
+            [texts[i] for i in flagged], batch_size, _THRESHOLD, index=index
         )
-        for ent in entities:
-            abs_start = ent["start"] + chunk["offset"]
-            abs_end = ent["end"] + chunk["offset"]
-            key = (abs_start, abs_end, ent["label"])
-            if key not in seen:
-                seen.add(key)
-                all_entities.append({
-                    "start": abs_start,
-                    "end": abs_end,
-                    "text": ent["text"],
-                    "label": ent["label"],
-                    "score": ent["score"],
-                    "source": "gliner",
-                })
-
-    all_entities.sort(key=lambda e: e["start"])
-    return all_entities
+        for position, entities in zip(flagged, flagged_predictions):
+            predictions[position] = entities
+    return predictions
+
+
+def _cache_model_key(index: bool = False) -> str:
+    """Everything besides the chunk itself that decides what GLiNER finds."""
+    return json.dumps([
+        _MODEL_NAME,
+        get_backend(),
+        _THRESHOLD,
+        _model_labels(index),
+        None if index else get_cascade(),
+        _SCREEN_THRESHOLD,
+        _gliner_version(),
+    ])
+
+
+def _gliner_version() -> str:
+    try:
+        return version("gliner")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _predict_chunks(
+    texts: list[str],
+    batch_size: int,
+    threshold: float,
+    screen_model: str | None = None,
+    index: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """Run a model over *texts* in length-sorted batches, results in order.
+
+    The model is the full PII model (asked for the preserved labels too
+    with *index*), or the cascade's *screen_model*.
+    While a :func:`_worker_pool` is open the batches are spread over its
+    processes; they are the same batches either way.
+    """
+    by_length = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    batches = [
+        by_length[first : first + batch_size]
+        for first in range(0, len(by_length), batch_size)
+    ]
+    jobs = [
+        (screen_model, [texts[i] for i in batch], threshold, index) for batch in batches
+    ]
+    if _pool is not None and len(jobs) > 1:
+        results = _pool.starmap(_predict_with, jobs, chunksize=1)
+    else:
+        results = [_predict_with(*job) for job in jobs]
+
+    predictions: list[list[dict[str, Any]]] = [[] for _ in texts]
+    for batch, batch_predictions in zip(batches, results):
+        for position, entities in zip(batch, batch_predictions):
+            predictions[position] = entities
+    return predictions
+
+
+def _predict_with(
+    screen_model: str | None,
+    texts: list[str],
+    threshold: float,
+    index: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """One batch through the screening model *screen_model* or the full model."""
+    model = _get_screen_model(screen_model) if screen_model else _get_model()
+    return _predict_batch(model, texts, threshold, index)
+
+
+def _predict_batch(
+    model: Any,
+    texts: list[str],
+    threshold: float = _THRESHOLD,
+    index: bool = False,
+) -> list[list[dict[str, Any]]]:
+    """One batched forward pass over *texts*.
+
+    With *index* the preserved labels are requested too.  GLiNER's flat
+    decoding keeps the best label where spans overlap, which would let a
+    preserved label take a span from a redacted one; instead the pass is
+    decoded nested and each group of labels is flattened on its own (see
+    :func:`_flatten_groups`).
+    """
+    labels = _model_labels(index)
+    options: dict[str, Any] = {"threshold": threshold}
+    if index:
+        options.update(flat_ner=False, multi_label=True)
+    inference = getattr(model, "inference", None)
+    if inference is not None:
+        predictions = inference(texts, labels, batch_size=len(texts), **options)
+    else:
+        # GLiNER releases before ``inference`` existed.
+        predictions = model.batch_predict_entities(texts, labels, **options)
+    if index:
+        predictions = [_flatten_groups(entities) for entities in predictions]
+    return predictions
+
+
+def _model_labels(index: bool = False) -> list[str]:
+    """Labels the full model is asked for, preserved ones with *index*."""
+    return _REDACT_LABELS + _INDEX_LABELS if index else _REDACT_LABELS
+
+
+def _flatten_groups(entities: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop overlapping spans as flat decoding would, per group of labels.
+
+    Redacted and preserved labels are flattened separately: the best
+    scoring span wins where spans of the same group overlap, and spans of
+    different groups are all kept.
+    """
+    kept: list[dict[str, Any]] = []
+    for ent in sorted(entities, key=lambda e: -e["score"]):
+        preserved = ent["label"] in _INDEX_LABEL_MAP
+        if not any(
+            (other["label"] in _INDEX_LABEL_MAP) == preserved
+            and other["start"] < ent["end"]
+            and ent["start"] < other["end"]
+            for other in kept
+        ):
+            kept.append(ent)
+    kept.sort(key=lambda e: e["start"])
+    return kept
 
 
 def _detect_pii_regex(text: str) -> list[dict[str, Any]]:
-    """Run regex-based PII detection as a fallback for structured patterns."""
+    """Run regex-based PII detection as a fallback for structured patterns.
+
+    One pass of ``_REGEX_PATTERN`` over *text*; card numbers, IBANs and
+    routing numbers must also pass their check-digit validation.
+    """
     entities: list[dict[str, Any]] = []
 
-    for label, pattern in _REGEX_PATTERNS:
-        for match in pattern.finditer(text):
-            entities.append({
-                "start": match.start(),
-                "end": match.end(),
-                "text": match.group(),
-                "label": label,
-                "score": 1.0,
-                "source": "regex",
-            })
+    for match in _REGEX_PATTERN.finditer(text):
+        label = match.lastgroup
+        validator = _REGEX_VALIDATORS.get(label)
+        if validator is not None and not validator(match.group()):
+            continue
+        entities.append({
+            "start": match.start(),
+            "end": match.end(),
+            "text": match.group(),
+            "label": label,
+            "score": 1.0,
+            "source": "regex",
+        })
 
-    entities.sort(key=lambda e: e["start"])
     return entities
 
 
@@ -243,28 +979,46 @@ def _merge_detections(
     gliner_entities: list[dict[str, Any]],
     regex_entities: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
-    """Merge GLiNER and regex detections, preferring GLiNER when they overlap."""
-    if not regex_entities:
-        return gliner_entities
-    if not gliner_entities:
-        return regex_entities
-
-    # Build a set of character ranges covered by GLiNER detections.
-    covered: set[int] = set()
-    for ent in gliner_entities:
-        covered.update(range(ent["start"], ent["end"]))
-
-    # Add regex detections only if they don't overlap with GLiNER detections.
-    merged = list(gliner_entities)
-    for ent in regex_entities:
-        ent_range = set(range(ent["start"], ent["end"]))
-        if not ent_range & covered:
-            merged.append(ent)
-
-    merged.sort(key=lambda e: e["start"])
+    """Merge GLiNER and regex detections into non-overlapping spans.
+
+    One sweep over the spans sorted by position coalesces every group that
+    overlaps -- the same value found in two chunks, or a regex match over a
+    GLiNER one -- into a single span covering all of it.  Each span keeps
+    the label and score of its best member: GLiNER over regex, then the
+    higher score, then the first in sort order.  The result is sorted and
+    does not depend on the order of the inputs.
+    """
+    spans = sorted(
+        gliner_entities + regex_entities,
+        key=lambda e: (e["start"], -e["end"], e["label"], e["source"]),
+    )
+    merged: list[dict[str, Any]] = []
+    best: dict[str, Any] | None = None
+    for ent in spans:
+        if merged and ent["start"] < merged[-1]["end"]:
+            merged[-1]["end"] = max(merged[-1]["end"], ent["end"])
+            if _detection_rank(ent) > _detection_rank(best):
+                best = ent
+                merged[-1].update(
+                    label=ent["label"], score=ent["score"], source=ent["source"]
+                )
+            continue
+        best = ent
+        merged.append({
+            "start": ent["start"],
+            "end": ent["end"],
+            "label": ent["label"],
+            "score": ent["score"],
+            "source": ent["source"],
+        })
     return merged
 
 
+def _detection_rank(ent: dict[str, Any]) -> tuple[bool, float]:
+    """Which of two overlapping detections names the merged span."""
+    return ent["source"] == "gliner", ent["score"]
+
+
 # ---------------------------------------------------------------------------
 # Redaction
 # ---------------------------------------------------------------------------
@@ -276,7 +1030,55 @@ def redact_text(text: str) -> RedactionResult:
     The original PII values are NOT stored -- only the type, position,
     and original length are recorded.
     """
-    gliner_entities = _detect_pii_gliner(text)
+    return _apply_redactions(text, _detect_pii_gliner(text))
+
+
+def redact_texts(
+    texts: list[str],
+    batch_size: int = _BATCH_SIZE,
+    gate: bool = True,
+    cache: DetectionCache | None = None,
+    index: bool = False,
+) -> list[RedactionResult]:
+    """Redact several texts, batching GLiNER inference across all of them.
+
+    Equivalent to calling :func:`redact_text` on each text, but chunks from
+    every text share forward passes of up to *batch_size* chunks.  With
+    *gate*, GLiNER only reads windows around candidate tokens (see
+    :func:`_model_windows`); ``model_chars`` on each result says how much.
+    Chunks already in *cache* are not read again.
+
+    With *index*, the same passes also find the preserved entities listed
+    in ``_INDEX_LABELS``, which are left in the text and returned as each
+    result's ``indexed``.  GLiNER then reads all of every text.
+    """
+    windows = [_model_windows(text, gate and not index) for text in texts]
+    detections = _detect_pii_gliner_many(
+        texts, batch_size=batch_size, windows=windows, cache=cache, index=index
+    )
+    results = [
+        _apply_redactions(text, entities)
+        for text, entities in zip(texts, detections)
+    ]
+    for result, spans in zip(results, windows):
+        result.model_chars = sum(end - start for start, end in spans)
+    return results
+
+
+def _apply_redactions(
+    text: str,
+    gliner_entities: list[dict[str, Any]],
+) -> RedactionResult:
+    """Merge GLiNER entities with regex matches and replace them in *text*.
+
+    Entities with a preserved label (see ``_INDEX_LABELS``) are not
+    replaced but listed in the result's ``indexed``.
+    """
+    preserved = [e for e in gliner_entities if e["label"] in _INDEX_LABEL_MAP]
+    if preserved:
+        gliner_entities = [
+            e for e in gliner_entities if e["label"] not in _INDEX_LABEL_MAP
+        ]
     regex_entities = _detect_pii_regex(text)
     merged = _merge_detections(gliner_entities, regex_entities)
 
@@ -285,17 +1087,20 @@ def redact_text(text: str) -> RedactionResult:
             original_path="",
             redacted_text=text,
             entities_found=0,
+            indexed=_index_entities(text, preserved, []),
         )
 
-    # Build the redacted text by replacing entities in reverse order
-    # (so character positions stay valid).
-    redacted = text
+    # Assemble the output in one pass from the text between spans and the
+    # placeholders (merged spans are sorted and never overlap).
+    parts: list[str] = []
     entities: list[RedactedEntity] = []
+    position = 0
 
-    for ent in sorted(merged, key=lambda e: e["start"], reverse=True):
+    for ent in merged:
         friendly_label = _LABEL_MAP.get(ent["label"], ent["label"])
-        replacement = _REDACT_FMT.format(label=friendly_label)
-        redacted = redacted[: ent["start"]] + replacement + redacted[ent["end"] :]
+        parts.append(text[position : ent["start"]])
+        parts.append(_REDACT_FMT.format(label=friendly_label))
+        position = ent["end"]
 
         entities.append(
             RedactedEntity(
@@ -307,27 +1112,114 @@ def redact_text(text: str) -> RedactionResult:
                 source=ent["source"],
             )
         )
-
-    # Reverse so entities are in document order.
-    entities.reverse()
+    parts.append(text[position:])
+    redacted = "".join(parts)
 
     return RedactionResult(
         original_path="",
         redacted_text=redacted,
         entities_found=len(entities),
         entities=entities,
+        indexed=_index_entities(text, preserved, _replacements(merged)),
     )
 
 
-def redact_file(file_path: Path) -> RedactionResult:
+def _replacements(
+    merged: list[dict[str, Any]],
+    head: int = 0,
+) -> list[tuple[int, int, int]]:
+    """``(start, end, placeholder length)`` of each merged span ending past
+    *head*, with starts clipped to it."""
+    return [
+        (
+            max(ent["start"], head),
+            ent["end"],
+            len(_REDACT_FMT.format(label=_LABEL_MAP.get(ent["label"], ent["label"]))),
+        )
+        for ent in merged
+        if ent["end"] > head
+    ]
+
+
+def _index_entities(
+    text: str,
+    preserved: list[dict[str, Any]],
+    replacements: list[tuple[int, int, int]],
+    start: int = 0,
+    end: int | None = None,
+    out_start: int = 0,
+) -> list[IndexedEntity]:
+    """Index the *preserved* entities that start in ``text[start:end]``.
+
+    *replacements* are the sorted ``(start, end, placeholder length)`` of
+    the spans redacted there (see :func:`_replacements`).  An entity that
+    overlaps one is left out, so nothing redacted reaches the index; the
+    others are located in the redacted output, where ``text[start:]``
+    begins at *out_start*.
+    """
+    end = len(text) if end is None else end
+    indexed: list[IndexedEntity] = []
+    shift = out_start - start
+    i = 0
+    for ent in sorted(preserved, key=lambda e: e["start"]):
+        if not start <= ent["start"] < end:
+            continue
+        while i < len(replacements) and replacements[i][1] <= ent["start"]:
+            span_start, span_end, placeholder = replacements[i]
+            shift += placeholder - (span_end - span_start)
+            i += 1
+        if i < len(replacements) and replacements[i][0] < ent["end"]:
+            continue
+        label = _INDEX_LABEL_MAP[ent["label"]]
+        value = _normalize_value(label, text[ent["start"] : ent["end"]])
+        if value:
+            indexed.append(
+                IndexedEntity(
+                    label=label,
+                    value=value,
+                    offset=ent["start"] + shift,
+                    length=ent["end"] - ent["start"],
+                    score=ent["score"],
+                )
+            )
+    return indexed
+
+
+def _normalize_value(label: str, text: str) -> str:
+    """The lookup form of an indexed entity's text.
+
+    Whitespace collapses and surrounding punctuation and markdown go;
+    parcel numbers keep only letters and digits, upper-cased, so
+    ``0123-45-678`` and ``0123 45 678`` match, and other values are
+    case-folded.
+    """
+    value = " ".join(text.split()).strip(_INDEX_VALUE_STRIP)
+    if label == "parcel_number":
+        return re.sub(r"[^0-9A-Za-z]", "", value).upper()
+    return value.casefold()
+
+
+def redact_file(file_path: Path, index: bool = False) -> RedactionResult:
     """Read a markdown file, redact PII, and overwrite with redacted version.
 
-    Returns a RedactionResult with details of what was redacted.
+    Returns a RedactionResult with details of what was redacted.  Files
+    over ``_STREAM_MIN_BYTES`` are redacted as a stream (see
+    :func:`_redact_stream`) and their result's ``redacted_text`` is empty.
+    With *index*, preserved entities are also returned (see
+    :func:`redact_texts`); record them with :func:`update_entity_index`.
     """
     file_path = Path(file_path)
+    if file_path.stat().st_size > _STREAM_MIN_BYTES:
+        return _redact_stream(file_path, index=index)[1]
     text = file_path.read_text(encoding="utf-8")
 
-    result = redact_text(text)
+    (result,) = redact_texts([text], index=index)
+    _write_redacted(file_path, result)
+    return result
+
+
+def _write_redacted(file_path: Path, result: RedactionResult) -> None:
+    """Record *file_path* on *result* and overwrite it if anything changed."""
     result.original_path = str(file_path)
 
     if result.was_redacted:
@@ -338,63 +1230,483 @@ def redact_file(file_path: Path) -> RedactionResult:
     else:
         logger.debug("No PII found in %s", file_path.name)
 
-    return result
 
+def _redact_stream(
+    file_path: Path,
+    batch_size: int = _BATCH_SIZE,
+    cache: DetectionCache | None = None,
+    index: bool = False,
+) -> tuple[int, RedactionResult]:
+    """Redact a large file in place without reading all of it into memory.
+
+    The file is read ``_STREAM_BLOCK_CHARS`` at a time.  Each block is
+    redacted together with ``_STREAM_CONTEXT`` characters either side of it
+    and written up to a line break before the lookahead; a span that
+    crosses that point moves it, so spans are never split.  Output goes to
+    a temporary file that is renamed over the original once complete, and
+    only if anything was redacted.  *index* lists preserved entities as in
+    :func:`redact_texts`.
+
+    Returns the number of characters read and the result, whose
+    ``redacted_text`` is empty (the text is in the file).
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    entities: list[RedactedEntity] = []
+    indexed: list[IndexedEntity] = []
+    model_chars = 0
+    chars = 0
+    written = 0  # characters of output so far
+    buffer = ""
+    base = 0  # offset of ``buffer`` in the file
+    head = 0  # characters of ``buffer`` already written (context only)
+
+    try:
+        with (
+            open(file_path, encoding="utf-8", newline="") as source,
+            open(tmp_path, "w", encoding="utf-8", newline="") as out,
+        ):
+            while True:
+                block = source.read(_STREAM_BLOCK_CHARS)
+                chars += len(block)
+                buffer += block
+                if block:
+                    cut = _stream_cut(buffer, head)
+                    if cut is None:
+                        continue  # not enough lookahead yet
+                else:
+                    cut = len(buffer)
+
+                windows = _model_windows(buffer, gate=not index)
+                found = _detect_pii_gliner_many(
+                    [buffer], batch_size, windows=[windows], cache=cache, index=index
+                )[0]
+                preserved = [e for e in found if e["label"] in _INDEX_LABEL_MAP]
+                merged = _merge_detections(
+                    [e for e in found if e["label"] not in _INDEX_LABEL_MAP],
+                    _detect_pii_regex(buffer),
+                )
+                for ent in merged:
+                    if ent["start"] < cut < ent["end"]:
+                        cut = ent["start"] if ent["start"] > head else ent["end"]
+                model_chars += sum(
+                    max(0, min(end, cut) - max(start, head)) for start, end in windows
+                )
+                if preserved:
+                    replacements = _replacements(merged, head)
+                    indexed.extend(
+                        _index_entities(buffer, preserved, replacements, head, cut, written)
+                    )
+
+                position = head
+                for ent in merged:
+                    if ent["end"] <= head or ent["start"] >= cut:
+                        continue
+                    start = max(ent["start"], head)
+                    friendly_label = _LABEL_MAP.get(ent["label"], ent["label"])
+                    placeholder = _REDACT_FMT.format(label=friendly_label)
+                    out.write(buffer[position:start])
+                    out.write(placeholder)
+                    written += start - position + len(placeholder)
+                    position = ent["end"]
+                    entities.append(
+                        RedactedEntity(
+                            start=base + start,
+                            end=base + ent["end"],
+                            original_length=ent["end"] - start,
+                            label=friendly_label,
+                            score=ent["score"],
+                            source=ent["source"],
+                        )
+                    )
+                out.write(buffer[position:cut])
+                written += cut - position
+
+                if not block:
+                    break
+                keep = max(0, cut - _STREAM_CONTEXT)
+                buffer = buffer[keep:]
+                base += keep
+                head = cut - keep
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    result = RedactionResult(
+        original_path=str(file_path),
+        redacted_text="",
+        entities_found=len(entities),
+        entities=entities,
+        model_chars=model_chars,
+        indexed=indexed,
+    )
+    if result.was_redacted:
+        os.replace(tmp_path, file_path)
+        logger.info(
+            "Redacted %d entities in %s (streamed)", result.entities_found, file_path.name
+        )
+    else:
+        tmp_path.unlink()
+        logger.debug("No PII found in %s", file_path.name)
+    return chars, result
+
+
+def _stream_cut(buffer: str, head: int) -> int | None:
+    """Where to stop writing *buffer*, leaving ``_STREAM_CONTEXT`` after it.
 
-def redact_converted_folder(converted_dir: Path) -> RedactionReport:
+    The last line break before the lookahead, else the last whitespace, else
+    the lookahead itself; None if *buffer* holds no new text beyond it.
+    """
+    limit = len(buffer) - _STREAM_CONTEXT
+    if limit <= head:
+        return None
+    for separator in ("\n", " "):
+        index = buffer.rfind(separator, head, limit)
+        if index >= 0:
+            return index + 1
+    return limit
+
+
+def redact_converted_folder(
+    converted_dir: Path,
+    batch_size: int = _BATCH_SIZE,
+    cache_dir: Path | None = None,
+    force: bool = False,
+    workers: int = 1,
+    index: bool = False,
+) -> RedactionReport:
     """Redact PII from all markdown files in a _converted/ folder.
 
     Overwrites each file in place with the redacted version.
     Writes a ``redaction-report.json`` to the folder summarizing what
-    was redacted (without storing original PII values).
+    was redacted (without storing original PII values) and how fast.
+
+    Files are read in groups of about ``_GROUP_MAX_CHARS`` characters and
+    each group's chunks share GLiNER batches of *batch_size* (see
+    :func:`redact_texts`); files over ``_STREAM_MIN_BYTES`` are streamed
+    instead (see :func:`_redact_stream`).  Detections are cached per chunk, so repeated
+    boilerplate is read once; with *cache_dir* the cache is also kept on
+    disk for later runs (see :mod:`converters.detection_cache`).
+
+    Each file's entry in the report records the SHA-256 of the file as
+    redacted and the :func:`config_fingerprint` it was redacted with.  A
+    file whose content and fingerprint both still match was redacted by an
+    earlier run and is skipped, keeping its entry; *force* redacts every
+    file again.
+
+    With *workers* above 1, GLiNER batches run in that many forked
+    processes sharing the loaded model, each with its share of the core
+    budget (see :func:`_worker_pool`).  Chunking, caching, regex and
+    splicing stay in this process, so the files and the report are the
+    same as with one worker.
+
+    With *index*, the same GLiNER passes also find organizations, people,
+    addresses, parcel numbers and utilities (``_INDEX_LABELS``).  They are
+    left in the text and listed in ``entity-index.json`` with their type,
+    normalized value, file, and offset in the redacted file.  GLiNER then
+    reads every file in full rather than only the candidate gate's windows.
 
     Returns a RedactionReport for inclusion in the pipeline manifest.
     """
     converted_dir = Path(converted_dir)
     report = RedactionReport()
+    cache = DetectionCache(root=cache_dir)
+    start = time.monotonic()
+    report_path = converted_dir / "redaction-report.json"
 
     md_files = sorted(converted_dir.glob("*.md"))
     report.files_scanned = len(md_files)
 
+    previous = {} if force else _previous_file_states(report_path)
+    fingerprint = config_fingerprint(index)
+    details: dict[str, dict[str, Any]] = {}
+    pending: list[Path] = []
     for md_file in md_files:
-        result = redact_file(md_file)
-        report.total_entities += result.entities_found
+        entry = previous.get(md_file.name)
+        if (
+            entry is not None
+            and entry.get("config") == fingerprint
+            and entry.get("sha256") == _file_sha256(md_file)
+        ):
+            details[md_file.name] = entry
+        else:
+            pending.append(md_file)
+    report.files_skipped = len(details)
+    if details:
+        logger.info(
+            "Skipping %d files already redacted with the current settings",
+            len(details),
+        )
 
-        if result.was_redacted:
+    indexed: dict[str, list[IndexedEntity]] = {}
+    with _worker_pool(workers if pending else 1):
+        for md_file, chars, result in _redact_files(pending, batch_size, cache, index):
+            report.characters_scanned += chars
+            report.characters_to_model += result.model_chars
+            indexed[md_file.name] = result.indexed
+
+            # File-level summary (no original values stored).
+            details[md_file.name] = {
+                "file": md_file.name,
+                "entities_found": result.entities_found,
+                "entity_types": [ent.label for ent in result.entities],
+                **redaction_state(md_file, index),
+            }
+
+    # Totals cover the whole folder, skipped files included.
+    for md_file in md_files:
+        entry = details[md_file.name]
+        report.file_details.append(entry)
+        report.total_entities += entry["entities_found"]
+        if entry["entities_found"] > 0:
             report.files_redacted += 1
 
         # Count by type.
-        for ent in result.entities:
-            report.entities_by_type[ent.label] = (
-                report.entities_by_type.get(ent.label, 0) + 1
-            )
-
-        # File-level summary (no original values stored).
-        report.file_details.append({
-            "file": md_file.name,
-            "entities_found": result.entities_found,
-            "entity_types": [ent.label for ent in result.entities],
-        })
+        for label in entry["entity_types"]:
+            report.entities_by_type[label] = report.entities_by_type.get(label, 0) + 1
+
+    report.elapsed_seconds = time.monotonic() - start
+    report.cache_hits = cache.hits
+    report.cache_lookups = cache.hits + cache.misses
+    if index:
+        report.entities_indexed = _write_entity_index(
+            converted_dir, md_files, indexed
+        )
+    elif indexed:
+        # Files redacted again without indexing drop their stale entries.
+        update_entity_index(converted_dir, indexed)
 
     # Write the redaction report.
-    report_path = converted_dir / "redaction-report.json"
     report_data = {
         "files_scanned": report.files_scanned,
+        "files_skipped": report.files_skipped,
         "files_redacted": report.files_redacted,
         "total_entities_redacted": report.total_entities,
         "entities_by_type": report.entities_by_type,
+        "characters_scanned": report.characters_scanned,
+        "characters_to_model": report.characters_to_model,
+        "model_skip_rate": round(report.model_skip_rate, 4),
+        "cache_lookups": report.cache_lookups,
+        "cache_hit_rate": round(report.cache_hit_rate, 4),
+        "entities_indexed": report.entities_indexed,
+        "elapsed_seconds": round(report.elapsed_seconds, 3),
+        "chars_per_second": round(report.chars_per_second),
         "files": report.file_details,
     }
-    report_path.write_text(
-        json.dumps(report_data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    with json_lock(report_path):
+        write_json_atomic(report_path, report_data)
     logger.info(
-        "Redaction complete: %d entities in %d/%d files. Report: %s",
+        "Redaction complete: %d entities in %d/%d files, %d unchanged "
+        "(%.0f chars/s, %.0f%% skipped by the candidate gate, "
+        "%.0f%% of chunks cached). Report: %s",
         report.total_entities,
         report.files_redacted,
         report.files_scanned,
+        report.files_skipped,
+        report.chars_per_second,
+        report.model_skip_rate * 100,
+        report.cache_hit_rate * 100,
         report_path,
     )
 
     return report
+
+
+def config_fingerprint(index: bool = False) -> str:
+    """Fingerprint of every setting that decides what a redaction removes.
+
+    Covers the GLiNER model, backend, labels and thresholds (and the
+    screening model, if any), the regex patterns, the candidate gate and
+    the placeholder format.  Files redacted under a different fingerprint
+    are redacted again.  Redacting with *index* asks GLiNER for more
+    labels and reads whole files, so it has a fingerprint of its own.
+    """
+    raw = json.dumps([
+        _cache_model_key(index),
+        _REGEX_PATTERN.pattern,
+        sorted(_REGEX_VALIDATORS),
+        _CANDIDATE_PATTERN.pattern,
+        _GATE_CONTEXT,
+        _REDACT_FMT,
+        _LABEL_MAP,
+    ])
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def redaction_state(file_path: Path, index: bool = False) -> dict[str, str]:
+    """The state recorded for a file just redacted, for the report.
+
+    ``sha256`` is the file's content as redacted and ``config`` the
+    :func:`config_fingerprint`; see :func:`redact_converted_folder`.
+    """
+    return {
+        "sha256": _file_sha256(Path(file_path)),
+        "config": config_fingerprint(index),
+    }
+
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _previous_file_states(report_path: Path) -> dict[str, dict[str, Any]]:
+    """File entries of an earlier redaction report, by file name."""
+    if not report_path.exists():
+        return {}
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable redaction report %s: %s", report_path, exc)
+        return {}
+    return {
+        entry["file"]: entry
+        for entry in report.get("files", [])
+        if isinstance(entry, dict) and "file" in entry
+    }
+
+
+def _redact_files(
+    files: list[Path],
+    batch_size: int,
+    cache: DetectionCache,
+    index: bool = False,
+) -> Iterator[tuple[Path, int, RedactionResult]]:
+    """Redact *files* in place; yield each with its length and result.
+
+    Files over ``_STREAM_MIN_BYTES`` are streamed one at a time, the rest
+    read in groups whose chunks share GLiNER batches.
+    """
+    batched: list[Path] = []
+    for path in files:
+        if path.stat().st_size > _STREAM_MIN_BYTES:
+            yield path, *_redact_stream(path, batch_size, cache, index)
+        else:
+            batched.append(path)
+
+    for group in _file_groups(batched):
+        texts = [md_file.read_text(encoding="utf-8") for md_file in group]
+        results = redact_texts(texts, batch_size=batch_size, cache=cache, index=index)
+        for md_file, text, result in zip(group, texts, results):
+            _write_redacted(md_file, result)
+            yield md_file, len(text), result
+
+
+def _write_entity_index(
+    converted_dir: Path,
+    md_files: list[Path],
+    indexed: dict[str, list[IndexedEntity]],
+) -> int:
+    """Write ``entity-index.json`` for *md_files*; return its entity count.
+
+    *indexed* holds the entities of the files just redacted, by file name;
+    files skipped as unchanged keep theirs from the existing index.
+    """
+    index_path = converted_dir / ENTITY_INDEX_FILENAME
+    entities = [
+        _index_entry(name, ent) for name, ents in indexed.items() for ent in ents
+    ]
+    with json_lock(index_path):
+        if len(indexed) < len(md_files):
+            entities.extend(
+                entry
+                for entry in _previous_index_entries(index_path)
+                if entry.get("file") not in indexed
+            )
+        return _save_entity_index(index_path, md_files, entities)
+
+
+def update_entity_index(
+    converted_dir: Path,
+    indexed: dict[str, list[IndexedEntity]],
+) -> int:
+    """Replace the entity index entries of single files; return its count.
+
+    For files written outside :func:`redact_converted_folder` -- refined
+    drafts, pages converted on demand.  *indexed* maps each file name to
+    the entities found when it was redacted (see :func:`redact_file`); an
+    empty list, for a file redacted without *index*, drops entries that no
+    longer match the file.  Other files keep theirs.  No index is created
+    when there is none and nothing to add.
+    """
+    converted_dir = Path(converted_dir)
+    index_path = converted_dir / ENTITY_INDEX_FILENAME
+    with json_lock(index_path):
+        if not index_path.exists() and not any(indexed.values()):
+            return 0
+        entities = [
+            entry
+            for entry in _previous_index_entries(index_path)
+            if entry.get("file") not in indexed
+        ]
+        entities.extend(
+            _index_entry(name, ent) for name, ents in indexed.items() for ent in ents
+        )
+        return _save_entity_index(
+            index_path, sorted(converted_dir.glob("*.md")), entities
+        )
+
+
+def _index_entry(filename: str, entity: IndexedEntity) -> dict[str, Any]:
+    """The entity index's JSON record for *entity* in *filename*."""
+    return {
+        "type": entity.label,
+        "value": entity.value,
+        "file": filename,
+        "offset": entity.offset,
+        "length": entity.length,
+    }
+
+
+def _save_entity_index(
+    index_path: Path,
+    md_files: list[Path],
+    entities: list[dict[str, Any]],
+) -> int:
+    """Write the entries of *entities* that belong to *md_files*."""
+    names = {md_file.name for md_file in md_files}
+    entities = sorted(
+        (entry for entry in entities if entry.get("file") in names),
+        key=lambda e: (e["file"], e["offset"]),
+    )
+
+    by_type: dict[str, int] = {}
+    for entry in entities:
+        by_type[entry["type"]] = by_type.get(entry["type"], 0) + 1
+    index_data = {
+        "files_indexed": len(md_files),
+        "entities_by_type": by_type,
+        "entities": entities,
+    }
+    write_json_atomic(index_path, index_data)
+    logger.info("Indexed %d entities. Index: %s", len(entities), index_path)
+    return len(entities)
+
+
+def _previous_index_entries(index_path: Path) -> list[dict[str, Any]]:
+    """Entries of an earlier entity index."""
+    if not index_path.exists():
+        return []
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable entity index %s: %s", index_path, exc)
+        return []
+    return [entry for entry in data.get("entities", []) if isinstance(entry, dict)]
+
+
+def _file_groups(files: list[Path]) -> list[list[Path]]:
+    """Split *files* into consecutive groups of about ``_GROUP_MAX_CHARS``."""
+    groups: list[list[Path]] = []
+    current: list[Path] = []
+    size = 0
+    for path in files:
+        length = path.stat().st_size
+        if current and size + length > _GROUP_MAX_CHARS:
+            groups.append(current)
+            current, size = [], 0
+        current.append(path)
+        size += length
+    if current:
+        groups.append(current)
+    return groups
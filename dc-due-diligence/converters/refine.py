@@ -0,0 +1,408 @@
+"""
+Background Docling refinement of progressive-mode drafts.
+
+``convert_folder(progressive=True)`` writes instant text-layer drafts (see
+:mod:`converters.draft_converter`), marks every Docling-bound file
+``refinement="pending"`` in the manifest, and starts this module detached::
+
+    .venv/bin/python3 -m converters.refine <opportunity_folder>
+
+Each pending file is converted with Docling (in batches, with the profile
+recorded in the manifest, and images pre-processed as the pipeline does),
+redacted, and renamed over its draft.  The manifest entry is then replaced
+atomically, so an agent reading the manifest at any moment sees either the
+draft or the refined version, never a half-written file.
+``redaction-report.json``, the manifest's redaction summary and
+``entity-index.json`` are updated to match.
+
+If Docling fails on a drafted file the draft is kept and the entry is
+marked ``refinement="failed"``.  Only one refinement runs per folder at a
+time (``_converted/refine.lock``); a running refinement picks up files
+queued by a newer pipeline run before it exits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from converters.docling_converter import DoclingConverter
+from converters.document_store import DOCUMENTS_DIR_NAME
+from converters.image_prep import IMAGE_TYPES, prepare_image
+from converters.lazy import LazyPolicy
+from converters.manifest import manifest_entry, update_json
+from converters.page_cache import CACHE_DIR_NAME, PageCache
+from converters.pipeline import CONVERTED_DIR_NAME, MANIFEST_FILENAME, record_extraction
+from converters.profiles import get_profile
+from converters.redactor import (
+    RedactionResult,
+    get_backend as redaction_backend_in_use,
+    get_cascade as redaction_cascade_in_use,
+    redact_file,
+    redaction_state,
+    set_backend as set_redaction_backend,
+    set_cascade as set_redaction_cascade,
+    update_entity_index,
+)
+from converters.resources import configure as configure_threads
+from converters.scanner import FileEntry, FileType
+from converters.workspace import work_dir
+
+logger = logging.getLogger(__name__)
+
+# Lock file that keeps two refinements of one folder from running at once.
+REFINE_LOCK_FILENAME = "refine.lock"
+
+# Redaction report written by ``redactor.redact_converted_folder``.
+_REDACTION_REPORT_FILENAME = "redaction-report.json"
+
+
+def refine_folder(
+    folder_path: str | Path,
+    save_documents: bool = False,
+    use_page_cache: bool = True,
+    lazy: bool = False,
+    prepare_images: bool = True,
+    cpu_cores: int | None = None,
+    redaction_backend: str | None = None,
+    screen_model: str | None = None,
+    index_entities: bool = False,
+) -> int:
+    """Replace every pending draft in a progressive-mode folder.
+
+    Parameters
+    ----------
+    folder_path:
+        The opportunity folder the pipeline ran on.
+    save_documents, use_page_cache, lazy, prepare_images:
+        As for :func:`~converters.pipeline.convert_folder`.
+    cpu_cores, redaction_backend:
+        As for :func:`~converters.pipeline.convert_folder`.
+    screen_model:
+        Screening model for the redaction cascade (see
+        :func:`converters.redactor.set_cascade`); None keeps the default.
+    index_entities:
+        As for :func:`~converters.pipeline.convert_folder`: each refined
+        file's preserved entities replace its draft's in
+        ``entity-index.json``.  Without it, the draft's entries are dropped.
+
+    Returns
+    -------
+    int
+        Number of files successfully refined.  0 if another refinement of
+        the folder is already running.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the folder has no pipeline manifest.
+    """
+    converted_dir = Path(folder_path).resolve() / CONVERTED_DIR_NAME
+    manifest_path = converted_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No manifest found: {manifest_path}")
+
+    lock_path = converted_dir / REFINE_LOCK_FILENAME
+    if not _acquire_lock(lock_path):
+        logger.info("Refinement already running for %s", converted_dir)
+        return 0
+
+    try:
+        configure_threads(cpu_cores)
+        if redaction_backend is not None:
+            set_redaction_backend(redaction_backend)
+        if screen_model is not None:
+            set_redaction_cascade(screen_model)
+        folder_work_dir = work_dir(converted_dir.parent)
+        docling = DoclingConverter(
+            page_cache=(
+                PageCache(folder_work_dir / CACHE_DIR_NAME / "pages")
+                if use_page_cache
+                else None
+            ),
+            lazy=LazyPolicy() if lazy else None,
+        )
+        documents_dir = (
+            folder_work_dir / DOCUMENTS_DIR_NAME if save_documents else None
+        )
+        image_dir = (
+            folder_work_dir / CACHE_DIR_NAME / "images" if prepare_images else None
+        )
+
+        refined = 0
+        attempted: set[str] = set()
+        # Loop until nothing is pending: a newer pipeline run may queue more
+        # files while this one is busy (its own refinement finds the lock).
+        while True:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            pending = [
+                entry
+                for entry in manifest.get("files", [])
+                if entry.get("refinement") == "pending"
+                and entry["relative_path"] not in attempted
+            ]
+            if not pending:
+                break
+            attempted.update(entry["relative_path"] for entry in pending)
+
+            by_profile: dict[str | None, list[dict[str, Any]]] = {}
+            for entry in pending:
+                by_profile.setdefault(entry.get("profile"), []).append(entry)
+            for profile_name, entries in by_profile.items():
+                refined += _refine_batch(
+                    docling,
+                    entries,
+                    profile_name,
+                    converted_dir,
+                    documents_dir,
+                    image_dir,
+                    index_entities,
+                )
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+    logger.info("Refinement complete: %d files refined", refined)
+    return refined
+
+
+def _refine_batch(
+    docling: DoclingConverter,
+    entries: list[dict[str, Any]],
+    profile_name: str | None,
+    converted_dir: Path,
+    documents_dir: Path | None,
+    image_dir: Path | None = None,
+    index: bool = False,
+) -> int:
+    """Convert *entries* (manifest records) and land each result.
+
+    With *image_dir*, images are oriented and downscaled there first, as
+    the pipeline does (see :func:`converters.image_prep.prepare_image`).
+    Images without text and near-duplicates were settled by the pipeline
+    and are never pending.
+    """
+    profile = get_profile(profile_name)
+    by_path: dict[Path, dict[str, Any]] = {}
+    for entry in entries:
+        path = Path(entry["original_path"]).resolve()
+        if image_dir is not None and FileType(entry["file_type"]) in IMAGE_TYPES:
+            image = prepare_image(path, image_dir)
+            if image is not None:
+                path = image.path.resolve()
+        by_path[path] = entry
+    manifest_path = converted_dir / MANIFEST_FILENAME
+    refined = 0
+
+    start = time.monotonic()
+    for extraction in docling.convert_many(list(by_path), profile=profile):
+        elapsed = time.monotonic() - start
+        entry = by_path.pop(extraction.source_path)
+        extraction.source_path = Path(entry["original_path"])
+        redactions: list[RedactionResult] = []
+        record = record_extraction(
+            _file_entry(entry),
+            converted_dir / entry["converted_filename"],
+            extraction,
+            elapsed,
+            profile.name,
+            documents_dir,
+            redact=lambda path: redactions.append(redact_file(path, index=index)),
+        )
+
+        redaction_summary = None
+        if record.success:
+            record.refinement = "done"
+            update = manifest_entry(record)
+            redaction_summary = _update_redaction_report(
+                converted_dir, record.converted_filename, redactions[0], index
+            )
+            refined += 1
+        elif entry.get("success"):
+            # Keep the draft; it is still better than nothing.
+            update = {
+                "relative_path": entry["relative_path"],
+                "refinement": "failed",
+                "error": record.error,
+            }
+        else:
+            record.refinement = "failed"
+            update = manifest_entry(record)
+
+        _update_manifest(manifest_path, update, redaction_summary)
+        logger.info(
+            "Refined %s (%s)", entry["relative_path"], update["refinement"]
+        )
+        start = time.monotonic()
+
+    return refined
+
+
+def _file_entry(entry: dict[str, Any]) -> FileEntry:
+    return FileEntry(
+        path=Path(entry["original_path"]),
+        relative_path=Path(entry["relative_path"]),
+        file_type=FileType(entry["file_type"]),
+        converter=entry["converter"],
+        size_bytes=entry["size_bytes"],
+    )
+
+
+def _update_manifest(
+    manifest_path: Path,
+    update: dict[str, Any],
+    redaction_summary: dict[str, Any] | None,
+) -> None:
+    """Merge *update* into its file's manifest entry and rewrite atomically.
+
+    The manifest is re-read under the manifest lock (see
+    :func:`converters.manifest.update_json`) so concurrent writers --
+    on-demand page conversion, a newer pipeline run -- are not clobbered.
+    Entries that are no longer pending were superseded and are left alone.
+    """
+    with update_json(manifest_path) as manifest:
+        files = manifest.get("files", [])
+        for index, entry in enumerate(files):
+            if entry.get("relative_path") == update["relative_path"]:
+                if entry.get("refinement") != "pending":
+                    return
+                files[index] = {**entry, **update}
+                break
+        else:
+            return
+
+        summary = manifest.setdefault("pipeline_summary", {})
+        summary["converted"] = sum(1 for f in files if f.get("success"))
+        summary["failed"] = sum(
+            1
+            for f in files
+            if not f.get("success")
+            and f.get("converter") is not None
+            and f.get("refinement") != "pending"
+            and f.get("duplicate_of") is None
+        )
+        if redaction_summary is not None:
+            manifest["redaction_summary"] = {
+                **(manifest.get("redaction_summary") or {}),
+                **redaction_summary,
+            }
+
+
+def _update_redaction_report(
+    converted_dir: Path,
+    filename: str,
+    redaction: RedactionResult,
+    index: bool = False,
+) -> dict[str, Any]:
+    """Replace *filename*'s entry in the redaction report and re-total it.
+
+    The file's entries in ``entity-index.json`` are replaced too (see
+    :func:`converters.redactor.update_entity_index`).  Returns the summary
+    in the shape the manifest's ``redaction_summary`` uses.
+    """
+    entities_indexed = update_entity_index(
+        converted_dir, {filename: redaction.indexed}
+    )
+    report_path = converted_dir / _REDACTION_REPORT_FILENAME
+    with update_json(report_path) as report:
+        files = [f for f in report.get("files", []) if f.get("file") != filename]
+        files.append({
+            "file": filename,
+            "entities_found": redaction.entities_found,
+            "entity_types": [ent.label for ent in redaction.entities],
+            **redaction_state(converted_dir / filename, index),
+        })
+        files.sort(key=lambda f: f["file"])
+        by_type = Counter(label for f in files for label in f["entity_types"])
+
+        summary = {
+            "files_scanned": len(files),
+            "files_redacted": sum(1 for f in files if f["entities_found"] > 0),
+            "total_entities_redacted": sum(f["entities_found"] for f in files),
+            "entities_by_type": dict(sorted(by_type.items())),
+        }
+        if entities_indexed or "entities_indexed" in report:
+            summary["entities_indexed"] = entities_indexed
+        # Throughput fields from the pipeline run are kept as they were.
+        report.update(summary, files=files)
+    return {
+        **summary,
+        "backend": redaction_backend_in_use(),
+        "screen_model": redaction_cascade_in_use(),
+    }
+
+
+def _acquire_lock(lock_path: Path) -> bool:
+    """Create *lock_path* holding our pid; False if a live process holds it."""
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not _lock_is_stale(lock_path):
+                return False
+            lock_path.unlink(missing_ok=True)
+            continue
+        with os.fdopen(fd, "w") as lock:
+            lock.write(str(os.getpid()))
+        return True
+    return False
+
+
+def _lock_is_stale(lock_path: Path) -> bool:
+    try:
+        pid = int(lock_path.read_text())
+    except (OSError, ValueError):
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replace progressive-mode drafts with Docling conversions."
+    )
+    parser.add_argument("folder", type=Path, help="Opportunity folder")
+    parser.add_argument("--save-documents", action="store_true")
+    parser.add_argument("--no-page-cache", action="store_true")
+    parser.add_argument("--lazy", action="store_true")
+    parser.add_argument("--no-image-prep", action="store_true")
+    parser.add_argument("--cpu-cores", type=int, default=None)
+    parser.add_argument("--redaction-backend", default=None)
+    parser.add_argument("--screen-model", default=None)
+    parser.add_argument("--index-entities", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s"
+    )
+    try:
+        refine_folder(
+            args.folder,
+            save_documents=args.save_documents,
+            use_page_cache=not args.no_page_cache,
+            lazy=args.lazy,
+            prepare_images=not args.no_image_prep,
+            cpu_cores=args.cpu_cores,
+            redaction_backend=args.redaction_backend,
+            screen_model=args.screen_model,
+            index_entities=args.index_entities,
+        )
+    except FileNotFoundError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
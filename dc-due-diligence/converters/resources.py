@@ -0,0 +1,172 @@
+"""
+CPU thread budget shared by every model the pipeline runs.
+
+Docling's layout and TableFormer models (torch), RapidOCR's ONNX Runtime
+sessions and GLiNER (torch) each default to one thread per core.  Run
+several of them at once -- a background refinement next to a pipeline run,
+or parallel redaction workers -- and they oversubscribe the CPU so badly
+that throughput drops.  This module owns one core budget per process and
+splits it between workers:
+
+* ``intra_op_threads`` -- threads one operator may use: torch's intra-op
+  pool, ONNX Runtime's ``intra_op_num_threads``, OpenMP/MKL, and Docling's
+  ``AcceleratorOptions.num_threads`` (which feeds the first three);
+* ``inter_op_threads`` -- threads for independent operators, kept at 1:
+  the pipeline's models are sequential graphs, and workers already provide
+  the parallelism.
+
+The budget defaults to the cores this process may run on, or
+``DD_CPU_CORES`` when set.  :func:`configure` changes it (the pipeline's
+``cpu_cores`` option); :func:`thread_settings` returns what is in force
+and :func:`apply_thread_settings` pushes it into the runtimes.  The
+pipeline records the settings in the manifest.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+# Environment variable holding the process's core budget.
+CPU_CORES_ENV = "DD_CPU_CORES"
+
+# Environment variables read by OpenMP, MKL, OpenBLAS and Docling when their
+# runtimes start.
+_THREAD_ENV_VARS: tuple[str, ...] = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "DOCLING_NUM_THREADS",
+)
+
+
+@dataclass(frozen=True)
+class ThreadSettings:
+    """How a process's core budget is split.
+
+    Attributes:
+        cores: Total cores the budget allows.
+        workers: Workers (processes or model threads) sharing the budget.
+        intra_op_threads: Threads each worker's models may use per operator.
+        inter_op_threads: Threads each worker may use across operators.
+    """
+
+    cores: int
+    workers: int
+    intra_op_threads: int
+    inter_op_threads: int
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def available_cores() -> int:
+    """Cores this process may run on (respects CPU affinity and cgroups)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # macOS, Windows
+        return max(1, os.cpu_count() or 1)
+
+
+def split_budget(cores: int, workers: int = 1) -> ThreadSettings:
+    """Divide *cores* between *workers*, giving each at least one thread.
+
+    Raises
+    ------
+    ValueError
+        If *cores* or *workers* is less than 1.
+    """
+    if cores < 1 or workers < 1:
+        raise ValueError(
+            f"Core budget and worker count must be positive: {cores}, {workers}"
+        )
+    return ThreadSettings(
+        cores=cores,
+        workers=workers,
+        intra_op_threads=max(1, cores // workers),
+        inter_op_threads=1,
+    )
+
+
+def _default_cores() -> int:
+    value = os.environ.get(CPU_CORES_ENV)
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", CPU_CORES_ENV, value)
+    return available_cores()
+
+
+# Settings in force for this process (None until first used).
+_settings: ThreadSettings | None = None
+
+# Whether torch's thread pools were sized yet (torch allows it only once).
+_torch_configured: bool = False
+
+
+def configure(cores: int | None = None, workers: int = 1) -> ThreadSettings:
+    """Set this process's core budget and apply it.
+
+    Parameters
+    ----------
+    cores:
+        Cores the pipeline may use.  None for ``DD_CPU_CORES`` or every
+        core available.
+    workers:
+        Workers that will share the budget concurrently.
+
+    Returns
+    -------
+    ThreadSettings
+        The settings now in force.
+    """
+    global _settings
+    _settings = split_budget(cores or _default_cores(), workers)
+    apply_thread_settings(_settings)
+    return _settings
+
+
+def thread_settings() -> ThreadSettings:
+    """The settings in force, configuring the default budget on first use."""
+    if _settings is None:
+        return configure()
+    return _settings
+
+
+def apply_thread_settings(settings: ThreadSettings | None = None) -> None:
+    """Size OpenMP, MKL, Docling and torch thread pools to *settings*.
+
+    The environment variables cover runtimes that have not started yet
+    (ONNX Runtime sessions built by Docling read ``DOCLING_NUM_THREADS``
+    through ``AcceleratorOptions``).  torch is only touched if it is
+    installed; its inter-op pool can be sized once per process, so later
+    calls only change the intra-op pool.
+    """
+    global _torch_configured
+    settings = settings or thread_settings()
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(settings.intra_op_threads)
+
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(settings.intra_op_threads)
+    if not _torch_configured:
+        try:
+            torch.set_num_interop_threads(settings.inter_op_threads)
+        except RuntimeError:
+            # Parallel work already ran; torch keeps its current pool.
+            logger.debug("torch inter-op threads already fixed")
+        _torch_configured = True
+    logger.debug(
+        "Thread settings: %d intra-op, %d inter-op (%d cores, %d workers)",
+        settings.intra_op_threads,
+        settings.inter_op_threads,
+        settings.cores,
+        settings.workers,
+    )
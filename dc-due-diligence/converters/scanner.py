@@ -5,6 +5,10 @@ Walks an opportunity folder recursively, identifies every file's type using
 both extension matching and MIME-type detection, and produces a processing
 plan that maps each file to the converter that will handle it.  Unknown or
 unsupported file types are flagged in the plan but never stop processing.
+
+Folders without any PDFs or images need no layout analysis; their CSV, HTML
+and DOCX files are routed to lightweight native converters instead of
+Docling.
 """
 
 from __future__ import annotations
@@ -76,11 +80,14 @@ _MIME_TO_TYPE: dict[str, FileType] = {
 }
 
 # Maps FileType values to the converter class name that handles them.
-# All supported types route to DoclingConverter (fully offline).
+# Everything except Excel workbooks routes to DoclingConverter (fully offline)
+# unless the folder needs no layout analysis -- see ``_NATIVE_CONVERTERS``
+# below.  Workbooks are always streamed by SpreadsheetConverter: Docling
+# loads the whole workbook into memory and cannot read XLSB at all.
 _TYPE_TO_CONVERTER: dict[FileType, str] = {
     FileType.PDF: "DoclingConverter",
-    FileType.XLSX: "DoclingConverter",
-    FileType.XLSB: "DoclingConverter",
+    FileType.XLSX: "SpreadsheetConverter",
+    FileType.XLSB: "SpreadsheetConverter",
     FileType.DOCX: "DoclingConverter",
     FileType.PPTX: "DoclingConverter",
     FileType.CSV: "DoclingConverter",
@@ -92,6 +99,25 @@ _TYPE_TO_CONVERTER: dict[FileType, str] = {
     FileType.IMAGE_WEBP: "DoclingConverter",
 }
 
+# File types whose conversion needs Docling's layout and table models.
+_LAYOUT_TYPES: frozenset[FileType] = frozenset({
+    FileType.PDF,
+    FileType.IMAGE_PNG,
+    FileType.IMAGE_JPG,
+    FileType.IMAGE_TIFF,
+    FileType.IMAGE_BMP,
+    FileType.IMAGE_WEBP,
+})
+
+# Lightweight converters (see ``converters.native_converter``) that replace
+# DoclingConverter when nothing in the folder needs layout analysis, so the
+# Docling models are never loaded.
+_NATIVE_CONVERTERS: dict[FileType, str] = {
+    FileType.CSV: "CsvConverter",
+    FileType.HTML: "HtmlConverter",
+    FileType.DOCX: "DocxConverter",
+}
+
 # Files and directories that should be skipped during scanning.
 _SKIP_NAMES: set[str] = {
     ".DS_Store",
@@ -105,10 +131,13 @@ _SKIP_NAMES: set[str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     """A single file discovered during scanning.
 
+    Declared with ``__slots__`` so large scans (100k+ files) don't carry a
+    per-instance ``__dict__``.
+
     Attributes:
         path: Absolute path to the file.
         relative_path: Path relative to the scanned root folder.
@@ -129,6 +158,11 @@ class FileEntry:
 class ScanResult:
     """The complete result of scanning an opportunity folder.
 
+    Entries are indexed as they are added via :meth:`add`, so the aggregate
+    views below are O(1) to read no matter how large the scan is.  Always
+    go through :meth:`add` rather than appending to ``files`` directly, or
+    the indexes will drift out of sync.
+
     Attributes:
         root: The folder that was scanned.
         files: All discovered files, in the order they were found.
@@ -140,29 +174,72 @@ class ScanResult:
 
     root: Path
     files: list[FileEntry] = field(default_factory=list)
+    _supported: list[FileEntry] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _unsupported: list[FileEntry] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _by_type: dict[FileType, list[FileEntry]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _by_relative_path: dict[Path, FileEntry] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _total_size_bytes: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Index any entries handed to the constructor.
+        initial, self.files = self.files, []
+        for entry in initial:
+            self.add(entry)
+
+    def add(self, entry: FileEntry) -> None:
+        """Append *entry* and update every index incrementally."""
+        self.files.append(entry)
+        if entry.converter is not None:
+            self._supported.append(entry)
+        else:
+            self._unsupported.append(entry)
+        self._by_type.setdefault(entry.file_type, []).append(entry)
+        self._by_relative_path[entry.relative_path] = entry
+        self._total_size_bytes += entry.size_bytes
 
     @property
     def supported(self) -> list[FileEntry]:
-        """Files that have a matching converter."""
-        return [f for f in self.files if f.converter is not None]
+        """Files that have a matching converter (do not mutate)."""
+        return self._supported
 
     @property
     def unsupported(self) -> list[FileEntry]:
-        """Files with no matching converter."""
-        return [f for f in self.files if f.converter is None]
+        """Files with no matching converter (do not mutate)."""
+        return self._unsupported
 
     @property
     def total_size_bytes(self) -> int:
         """Combined size of all discovered files."""
-        return sum(f.size_bytes for f in self.files)
+        return self._total_size_bytes
 
     @property
     def type_counts(self) -> dict[FileType, int]:
         """Count of files grouped by detected type."""
-        counts: dict[FileType, int] = {}
-        for entry in self.files:
-            counts[entry.file_type] = counts.get(entry.file_type, 0) + 1
-        return counts
+        return {
+            file_type: len(entries)
+            for file_type, entries in self._by_type.items()
+        }
+
+    def by_type(self, file_type: FileType) -> list[FileEntry]:
+        """Files of the given type, in discovery order (do not mutate)."""
+        return self._by_type.get(file_type, [])
+
+    def get(self, relative_path: str | Path) -> FileEntry | None:
+        """Look up an entry by its path relative to the scan root."""
+        return self._by_relative_path.get(Path(relative_path))
+
+    @property
+    def needs_layout_analysis(self) -> bool:
+        """True if any file needs Docling's layout models (PDFs, images)."""
+        return any(self._by_type.get(t) for t in _LAYOUT_TYPES)
 
     def summary(self) -> str:
         """Human-readable summary of the scan results."""
@@ -180,7 +257,7 @@ class ScanResult:
                 counts.items(), key=lambda x: x[1], reverse=True
             ):
                 label = file_type.value
-                converter = _TYPE_TO_CONVERTER.get(file_type, "none")
+                converter = self._by_type[file_type][0].converter or "none"
                 lines.append(f"  {label}: {count} -> {converter}")
 
         return "\n".join(lines)
@@ -266,7 +343,7 @@ def scan_folder(folder_path: str | Path) -> ScanResult:
             size_bytes=size_bytes,
         )
 
-        result.files.append(entry)
+        result.add(entry)
 
         if file_type == FileType.UNKNOWN:
             logger.warning(
@@ -275,6 +352,13 @@ def scan_folder(folder_path: str | Path) -> ScanResult:
                 item.suffix or "(none)",
             )
 
+    # A folder with no PDFs or images never needs the Docling models, so
+    # structured formats go through the native converters instead.
+    if not result.needs_layout_analysis:
+        for file_type, converter_name in _NATIVE_CONVERTERS.items():
+            for entry in result.by_type(file_type):
+                entry.converter = converter_name
+
     logger.info(
         "Scan complete: %d files found (%d supported, %d unsupported)",
         len(result.files),
@@ -0,0 +1,222 @@
+"""
+Cheap per-page analysis of a PDF's embedded text layer.
+
+Most broker decks and contracts are born-digital: every page already carries
+a usable text layer, so running OCR over them is wasted work.  This module
+reads the text layer with pypdfium2 (already a Docling dependency, no models
+involved) and decides page by page whether OCR is actually needed -- either
+because the page has no text at all (a scan), the text is garbled (broken
+font encodings), or the page is dominated by an image with little text.
+"""
+
+from __future__ import annotations
+
+import logging
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+logger = logging.getLogger(__name__)
+
+# A page needs at least this many non-whitespace characters in its text
+# layer to be considered born-digital.
+_MIN_TEXT_CHARS: int = 40
+
+# Pages where images cover at least this fraction of the page area need more
+# text than usual before we trust the text layer (e.g. a scanned exhibit with
+# a typed header stamped on top).
+_IMAGE_COVERAGE_THRESHOLD: float = 0.5
+_MIN_TEXT_CHARS_WITH_IMAGES: int = 200
+
+# Text layers where more than this fraction of characters are unmapped
+# glyphs, private-use codepoints, or control characters are treated as
+# garbled and OCR'd instead.
+_MAX_GARBLED_RATIO: float = 0.2
+
+# Real text is mostly letters and digits; a layer that is mostly symbols
+# usually comes from a font with a broken ToUnicode map.
+_MIN_ALNUM_RATIO: float = 0.4
+
+
+@dataclass
+class PageTextLayer:
+    """Text-layer analysis of a single PDF page.
+
+    Attributes:
+        page_no: 1-based page number.
+        char_count: Non-whitespace characters in the embedded text layer.
+        garbled_ratio: Fraction of those characters that look like
+            unmapped or corrupt glyphs.
+        image_coverage: Fraction of the page area covered by images.
+        needs_ocr: True when the text layer is not usable on its own.
+        text: The extracted text layer (empty unless requested).
+    """
+
+    page_no: int
+    char_count: int
+    garbled_ratio: float
+    image_coverage: float
+    needs_ocr: bool
+    text: str = ""
+
+
+@dataclass
+class TextLayerReport:
+    """Per-page text-layer analysis of a whole PDF."""
+
+    path: Path
+    pages: list[PageTextLayer] = field(default_factory=list)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def ocr_pages(self) -> list[int]:
+        """1-based numbers of the pages that need OCR."""
+        return [p.page_no for p in self.pages if p.needs_ocr]
+
+    @property
+    def is_scanned(self) -> bool:
+        """True when most pages have no usable text layer."""
+        return bool(self.pages) and len(self.ocr_pages) * 2 > len(self.pages)
+
+    def ocr_segments(self) -> list[tuple[bool, int, int]]:
+        """Group pages into contiguous runs that share an OCR decision.
+
+        Returns ``(needs_ocr, first_page, last_page)`` tuples (1-based,
+        inclusive) covering every page in order.
+        """
+        segments: list[tuple[bool, int, int]] = []
+        for page in self.pages:
+            if segments and segments[-1][0] == page.needs_ocr:
+                needs_ocr, first, _ = segments[-1]
+                segments[-1] = (needs_ocr, first, page.page_no)
+            else:
+                segments.append((page.needs_ocr, page.page_no, page.page_no))
+        return segments
+
+
+def analyze_pdf_text_layer(
+    path: Path,
+    keep_text: bool = False,
+) -> TextLayerReport | None:
+    """Inspect every page's embedded text layer and decide where OCR is needed.
+
+    Parameters
+    ----------
+    path:
+        PDF file to analyze.
+    keep_text:
+        If True, store each page's extracted text on the returned
+        :class:`PageTextLayer` records.
+
+    Returns
+    -------
+    TextLayerReport | None
+        The per-page analysis, or None if the PDF could not be opened
+        (callers should then fall back to OCR'ing everything).
+    """
+    path = Path(path)
+    try:
+        pdf = pdfium.PdfDocument(str(path))
+    except Exception as exc:
+        logger.warning("Could not read text layer of %s: %s", path.name, exc)
+        return None
+
+    report = TextLayerReport(path=path)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                report.pages.append(_analyze_page(page, index + 1, keep_text))
+            finally:
+                page.close()
+    except Exception as exc:
+        logger.warning("Text-layer analysis failed for %s: %s", path.name, exc)
+        return None
+    finally:
+        pdf.close()
+
+    logger.debug(
+        "Text layer of %s: %d/%d pages need OCR",
+        path.name,
+        len(report.ocr_pages),
+        report.page_count,
+    )
+    return report
+
+
+def _analyze_page(page: pdfium.PdfPage, page_no: int, keep_text: bool) -> PageTextLayer:
+    """Analyze one page's text layer and image coverage."""
+    textpage = page.get_textpage()
+    try:
+        text = textpage.get_text_range()
+    finally:
+        textpage.close()
+
+    chars = [ch for ch in text if not ch.isspace()]
+    char_count = len(chars)
+    garbled = garbled_ratio(chars)
+    coverage = _image_coverage(page)
+
+    if char_count < _MIN_TEXT_CHARS:
+        needs_ocr = True
+    elif garbled > _MAX_GARBLED_RATIO:
+        needs_ocr = True
+    elif _alnum_ratio(chars) < _MIN_ALNUM_RATIO:
+        needs_ocr = True
+    elif (
+        coverage >= _IMAGE_COVERAGE_THRESHOLD
+        and char_count < _MIN_TEXT_CHARS_WITH_IMAGES
+    ):
+        needs_ocr = True
+    else:
+        needs_ocr = False
+
+    return PageTextLayer(
+        page_no=page_no,
+        char_count=char_count,
+        garbled_ratio=round(garbled, 3),
+        image_coverage=round(coverage, 3),
+        needs_ocr=needs_ocr,
+        text=text if keep_text else "",
+    )
+
+
+def garbled_ratio(chars: list[str] | str) -> float:
+    """Fraction of non-whitespace characters that look like corrupt glyphs."""
+    total = 0
+    bad = 0
+    for ch in chars:
+        if ch.isspace():
+            continue
+        total += 1
+        if ch == "\ufffd" or unicodedata.category(ch) in ("Co", "Cc", "Cn"):
+            bad += 1
+    return bad / total if total else 0.0
+
+
+def _alnum_ratio(chars: list[str]) -> float:
+    """Fraction of characters that are letters or digits."""
+    if not chars:
+        return 0.0
+    return sum(1 for ch in chars if ch.isalnum()) / len(chars)
+
+
+def _image_coverage(page: pdfium.PdfPage) -> float:
+    """Fraction of the page area covered by image objects (capped at 1.0)."""
+    width, height = page.get_size()
+    page_area = width * height
+    if page_area <= 0:
+        return 0.0
+
+    covered = 0.0
+    for obj in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)):
+        left, bottom, right, top = obj.get_pos()
+        covered += max(0.0, right - left) * max(0.0, top - bottom)
+
+    return min(1.0, covered / page_area)
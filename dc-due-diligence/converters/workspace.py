@@ -0,0 +1,32 @@
+"""
+Per-folder work area for unredacted intermediates.
+
+``_converted/`` is the staging folder agents read, and redaction only
+rewrites its markdown.  Anything else derived from the source documents --
+saved DoclingDocuments, cached page conversions, pre-processed images --
+holds the original, unredacted content, so it is kept out of
+``_converted/`` in a work folder of its own under the user's cache
+(``~/.cache/dc-due-diligence/folders``, or ``DD_WORK_DIR``).
+
+Each opportunity folder gets one work folder, named after the folder and a
+hash of its resolved path, so reruns on the same folder find their caches
+and two folders with the same name never share one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+# Environment variable overriding where work folders are created.
+WORK_DIR_ENV = "DD_WORK_DIR"
+_DEFAULT_WORK_ROOT = Path.home() / ".cache" / "dc-due-diligence" / "folders"
+
+
+def work_dir(root: str | Path) -> Path:
+    """The work folder for the opportunity folder *root* (not created)."""
+    root = Path(root).resolve()
+    base = Path(os.environ.get(WORK_DIR_ENV) or _DEFAULT_WORK_ROOT)
+    digest = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return base / f"{root.name}-{digest}"
@@ -0,0 +1,27 @@
+"""Shared fixtures for the converter tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from converters import redactor
+from converters.detection_cache import DetectionCache
+from converters.workspace import WORK_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def fresh_detection_cache(monkeypatch):
+    """Give every test an empty in-memory detection cache.
+
+    Tests swap in fake models, so detections cached by one test must not
+    answer for another.
+    """
+    monkeypatch.setattr(redactor, "_detection_cache", DetectionCache())
+
+
+@pytest.fixture(autouse=True)
+def work_root(tmp_path_factory, monkeypatch):
+    """Keep every test's work folders out of the user's cache."""
+    root = tmp_path_factory.mktemp("work")
+    monkeypatch.setenv(WORK_DIR_ENV, str(root))
+    return root
@@ -0,0 +1,166 @@
+"""
+Tests for adaptive OCR: a cheap first pass, a careful retry of pages with
+low recognition confidence, and OCR confidence in the document confidence.
+
+Docling is replaced with a fake that builds real ``DoclingDocument``s and
+reports per-page OCR scores, so no models are needed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from docling.datamodel.base_models import ConfidenceReport
+
+from converters import docling_converter
+from converters.base import ConfidenceLevel
+from converters.docling_converter import (
+    DoclingConverter,
+    _splice_pages,
+    _with_ocr_confidence,
+)
+from tests.test_page_cache import _convert_pages
+from tests.test_text_layer import make_pdf
+
+
+# ------------------------------------------------------------------
+# Fakes
+# ------------------------------------------------------------------
+
+
+class _FakeOcrConverter:
+    """Scans with fixed per-page OCR scores for each pass."""
+
+    def __init__(self, scores: dict[int, float], calls: list, retry: bool) -> None:
+        self.scores = scores
+        self.calls = calls
+        self.retry = retry
+
+    def convert(self, source, raises_on_error=True, page_range=(1, 10**9)):
+        self.calls.append((self.retry, page_range))
+        document = _convert_pages(Path(source), *page_range)
+        if self.retry:
+            for item in document.texts:
+                item.text = item.orig = f"{item.text} (retried)"
+        confidence = ConfidenceReport()
+        for page_no in document.pages:
+            confidence.pages[page_no].ocr_score = self.scores[page_no]
+        return SimpleNamespace(
+            status=docling_converter.ConversionStatus.SUCCESS,
+            errors=[],
+            document=document,
+            confidence=confidence,
+        )
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    """Install first-pass and retry scores; returns the recorded calls."""
+    calls: list[tuple[bool, tuple[int, int]]] = []
+    passes = {False: {}, True: {}}
+
+    def install(first: dict[int, float], retry: dict[int, float]) -> list:
+        passes[False].update(first)
+        passes[True].update(retry)
+        return calls
+
+    monkeypatch.setattr(
+        docling_converter,
+        "_get_converter",
+        lambda profile=None, do_ocr=True, retry=False: _FakeOcrConverter(
+            passes[retry], calls, retry
+        ),
+    )
+    return install
+
+
+# ------------------------------------------------------------------
+# Retry pass
+# ------------------------------------------------------------------
+
+
+class TestAdaptiveOcr:
+    """Tests for re-OCR'ing only the pages that were read poorly."""
+
+    def test_only_weak_pages_retried(self, tmp_path: Path, fake_ocr):
+        """Page 2 is retried alone and its better reading replaces it."""
+        calls = fake_ocr({1: 0.95, 2: 0.4, 3: 0.9}, {2: 0.85})
+        pdf = make_pdf(tmp_path / "scan.pdf", [None, None, None])
+
+        result = DoclingConverter(profile="balanced").convert(pdf)
+
+        assert calls == [(False, (1, 10**9)), (True, (2, 2))]
+        assert result.page_count == 3
+        assert result.metadata["ocr_retried_pages"] == [2]
+        assert result.metadata["ocr_confidence"] == {1: 0.95, 2: 0.85, 3: 0.9}
+        text = result.text
+        assert "[scan 2] (retried)" in text
+        assert text.index("[scan 1]") < text.index("[scan 2]") < text.index("[scan 3]")
+        assert "[scan 1] (retried)" not in text
+
+    def test_worse_retry_is_discarded(self, tmp_path: Path, fake_ocr):
+        """A retry that reads the page no better keeps the first pass."""
+        fake_ocr({1: 0.7}, {1: 0.6})
+        pdf = make_pdf(tmp_path / "scan.pdf", [None])
+
+        result = DoclingConverter(profile="balanced").convert(pdf)
+
+        assert result.metadata["ocr_retried_pages"] == []
+        assert "(retried)" not in result.text
+
+    def test_profile_without_retry(self, tmp_path: Path, fake_ocr):
+        """The fast profile never pays for a second pass."""
+        calls = fake_ocr({1: 0.3}, {1: 0.99})
+        pdf = make_pdf(tmp_path / "scan.pdf", [None])
+
+        result = DoclingConverter(profile="fast").convert(pdf)
+
+        assert [retry for retry, _ in calls] == [False]
+        assert result.metadata["ocr_confidence"] == {1: 0.3}
+
+    def test_splice_keeps_page_numbers(self, tmp_path: Path):
+        """Spliced runs keep their original page numbers."""
+        pdf = make_pdf(tmp_path / "doc.pdf", ["a", "b", "c", "d", "e"])
+        original = _convert_pages(pdf, 3, 5)
+        retried = _convert_pages(pdf, 4, 4)
+
+        spliced = _splice_pages(
+            [(original, 3, 3), (retried, 4, 4), (original, 5, 5)]
+        )
+
+        assert sorted(spliced.pages) == [3, 4, 5]
+
+
+# ------------------------------------------------------------------
+# Document confidence
+# ------------------------------------------------------------------
+
+
+class TestOcrConfidence:
+    """Tests for folding OCR scores into the document confidence."""
+
+    def test_clean_ocr_keeps_confidence(self):
+        level, reason = _with_ocr_confidence(
+            ConfidenceLevel.HIGH, "ok", {1: 0.93, 2: 0.88}
+        )
+        assert (level, reason) == (ConfidenceLevel.HIGH, "ok")
+
+    def test_one_poor_page_caps_at_medium(self):
+        level, reason = _with_ocr_confidence(
+            ConfidenceLevel.HIGH, "ok", {1: 0.95, 2: 0.95, 3: 0.3}
+        )
+        assert level == ConfidenceLevel.MEDIUM
+        assert "1 of 3 pages below 0.5" in reason
+
+    def test_poor_mean_is_low(self):
+        level, reason = _with_ocr_confidence(
+            ConfidenceLevel.HIGH, "ok", {1: 0.5, 2: 0.3}
+        )
+        assert level == ConfidenceLevel.LOW
+        assert "poor OCR confidence (mean 0.40 over 2 pages)" in reason
+
+    def test_never_raises_confidence(self):
+        level, _ = _with_ocr_confidence(ConfidenceLevel.LOW, "sparse", {1: 0.7})
+        assert level == ConfidenceLevel.LOW
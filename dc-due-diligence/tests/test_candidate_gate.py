@@ -0,0 +1,110 @@
+"""
+Tests for the regex candidate gate that keeps PII-free text away from GLiNER.
+
+Uses the SSN-finding fake model from ``test_redaction_batching``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.pii_corpus import make_corpus
+from converters import redactor
+from tests.test_redaction_batching import _filler, fake_model  # noqa: F401  (fixture)
+
+
+class TestCandidateWindows:
+    """Tests for finding the windows GLiNER must read."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "123-45-6789",  # SSN
+            "12-3456789",  # EIN
+            "4111 1111 1111 1111",  # card
+            "DE89370400440532013000",  # IBAN
+            "021000021",  # routing number
+            "C03005988",  # passport
+            "D1234567",  # driver's license
+            "DL: D123-456",  # short dashed licence
+            "1EG4-TE5-MK73",  # dashed Medicare MBI
+            "Account No. 123456",  # short account number
+            "sort code 55 01 22",  # spaced digits
+            "CVV 123",
+            "exp 12/27",
+            "exp. 09/27",
+            "Card expires 09/27",
+        ],
+    )
+    def test_every_label_shape_is_a_candidate(self, value: str):
+        text = f"{_filler(1000)} {value} {_filler(1000)}"
+        assert len(redactor._model_windows(text)) == 1
+
+    def test_planted_values_are_in_windows(self):
+        """Every label the redactor removes is planted and reaches GLiNER."""
+        corpus = make_corpus(40, seed=1, filler_sentences=60)
+        planted = {value.label for document in corpus for value in document.planted}
+        assert set(redactor._LABEL_MAP.values()) <= planted
+
+        for document in corpus:
+            windows = redactor._model_windows(document.text)
+            for value in document.planted:
+                assert any(s <= value.start and value.end <= e for s, e in windows)
+
+    def test_prose_has_no_windows(self):
+        text = (
+            "The site offers 120 MW across 212 acres, with Phase 1 in Q3 2027 "
+            "at $48,500,000. Call (512) 555 or see parcel M-2. "
+        ) * 20
+        assert redactor._model_windows(text) == []
+
+    def test_window_has_context_and_whole_words(self):
+        text = _filler(2000) + " SSN 123-45-6789 " + _filler(2000)
+        ((start, end),) = redactor._model_windows(text)
+
+        assert text[start:end].count("123-45-6789") == 1
+        assert 500 <= end - start <= 700
+        assert start == 0 or text[start - 1].isspace()
+        assert end == len(text) or text[end].isspace()
+
+    def test_nearby_candidates_share_a_window(self):
+        text = "SSN 123-45-6789 and EIN 12-3456789. " + _filler(3000)
+        assert len(redactor._model_windows(text)) == 1
+
+    def test_ungated_is_whole_text(self):
+        assert redactor._model_windows("abc", gate=False) == [(0, 3)]
+
+
+class TestGatedRedaction:
+    """Tests for redacting with the gate on."""
+
+    def test_same_entities_as_full_scan(self, fake_model):
+        texts = [document.text for document in make_corpus(10, seed=3)]
+
+        gated = redactor._detect_pii_gliner_many(texts)
+        full = redactor._detect_pii_gliner_many(texts, gate=False)
+
+        assert [[(e["start"], e["end"]) for e in ents] for ents in gated] == [
+            [(e["start"], e["end"]) for e in ents] for ents in full
+        ]
+        assert any(gated)
+
+    def test_prose_never_reaches_the_model(self, fake_model):
+        results = redactor.redact_texts([_filler(5000)])
+
+        assert fake_model.batches == []
+        assert results[0].model_chars == 0
+
+    def test_report_records_skip_rate(self, tmp_path: Path, fake_model):
+        (tmp_path / "om.md").write_text(_filler(5000))
+        (tmp_path / "w9.md").write_text("Taxpayer SSN 123-45-6789.")
+
+        report = redactor.redact_converted_folder(tmp_path)
+
+        assert report.characters_to_model == len("Taxpayer SSN 123-45-6789.")
+        saved = json.loads((tmp_path / "redaction-report.json").read_text())
+        assert saved["model_skip_rate"] == round(report.model_skip_rate, 4)
+        assert 0.99 < saved["model_skip_rate"] < 1.0
@@ -0,0 +1,144 @@
+"""
+Tests for the per-chunk GLiNER detection cache.
+
+Uses the SSN-finding fake model from ``test_redaction_batching``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from converters import pipeline, redactor
+from converters.detection_cache import DetectionCache, normalize
+from converters.page_cache import CACHE_DIR_NAME
+from converters.redactor import RedactionReport
+from converters.workspace import work_dir
+from tests.test_redaction_batching import fake_model  # noqa: F401  (fixture)
+
+# A notice repeated on every file, long enough to hold the whole gate
+# window around the license number.
+NOTICE = (
+    "CONFIDENTIALITY NOTICE. This memorandum is furnished solely to assist "
+    "prospective purchasers in evaluating the property and may not be "
+    "reproduced or disclosed without the prior written consent of the "
+    "owner and its broker. Neither the owner nor the broker makes any "
+    "representation as to the accuracy of the information contained "
+    "herein.\nBroker license C03005988.\nAll summaries of leases, "
+    "interconnection agreements and utility tariffs are qualified in their "
+    "entirety by the documents themselves, copies of which are available "
+    "upon request. Prospective purchasers should conduct their own "
+    "independent investigation of the site, its power and its water supply "
+    "before making an offer.\n"
+)
+
+
+class TestNormalize:
+    """Tests for whitespace normalization and its position map."""
+
+    def test_whitespace_runs_collapse(self):
+        text = "SSN \n\n 123-45-6789\t end"
+        normalized, positions = normalize(text)
+
+        assert normalized == "SSN 123-45-6789 end"
+        for index, char in enumerate(normalized):
+            assert text[positions[index]] == char or char == " "
+        assert positions[normalized.index("end")] == text.index("end")
+
+
+class TestDetectionCache:
+    """Tests for the LRU and on-disk layers."""
+
+    def test_lru_is_bounded(self):
+        cache = DetectionCache(max_entries=2)
+        for key in "abc":
+            cache.put(key, [])
+
+        assert cache.get("a") is None
+        assert cache.get("c") == []
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_disk_layer_survives_a_new_cache(self, tmp_path: Path):
+        entities = [{"start": 4, "end": 15, "label": "iban", "score": 0.9, "text": "x"}]
+        DetectionCache(root=tmp_path).put("ab12", entities)
+
+        cached = DetectionCache(root=tmp_path).get("ab12")
+
+        assert cached == [{"start": 4, "end": 15, "label": "iban", "score": 0.9}]
+        assert "text" not in (tmp_path / "ab" / "ab12.json").read_text()
+
+    def test_key_depends_on_model(self):
+        assert DetectionCache.key("text", "model-a") != DetectionCache.key("text", "model-b")
+
+
+class TestCachedDetection:
+    """Tests for detection through the cache."""
+
+    def test_repeated_chunk_is_read_once(self, fake_model):
+        texts = ["SSN 123-45-6789 on file.", "SSN 123-45-6789 on file."]
+        texts.append("  SSN   123-45-6789 on\nfile.")
+
+        results = redactor._detect_pii_gliner_many(texts)
+
+        assert sum(len(batch) for batch in fake_model.batches) == 1
+        for text, (entity,) in zip(texts, results):
+            assert text[entity["start"] : entity["end"]] == "123-45-6789"
+            assert entity["text"] == "123-45-6789"
+
+    def test_offsets_map_back_through_whitespace(self, fake_model):
+        text = "Seller\n\n\nSSN:\n   123-45-6789\n"
+        (entity,) = redactor._detect_pii_gliner_many([text])[0]
+
+        assert text[entity["start"] : entity["end"]] == "123-45-6789"
+
+    def test_folder_report_records_hit_rate(self, tmp_path: Path, fake_model):
+        for n in range(4):
+            (tmp_path / f"om{n}.md").write_text(f"# Section {n}\n\n" * 50 + NOTICE)
+
+        report = redactor.redact_converted_folder(tmp_path, cache_dir=tmp_path / "cache")
+
+        assert report.cache_lookups == 4
+        assert report.cache_hit_rate == 0.75
+        saved = json.loads((tmp_path / "redaction-report.json").read_text())
+        assert saved["cache_hit_rate"] == 0.75
+
+        # A forced second run reads every chunk from disk.
+        fake_model.batches.clear()
+        report = redactor.redact_converted_folder(
+            tmp_path, cache_dir=tmp_path / "cache", force=True
+        )
+        assert report.cache_hit_rate == 1.0
+        assert fake_model.batches == []
+
+
+class TestPipelineCacheDir:
+    """Tests for where convert_folder keeps the detection cache."""
+
+    @pytest.mark.parametrize(
+        ("options", "on_disk"),
+        [
+            ({}, True),
+            ({"use_page_cache": False}, True),
+            ({"redaction_cache": False}, False),
+        ],
+    )
+    def test_switched_by_redaction_cache(
+        self, tmp_path: Path, monkeypatch, options: dict, on_disk: bool
+    ):
+        calls: list[dict] = []
+        monkeypatch.setattr(
+            pipeline,
+            "redact_converted_folder",
+            lambda path, **kwargs: calls.append(kwargs) or RedactionReport(),
+        )
+        folder = tmp_path / "deal"
+        folder.mkdir()
+        (folder / "rent_roll.csv").write_text("tenant,rent\nAcme,1000\n")
+
+        pipeline.convert_folder(folder, **options)
+
+        (kwargs,) = calls
+        expected = work_dir(folder) / CACHE_DIR_NAME / "redaction"
+        assert kwargs["cache_dir"] == (expected if on_disk else None)
@@ -0,0 +1,208 @@
+"""
+Tests for batched multi-document conversion (``DoclingConverter.convert_many``).
+
+Docling's converters are replaced with fakes that record how documents are
+grouped, so the tests need neither sample files nor the Docling models.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from converters import docling_converter
+from converters.base import ConfidenceLevel
+from converters.docling_converter import DoclingConverter
+from tests.test_text_layer import BODY_TEXT, make_pdf
+
+
+# ------------------------------------------------------------------
+# Fakes
+# ------------------------------------------------------------------
+
+
+class _FakeDocument:
+    def __init__(self, pages: int, broken: bool = False) -> None:
+        self.pages = {n: None for n in range(1, pages + 1)}
+        self.broken = broken
+
+    def export_to_markdown(self) -> str:
+        if self.broken:
+            raise ValueError("cannot export table")
+        return BODY_TEXT * 5
+
+
+class _FakeResult:
+    def __init__(self, path: Path, pages: int = 1, broken: bool = False) -> None:
+        self.input = SimpleNamespace(file=path)
+        self.status = docling_converter.ConversionStatus.SUCCESS
+        self.errors = []
+        self.document = _FakeDocument(pages, broken)
+
+
+class _FakeConverter:
+    def __init__(self, do_ocr: bool, log: dict) -> None:
+        self.do_ocr = do_ocr
+        self.log = log
+
+    def convert(self, source, raises_on_error=True, page_range=(1, 10**9)):
+        self.log["convert"].append((self.do_ocr, Path(source).name, page_range))
+        return _FakeResult(Path(source), broken=self._broken(Path(source)))
+
+    def convert_all(self, source, raises_on_error=True):
+        paths = list(source)
+        perf = docling_converter.settings.perf
+        self.log["convert_all"].append(
+            (self.do_ocr, sorted(p.name for p in paths))
+        )
+        self.log["batch_sizes"].append((perf.doc_batch_size, perf.page_batch_size))
+        if self.log.get("crash"):
+            raise RuntimeError("pipeline exploded")
+        for path in reversed(paths):
+            yield _FakeResult(path, broken=self._broken(path))
+
+    def _broken(self, path: Path) -> bool:
+        """Whether *path*'s document is one whose export raises."""
+        return path.name in self.log.get("broken", ())
+
+
+@pytest.fixture
+def fake_docling(monkeypatch):
+    """Replace the Docling converters with fakes that record their calls."""
+    log: dict = {"convert": [], "convert_all": [], "batch_sizes": []}
+    monkeypatch.setattr(
+        docling_converter,
+        "_get_converter",
+        lambda profile=None, do_ocr=True: _FakeConverter(do_ocr, log),
+    )
+    monkeypatch.setattr(
+        docling_converter,
+        "_SegmentedConversion",
+        lambda results, first_pages: results[0],
+    )
+    return log
+
+
+# ------------------------------------------------------------------
+# convert_many
+# ------------------------------------------------------------------
+
+
+class TestConvertMany:
+    """Tests for grouping documents into Docling batches."""
+
+    def test_documents_grouped_by_ocr_setting(self, tmp_path: Path, fake_docling):
+        """Born-digital and scanned documents go to separate batches."""
+        a = make_pdf(tmp_path / "a.pdf", [BODY_TEXT])
+        b = make_pdf(tmp_path / "b.pdf", [BODY_TEXT, BODY_TEXT])
+        scan = make_pdf(tmp_path / "scan.pdf", [None])
+        deck = tmp_path / "deck.pptx"
+        deck.write_bytes(b"fake")
+
+        results = list(DoclingConverter().convert_many([a, scan, b, deck]))
+
+        assert fake_docling["convert_all"] == [
+            (False, ["a.pdf", "b.pdf"]),
+            (True, ["deck.pptx", "scan.pdf"]),
+        ]
+        assert fake_docling["convert"] == []
+        assert sorted(r.source_path.name for r in results) == [
+            "a.pdf", "b.pdf", "deck.pptx", "scan.pdf",
+        ]
+        routing = {r.source_path.name: r.metadata["ocr_routing"] for r in results}
+        assert routing == {
+            "a.pdf": "none",
+            "b.pdf": "none",
+            "scan.pdf": "all",
+            "deck.pptx": "none",
+        }
+        assert all(r.metadata["profile"] == "balanced" for r in results)
+
+    def test_mixed_pdf_converted_per_page(self, tmp_path: Path, fake_docling):
+        """PDFs that need per-page OCR routing are converted on their own."""
+        mixed = make_pdf(tmp_path / "mixed.pdf", [BODY_TEXT, None])
+
+        results = list(DoclingConverter().convert_many([mixed]))
+
+        assert fake_docling["convert_all"] == []
+        assert fake_docling["convert"] == [
+            (False, "mixed.pdf", (1, 1)),
+            (True, "mixed.pdf", (2, 2)),
+        ]
+        assert results[0].metadata["ocr_routing"] == "per-page"
+
+    def test_batch_sizes_applied_and_restored(self, tmp_path: Path, fake_docling):
+        """Docling's global batch settings only change during the call."""
+        perf = docling_converter.settings.perf
+        before = (perf.doc_batch_size, perf.page_batch_size)
+        pdf = make_pdf(tmp_path / "a.pdf", [BODY_TEXT])
+
+        list(
+            DoclingConverter().convert_many(
+                [pdf], doc_batch_size=6, page_batch_size=12
+            )
+        )
+
+        assert fake_docling["batch_sizes"] == [(6, 12)]
+        assert (perf.doc_batch_size, perf.page_batch_size) == before
+
+    def test_bad_inputs_yield_failures(self, tmp_path: Path, fake_docling):
+        """Missing and unsupported files fail without reaching Docling."""
+        notes = tmp_path / "notes.txt"
+        notes.write_text("hello")
+
+        results = list(
+            DoclingConverter().convert_many([tmp_path / "missing.pdf", notes])
+        )
+
+        assert [r.confidence_reason for r in results] == [
+            "file not found",
+            "unsupported file type",
+        ]
+        assert all(r.confidence == ConfidenceLevel.LOW for r in results)
+        assert fake_docling["convert_all"] == []
+
+    def test_failed_document_does_not_stop_the_batch(
+        self, tmp_path: Path, fake_docling
+    ):
+        """A document that cannot be mapped fails alone; the rest convert."""
+        fake_docling["broken"] = {"bad.pdf"}
+        paths = [
+            make_pdf(tmp_path / name, [BODY_TEXT])
+            for name in ("a.pdf", "bad.pdf", "b.pdf")
+        ]
+
+        results = {
+            r.source_path.name: r for r in DoclingConverter().convert_many(paths)
+        }
+
+        assert fake_docling["convert_all"] == [(False, ["a.pdf", "b.pdf", "bad.pdf"])]
+        assert results["a.pdf"].success and results["b.pdf"].success
+        assert results["bad.pdf"].success is False
+        assert results["bad.pdf"].confidence_reason == "converter crashed"
+        assert "cannot export table" in results["bad.pdf"].error
+
+    def test_failed_single_document_is_a_result(self, tmp_path: Path, fake_docling):
+        """Mapping errors outside a batch are reported, not raised."""
+        fake_docling["broken"] = {"bad.pdf"}
+        bad = make_pdf(tmp_path / "bad.pdf", [BODY_TEXT])
+
+        result = DoclingConverter().convert(bad)
+
+        assert result.success is False
+        assert result.confidence_reason == "converter crashed"
+
+    def test_batch_crash_falls_back_to_single_files(
+        self, tmp_path: Path, fake_docling
+    ):
+        """If a batch crashes, its documents are converted one at a time."""
+        fake_docling["crash"] = True
+        a = make_pdf(tmp_path / "a.pdf", [BODY_TEXT])
+        b = make_pdf(tmp_path / "b.pdf", [BODY_TEXT])
+
+        results = list(DoclingConverter().convert_many([a, b]))
+
+        assert [name for _, name, _ in fake_docling["convert"]] == ["a.pdf", "b.pdf"]
+        assert all(r.success for r in results)
@@ -0,0 +1,191 @@
+"""
+Tests for persisting DoclingDocuments and regenerating exports from them.
+
+Documents are assembled with docling-core directly, so no Docling models
+are needed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+    TableCell,
+    TableData,
+)
+
+from converters.base import ConfidenceLevel, ExtractionResult
+from converters.document_store import (
+    DOCUMENTS_DIR_NAME,
+    document_filename,
+    load_document,
+    regenerate,
+    save_document,
+)
+from converters import pipeline
+from converters.pipeline import record_extraction
+from converters.redactor import RedactionReport
+from converters.scanner import FileEntry, FileType
+from converters.workspace import work_dir
+from tests.test_page_cache import fake_docling  # noqa: F401  (fixture)
+from tests.test_text_layer import BODY_TEXT, make_pdf
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def _prov(page_no: int) -> ProvenanceItem:
+    return ProvenanceItem(
+        page_no=page_no,
+        bbox=BoundingBox(l=0, t=0, r=1, b=1),
+        charspan=(0, 1),
+    )
+
+
+def make_document() -> DoclingDocument:
+    """A two-page document: a heading and paragraph, then a 2x2 table."""
+    document = DoclingDocument(name="memo")
+    for page_no in (1, 2):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+    document.add_heading("Site Overview", prov=_prov(1))
+    document.add_text(
+        label=DocItemLabel.TEXT, text="Utility feed is 50 MW.", prov=_prov(1)
+    )
+    cells = [
+        TableCell(
+            text=text,
+            start_row_offset_idx=i // 2,
+            end_row_offset_idx=i // 2 + 1,
+            start_col_offset_idx=i % 2,
+            end_col_offset_idx=i % 2 + 1,
+        )
+        for i, text in enumerate(["Phase", "MW", "1", "50"])
+    ]
+    document.add_table(
+        data=TableData(num_rows=2, num_cols=2, table_cells=cells), prov=_prov(2)
+    )
+    return document
+
+
+# ------------------------------------------------------------------
+# document_store
+# ------------------------------------------------------------------
+
+
+class TestDocumentStore:
+    """Tests for saving, loading and regenerating documents."""
+
+    def test_round_trip_preserves_markdown(self, tmp_path: Path):
+        """A saved and reloaded document exports identical markdown."""
+        document = make_document()
+        path = save_document(document, tmp_path / "memo.json.gz")
+
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert not path.with_name("memo.json.gz.tmp").exists()
+        assert (
+            load_document(path).export_to_markdown()
+            == document.export_to_markdown()
+        )
+
+    def test_regenerate_formats(self, tmp_path: Path):
+        """Every export format is produced from the stored file."""
+        path = save_document(make_document(), tmp_path / "memo.json.gz")
+
+        assert "## Site Overview" in regenerate(path)
+        assert "Utility feed is 50 MW." in regenerate(path, "text")
+        assert "<table>" in regenerate(path, "html")
+        pages = regenerate(path, "pages")
+        assert sorted(pages) == [1, 2]
+        assert "Site Overview" in pages[1] and "Phase" not in pages[1]
+        assert regenerate(path, "tables") == [[["Phase", "MW"], ["1", "50"]]]
+
+    def test_regenerate_accepts_loaded_document(self):
+        """An in-memory document can be exported without a file."""
+        assert regenerate(make_document(), "tables")[0][1] == ["1", "50"]
+
+    def test_unknown_format_rejected(self, tmp_path: Path):
+        """A typo in the format name is an error, not an empty export."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            regenerate(make_document(), "pdf")
+
+    def test_document_filename(self):
+        """Document files are named after their markdown file."""
+        assert document_filename("site--memo.md") == "site--memo.json.gz"
+
+
+class TestPipelineSavesDocuments:
+    """Tests for writing documents next to the converted markdown."""
+
+    def _record(self, tmp_path: Path, documents_dir: Path | None):
+        source = tmp_path / "memo.pdf"
+        source.write_bytes(b"fake")
+        entry = FileEntry(
+            path=source,
+            relative_path=Path("memo.pdf"),
+            file_type=FileType.PDF,
+            size_bytes=4,
+            converter="DoclingConverter",
+        )
+        extraction = ExtractionResult(
+            source_path=source,
+            text="## Site Overview",
+            method="docling",
+            success=True,
+            confidence=ConfidenceLevel.HIGH,
+            page_count=2,
+            document=make_document(),
+        )
+        return record_extraction(
+            entry, tmp_path / "memo.md", extraction, 0.1, "balanced", documents_dir
+        )
+
+    def test_document_saved_when_requested(self, tmp_path: Path):
+        """The document is written under _documents/ and recorded."""
+        documents_dir = tmp_path / DOCUMENTS_DIR_NAME
+
+        record = self._record(tmp_path, documents_dir)
+
+        assert record.document_path == str(documents_dir / "memo.json.gz")
+        assert "Site Overview" in regenerate(Path(record.document_path))
+
+    def test_document_not_saved_by_default(self, tmp_path: Path):
+        """Without a documents folder only the markdown is written."""
+        record = self._record(tmp_path, None)
+
+        assert record.document_path is None
+        assert (tmp_path / "memo.md").exists()
+
+    def test_documents_stay_out_of_converted(
+        self, tmp_path: Path, fake_docling, monkeypatch
+    ):
+        """Unredacted documents go to the work folder, never _converted/."""
+        monkeypatch.setattr(
+            pipeline, "redact_converted_folder", lambda path, **_: RedactionReport()
+        )
+        folder = tmp_path / "deal"
+        folder.mkdir()
+        make_pdf(folder / "om.pdf", [BODY_TEXT])
+        legacy = folder / "_converted" / "_documents"
+        legacy.mkdir(parents=True)
+        (legacy / "old.json.gz").write_bytes(b"unredacted")
+
+        result = pipeline.convert_folder(
+            folder, save_documents=True, use_page_cache=False
+        )
+
+        (record,) = result.files
+        documents_dir = work_dir(folder) / DOCUMENTS_DIR_NAME
+        assert Path(record.document_path).parent == documents_dir
+        assert not legacy.exists()
+        assert sorted(p.name for p in result.converted_dir.iterdir()) == [
+            "manifest.json",
+            "om.md",
+        ]
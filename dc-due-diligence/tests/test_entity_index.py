@@ -0,0 +1,193 @@
+"""
+Tests for extracting preserved entities in the redaction pass.
+
+The model is replaced with a fake that finds SSNs and, when asked for the
+preserved labels, a few organizations, parcel numbers and people by
+pattern, so no model is downloaded.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from converters import redactor
+from tests.test_redaction_batching import _filler
+
+_PATTERNS: list[tuple[str, re.Pattern[str], float]] = [
+    ("social security number", re.compile(r"\d{3}-\d{2}-\d{4}"), 0.9),
+    ("utility company", re.compile(r"Dominion Energy"), 0.8),
+    ("organization", re.compile(r"Dominion Energy|Acme Holdings,? LLC"), 0.6),
+    ("parcel number", re.compile(r"\b\d{4}[- ]\d{2}[- ]\d{3}\b"), 0.7),
+    # Overlaps the SSN it precedes.
+    ("person", re.compile(r"Seller \d{3}-\d{2}"), 0.95),
+]
+
+
+class _IndexingModel:
+    """Finds each label's pattern; records the labels and options asked for."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], dict]] = []
+
+    def inference(self, texts, labels, batch_size=8, **options):
+        self.calls.append((list(labels), options))
+        return [
+            [
+                {
+                    "start": m.start(),
+                    "end": m.end(),
+                    "text": m.group(),
+                    "label": label,
+                    "score": score,
+                }
+                for label, pattern, score in _PATTERNS
+                if label in labels
+                for m in pattern.finditer(text)
+            ]
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def indexing_model(monkeypatch) -> _IndexingModel:
+    model = _IndexingModel()
+    monkeypatch.setattr(redactor, "_get_model", lambda: model)
+    return model
+
+
+TEXT = (
+    "Dominion Energy serves parcel 0123-45-678 under a firm service "
+    "agreement. Seller 123-45-6789 signed for Acme Holdings, LLC.\n"
+)
+
+
+def _located(text: str, entity: redactor.IndexedEntity) -> str:
+    return text[entity.offset : entity.offset + entity.length]
+
+
+class TestFlattenGroups:
+    """Tests for flat decoding per group of labels."""
+
+    def test_groups_do_not_compete(self):
+        entities = [
+            {"start": 0, "end": 10, "label": "organization", "score": 0.6},
+            {"start": 0, "end": 10, "label": "utility company", "score": 0.8},
+            {"start": 5, "end": 15, "label": "social security number", "score": 0.4},
+        ]
+
+        kept = redactor._flatten_groups(entities)
+
+        assert [e["label"] for e in kept] == ["utility company", "social security number"]
+
+
+class TestIndexedRedaction:
+    """Tests for redact_texts with index."""
+
+    def test_preserved_entities_are_indexed(self, indexing_model):
+        (result,) = redactor.redact_texts([TEXT], index=True)
+
+        redacted = result.redacted_text
+        assert "123-45-6789" not in redacted
+        assert "Dominion Energy" in redacted
+        assert [(e.label, e.value) for e in result.indexed] == [
+            ("utility", "dominion energy"),
+            ("parcel_number", "012345678"),
+            ("organization", "acme holdings, llc"),
+        ]
+        assert _located(redacted, result.indexed[-1]) == "Acme Holdings, LLC"
+        # One pass, nested, with both groups of labels.
+        ((labels, options),) = indexing_model.calls
+        assert labels == redactor._REDACT_LABELS + redactor._INDEX_LABELS
+        assert options["flat_ner"] is False
+
+    def test_entity_overlapping_redaction_is_not_indexed(self, indexing_model):
+        (result,) = redactor.redact_texts([TEXT], index=True)
+
+        assert result.entities_found == 1
+        assert "person" not in {e.label for e in result.indexed}
+
+    def test_off_by_default(self, indexing_model):
+        (result,) = redactor.redact_texts([TEXT])
+
+        assert result.indexed == []
+        assert indexing_model.calls[0][0] == redactor._REDACT_LABELS
+        assert indexing_model.calls[0][1] == {"threshold": redactor._THRESHOLD}
+
+    def test_whole_text_is_read(self, indexing_model):
+        text = _filler(3000) + " Power from Dominion Energy."
+
+        (result,) = redactor.redact_texts([text], index=True)
+
+        assert result.model_chars == len(text)
+        assert [e.value for e in result.indexed] == ["dominion energy"]
+
+
+class TestStreamedIndex:
+    """Tests for indexing in _redact_stream."""
+
+    def test_offsets_point_into_output(self, tmp_path: Path, indexing_model, monkeypatch):
+        monkeypatch.setattr(redactor, "_STREAM_BLOCK_CHARS", 3000)
+        monkeypatch.setattr(redactor, "_STREAM_CONTEXT", 1000)
+        text = "".join(_filler(400 + 37 * (n % 7)) + "\n" + TEXT for n in range(30))
+        path = tmp_path / "report.md"
+        path.write_text(text)
+
+        _, result = redactor._redact_stream(path, index=True)
+
+        output = path.read_text()
+        assert len(result.indexed) == 90
+        for entity in result.indexed:
+            assert _located(output, entity) in {
+                "Dominion Energy",
+                "0123-45-678",
+                "Acme Holdings, LLC",
+            }
+
+
+class TestFolderIndex:
+    """Tests for entity-index.json."""
+
+    @pytest.fixture
+    def folder(self, tmp_path: Path) -> Path:
+        (tmp_path / "om.md").write_text(TEXT)
+        (tmp_path / "site.md").write_text(_filler(200) + " Parcel 0456 12 001.\n")
+        return tmp_path
+
+    def test_index_is_written(self, folder: Path, indexing_model):
+        report = redactor.redact_converted_folder(folder, index=True)
+
+        saved = json.loads((folder / "entity-index.json").read_text())
+        assert report.entities_indexed == len(saved["entities"]) == 4
+        assert saved["entities_by_type"] == {
+            "utility": 1,
+            "parcel_number": 2,
+            "organization": 1,
+        }
+        for entry in saved["entities"]:
+            text = (folder / entry["file"]).read_text()
+            assert entry["value"] in redactor._normalize_value(
+                entry["type"], text[entry["offset"] : entry["offset"] + entry["length"]]
+            )
+
+    def test_skipped_files_keep_their_entries(self, folder: Path, indexing_model):
+        redactor.redact_converted_folder(folder, index=True)
+        (folder / "site.md").write_text("No parcels here.\n")
+
+        report = redactor.redact_converted_folder(folder, index=True)
+
+        assert report.files_skipped == 1
+        saved = json.loads((folder / "entity-index.json").read_text())
+        assert {entry["file"] for entry in saved["entities"]} == {"om.md"}
+        assert report.entities_indexed == 3
+
+    def test_indexing_redacts_again(self, folder: Path, indexing_model):
+        redactor.redact_converted_folder(folder)
+
+        report = redactor.redact_converted_folder(folder, index=True)
+
+        assert report.files_skipped == 0
+        assert report.entities_indexed == 4
@@ -235,8 +235,8 @@ class TestScanFolder:
         converter_map = {e.path.name: e.converter for e in result.files}
 
         assert converter_map["a.pdf"] == "DoclingConverter"
-        assert converter_map["b.xlsx"] == "DoclingConverter"
-        assert converter_map["c.xlsb"] == "DoclingConverter"
+        assert converter_map["b.xlsx"] == "SpreadsheetConverter"
+        assert converter_map["c.xlsb"] == "SpreadsheetConverter"
         assert converter_map["d.docx"] == "DoclingConverter"
         assert converter_map["e.pptx"] == "DoclingConverter"
         assert converter_map["f.png"] == "DoclingConverter"
@@ -245,6 +245,33 @@ class TestScanFolder:
         assert converter_map["i.bmp"] == "DoclingConverter"
         assert converter_map["j.webp"] == "DoclingConverter"
 
+    def test_native_converters_without_layout_files(self, tmp_path: Path):
+        """CSV, HTML and DOCX skip Docling when nothing needs layout analysis."""
+        (tmp_path / "a.csv").write_text("x,y\n1,2\n")
+        (tmp_path / "b.html").write_text("<p>hi</p>")
+        (tmp_path / "c.docx").write_bytes(b"fake")
+
+        result = scan_folder(tmp_path)
+
+        assert result.needs_layout_analysis is False
+        converter_map = {e.path.name: e.converter for e in result.files}
+        assert converter_map == {
+            "a.csv": "CsvConverter",
+            "b.html": "HtmlConverter",
+            "c.docx": "DocxConverter",
+        }
+        assert "csv: 1 -> CsvConverter" in result.summary()
+
+    def test_docling_kept_when_folder_needs_layout(self, tmp_path: Path):
+        """A PDF in the folder keeps every type on DoclingConverter."""
+        (tmp_path / "a.csv").write_text("x,y\n1,2\n")
+        (tmp_path / "b.pdf").write_bytes(b"fake")
+
+        result = scan_folder(tmp_path)
+
+        assert result.needs_layout_analysis is True
+        assert all(e.converter == "DoclingConverter" for e in result.files)
+
     def test_file_sizes_captured(self, tmp_path: Path):
         """File sizes are recorded in the entries."""
         content = b"x" * 1024
@@ -290,6 +317,76 @@ class TestScanFolder:
         assert counts[FileType.UNKNOWN] == 1
 
 
+# ------------------------------------------------------------------
+# ScanResult indexes
+# ------------------------------------------------------------------
+
+
+def _entry(name: str, file_type: FileType, size: int = 10) -> FileEntry:
+    converter = None if file_type == FileType.UNKNOWN else "DoclingConverter"
+    return FileEntry(
+        path=Path("/root") / name,
+        relative_path=Path(name),
+        file_type=file_type,
+        converter=converter,
+        size_bytes=size,
+    )
+
+
+class TestScanResultIndexes:
+    """Tests for the incrementally maintained aggregate views."""
+
+    def test_add_updates_all_indexes(self):
+        """Each add() updates partitions, buckets, totals, and lookup."""
+        result = ScanResult(root=Path("/root"))
+        result.add(_entry("a.pdf", FileType.PDF, 100))
+        result.add(_entry("b.pdf", FileType.PDF, 50))
+        result.add(_entry("notes.txt", FileType.UNKNOWN, 5))
+
+        assert len(result.files) == 3
+        assert [e.relative_path.name for e in result.supported] == [
+            "a.pdf",
+            "b.pdf",
+        ]
+        assert [e.relative_path.name for e in result.unsupported] == [
+            "notes.txt"
+        ]
+        assert result.total_size_bytes == 155
+        assert result.type_counts == {FileType.PDF: 2, FileType.UNKNOWN: 1}
+        assert len(result.by_type(FileType.PDF)) == 2
+        assert result.by_type(FileType.XLSX) == []
+
+    def test_constructor_entries_are_indexed(self):
+        """Entries passed to the constructor are indexed like add()."""
+        result = ScanResult(
+            root=Path("/root"),
+            files=[_entry("a.pdf", FileType.PDF, 7)],
+        )
+
+        assert len(result.supported) == 1
+        assert result.total_size_bytes == 7
+        assert result.get("a.pdf") is result.files[0]
+
+    def test_lookup_by_relative_path(self, tmp_path: Path):
+        """get() finds entries by relative path (str or Path)."""
+        sub = tmp_path / "phase1"
+        sub.mkdir()
+        (sub / "plan.pdf").write_bytes(b"fake")
+
+        result = scan_folder(tmp_path)
+
+        entry = result.get("phase1/plan.pdf")
+        assert entry is not None
+        assert entry.file_type == FileType.PDF
+        assert result.get(Path("phase1/plan.pdf")) is entry
+        assert result.get("missing.pdf") is None
+
+    def test_file_entry_uses_slots(self):
+        """FileEntry is a compact __slots__ record with no __dict__."""
+        entry = _entry("a.pdf", FileType.PDF)
+        assert not hasattr(entry, "__dict__")
+
+
 # ------------------------------------------------------------------
 # ScanResult.summary
 # ------------------------------------------------------------------
@@ -0,0 +1,205 @@
+"""
+Tests for image pre-processing: orientation, downscaling, text detection
+and near-duplicate detection, and how the pipeline uses them.
+
+Images are generated with Pillow; Docling is replaced with the batch fake
+from ``test_docling_batch``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from converters import pipeline, refine
+from converters.image_prep import (
+    TEXTLESS_METHOD,
+    find_duplicates,
+    has_text,
+    prepare_image,
+)
+from converters.redactor import RedactionReport, RedactionResult
+from tests.test_docling_batch import fake_docling  # noqa: F401  (fixture)
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def text_page(width: int = 1700, height: int = 2200) -> Image.Image:
+    """A white page with lines of black text, like a scanned exhibit."""
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=32)
+    for line in range(25):
+        draw.text(
+            (80, 80 + line * 70),
+            f"Utility service agreement, 50 MW firm capacity, clause {line}",
+            fill="black",
+            font=font,
+        )
+    return image
+
+
+def photo(seed: int, width: int = 4000, height: int = 3000) -> Image.Image:
+    """A smooth, textless stand-in for a site photo."""
+    rng = np.random.default_rng(seed)
+    pixels = (rng.random((height // 50, width // 50, 3)) * 255).astype("uint8")
+    return (
+        Image.fromarray(pixels)
+        .resize((width, height), Image.BILINEAR)
+        .filter(ImageFilter.GaussianBlur(4))
+    )
+
+
+# ------------------------------------------------------------------
+# Pre-processing
+# ------------------------------------------------------------------
+
+
+class TestPrepareImage:
+    """Tests for orienting and downscaling single images."""
+
+    def test_large_rotated_jpeg(self, tmp_path: Path):
+        """EXIF orientation is applied and the image is downscaled."""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotate 90 degrees clockwise on display
+        source = tmp_path / "IMG_0001.jpg"
+        photo(1, 6000, 4000).save(source, exif=exif)
+
+        prepared = prepare_image(source, tmp_path / "work")
+
+        assert prepared.rotated is True
+        assert prepared.original_size == (6000, 4000)
+        assert prepared.size[1] > prepared.size[0]
+        assert max(prepared.size) <= 3300
+        assert prepared.path.parent == tmp_path / "work"
+        with Image.open(prepared.path) as image:
+            assert image.size == prepared.size
+
+    def test_small_upright_image_used_as_is(self, tmp_path: Path):
+        """Nothing is rewritten when no processing is needed."""
+        source = tmp_path / "scan.png"
+        text_page().save(source)
+
+        prepared = prepare_image(source, tmp_path / "work")
+
+        assert prepared.path == source.resolve()
+        assert prepared.has_text is True
+        assert not (tmp_path / "work").exists()
+
+    def test_unreadable_image(self, tmp_path: Path):
+        """Files Pillow cannot read are left to Docling."""
+        source = tmp_path / "broken.jpg"
+        source.write_bytes(b"not an image")
+
+        assert prepare_image(source, tmp_path / "work") is None
+
+
+class TestTextDetection:
+    """Tests for the fast text-presence check."""
+
+    def test_text_page(self):
+        assert has_text(text_page()) is True
+
+    def test_rotated_text_page(self):
+        assert has_text(text_page().rotate(90, expand=True)) is True
+
+    def test_photo(self):
+        assert has_text(photo(2)) is False
+
+
+class TestFindDuplicates:
+    """Tests for perceptual-hash duplicate detection."""
+
+    def test_resaved_photo_is_duplicate(self, tmp_path: Path):
+        """A downsized copy matches; a different photo does not."""
+        photo(3, 2000, 1500).save(tmp_path / "a.jpg")
+        photo(3, 2000, 1500).resize((1000, 750)).save(tmp_path / "b.jpg", quality=60)
+        photo(4, 2000, 1500).save(tmp_path / "c.jpg")
+        images = [
+            prepare_image(tmp_path / name, tmp_path / "work")
+            for name in ("a.jpg", "b.jpg", "c.jpg")
+        ]
+
+        assert find_duplicates(images) == {
+            (tmp_path / "b.jpg").resolve(): (tmp_path / "a.jpg").resolve()
+        }
+
+
+# ------------------------------------------------------------------
+# Pipeline
+# ------------------------------------------------------------------
+
+
+class TestPipelineImages:
+    """Tests for image pre-processing inside convert_folder."""
+
+    @pytest.fixture
+    def opportunity(self, tmp_path: Path, monkeypatch) -> Path:
+        monkeypatch.setattr(
+            pipeline, "redact_converted_folder", lambda path, **_: RedactionReport()
+        )
+        folder = tmp_path / "deal"
+        (folder / "Site Photos").mkdir(parents=True)
+        text_page().save(folder / "exhibit.png")
+        photo(5).save(folder / "Site Photos" / "substation.jpg")
+        photo(5).save(folder / "Site Photos" / "substation_copy.jpg", quality=70)
+        return folder
+
+    def test_photos_skip_ocr_and_duplicates_are_recorded(
+        self, opportunity: Path, fake_docling
+    ):
+        """Only the exhibit reaches Docling; the copy is a duplicate."""
+        result = pipeline.convert_folder(opportunity, use_page_cache=False)
+
+        converted = [name for _, names in fake_docling["convert_all"] for name in names]
+        converted += [name for _, name, _ in fake_docling["convert"]]
+        assert converted == ["exhibit.png"]
+
+        manifest = json.loads(result.manifest_path.read_text())
+        entries = {f["relative_path"]: f for f in manifest["files"]}
+        assert entries["Site Photos/substation.jpg"]["method"] == TEXTLESS_METHOD
+        assert entries["Site Photos/substation_copy.jpg"]["duplicate_of"] == (
+            "Site Photos/substation.jpg"
+        )
+        assert manifest["pipeline_summary"]["duplicate_images"] == 1
+        assert result.failed_count == 0
+
+    def test_progressive_refinement_converts_prepared_copy(
+        self, opportunity: Path, fake_docling, monkeypatch
+    ):
+        """Background refinement orients images before Docling, too."""
+        monkeypatch.setattr(pipeline, "_start_refinement", lambda root, **_: None)
+        monkeypatch.setattr(
+            refine,
+            "redact_file",
+            lambda path, **_: RedactionResult(str(path), "", entities_found=0),
+        )
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        text_page().rotate(90, expand=True).save(opportunity / "rotated.jpg", exif=exif)
+
+        pipeline.convert_folder(opportunity, use_page_cache=False, progressive=True)
+        assert fake_docling["convert_all"] == fake_docling["convert"] == []
+        refined = refine.refine_folder(opportunity, use_page_cache=False)
+
+        converted = [name for _, names in fake_docling["convert_all"] for name in names]
+        converted += [name for _, name, _ in fake_docling["convert"]]
+        assert refined == 2
+        assert "exhibit.png" in converted
+        assert "rotated.jpg" not in converted
+        assert [name for name in converted if name.endswith("-rotated.png")]
+        manifest = json.loads(
+            (opportunity / "_converted" / "manifest.json").read_text()
+        )
+        entries = {f["relative_path"]: f for f in manifest["files"]}
+        assert entries["rotated.jpg"]["refinement"] == "done"
+        assert entries["rotated.jpg"]["original_path"] == str(
+            (opportunity / "rotated.jpg").resolve()
+        )
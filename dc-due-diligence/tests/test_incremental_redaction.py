@@ -0,0 +1,81 @@
+"""
+Tests for skipping files an earlier redact_converted_folder run already
+redacted.
+
+Uses the SSN-finding fake model from ``test_redaction_batching``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from converters import redactor
+from tests.test_redaction_batching import _filler, fake_model  # noqa: F401  (fixture)
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    (tmp_path / "w9.md").write_text("Taxpayer SSN 123-45-6789.\n")
+    (tmp_path / "om.md").write_text(_filler(500) + " Guarantor 555-12-3456.\n")
+    (tmp_path / "site.md").write_text(_filler(300))
+    return tmp_path
+
+
+def _model_calls(model) -> int:
+    return sum(len(batch) for batch in model.batches)
+
+
+class TestIncrementalRedaction:
+    """Tests for per-file redaction state in redaction-report.json."""
+
+    def test_report_records_state(self, folder: Path, fake_model):
+        redactor.redact_converted_folder(folder)
+
+        saved = json.loads((folder / "redaction-report.json").read_text())
+        for entry in saved["files"]:
+            assert entry["config"] == redactor.config_fingerprint()
+            assert entry["sha256"] == redactor._file_sha256(folder / entry["file"])
+
+    def test_rerun_skips_unchanged_files(self, folder: Path, fake_model):
+        first = redactor.redact_converted_folder(folder)
+        fake_model.batches.clear()
+
+        second = redactor.redact_converted_folder(folder)
+
+        assert _model_calls(fake_model) == 0
+        assert second.files_skipped == 3
+        assert second.characters_scanned == 0
+        assert second.total_entities == first.total_entities == 2
+        assert second.entities_by_type == first.entities_by_type
+        assert second.file_details == first.file_details
+
+    def test_changed_file_is_redacted_again(self, folder: Path, fake_model):
+        redactor.redact_converted_folder(folder)
+        (folder / "site.md").write_text("Seller SSN 987-65-4321.\n")
+        fake_model.batches.clear()
+
+        report = redactor.redact_converted_folder(folder)
+
+        assert report.files_skipped == 2
+        assert _model_calls(fake_model) == 1
+        assert report.total_entities == 3
+        assert (folder / "site.md").read_text() == "Seller SSN [REDACTED: ssn].\n"
+
+    def test_new_settings_redact_everything(self, folder: Path, fake_model, monkeypatch):
+        redactor.redact_converted_folder(folder)
+        monkeypatch.setattr(redactor, "_THRESHOLD", 0.2)
+
+        report = redactor.redact_converted_folder(folder)
+
+        assert report.files_skipped == 0
+
+    def test_force(self, folder: Path, fake_model):
+        redactor.redact_converted_folder(folder)
+
+        report = redactor.redact_converted_folder(folder, force=True)
+
+        assert report.files_skipped == 0
+        assert report.characters_scanned > 0
@@ -0,0 +1,252 @@
+"""
+Tests for lazy page selection and on-demand conversion of deferred pages.
+
+Docling is replaced with the page-aware fake from ``test_page_cache``, so
+no models are needed.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from converters import deferred
+from converters.docling_converter import DoclingConverter
+from converters.document_store import DOCUMENT_SUFFIX, load_document, save_document
+from converters.lazy import (
+    LazyPolicy,
+    format_page_ranges,
+    page_ranges,
+    parse_page_ranges,
+    select_eager_pages,
+)
+from converters.redactor import IndexedEntity, RedactionResult
+from converters.text_layer import PageTextLayer, TextLayerReport
+from tests.test_page_cache import fake_docling  # noqa: F401  (fixture)
+from tests.test_text_layer import make_pdf
+
+
+POLICY = LazyPolicy(
+    min_pages=5, head_pages=2, keywords=("substation",), max_keyword_pages=10
+)
+
+
+def _report(texts: list[str]) -> TextLayerReport:
+    report = TextLayerReport(path=Path("/tmp/x.pdf"))
+    for page_no, text in enumerate(texts, start=1):
+        report.pages.append(
+            PageTextLayer(
+                page_no=page_no,
+                char_count=len(text),
+                garbled_ratio=0.0,
+                image_coverage=0.0,
+                needs_ocr=False,
+                text=text,
+            )
+        )
+    return report
+
+
+def _document_pages(n: int, keyword_pages: set[int]) -> list[str]:
+    return [
+        f"Page {i} appendix boring data table"
+        + (" describing the new substation" if i in keyword_pages else "")
+        for i in range(1, n + 1)
+    ]
+
+
+# ------------------------------------------------------------------
+# Page selection
+# ------------------------------------------------------------------
+
+
+class TestSelectEagerPages:
+    """Tests for choosing which pages to convert up front."""
+
+    def test_small_documents_convert_fully(self):
+        """Below min_pages there is no selection."""
+        assert select_eager_pages(_report(["a"] * 4), POLICY) is None
+
+    def test_head_and_keyword_pages(self):
+        """Leading pages and keyword pages are selected, nothing else."""
+        report = _report(_document_pages(10, {6, 9}))
+
+        assert select_eager_pages(report, POLICY) == {1, 2, 6, 9}
+
+    def test_keyword_pages_capped_by_hits(self):
+        """Only the pages with the most keyword hits survive the cap."""
+        texts = ["intro", "intro", "substation", "substation substation", "x", "x"]
+        policy = LazyPolicy(
+            min_pages=5, head_pages=2, keywords=("substation",), max_keyword_pages=1
+        )
+
+        assert select_eager_pages(_report(texts), policy) == {1, 2, 4}
+
+    def test_keywords_match_whole_words_case_insensitively(self):
+        """'MW' matches 'mw' but not 'MWh' or 'lawmwaker'."""
+        policy = LazyPolicy(min_pages=1, head_pages=0, keywords=("MW",))
+        report = _report(["50 mw load", "MWh billed", "lawmwaker"])
+
+        assert select_eager_pages(report, policy) == {1}
+
+
+class TestPageRanges:
+    """Tests for page range helpers."""
+
+    def test_round_trip(self):
+        """Parsing and formatting are inverse operations."""
+        pages = parse_page_ranges("21-23, 5,7-7")
+
+        assert pages == {5, 7, 21, 22, 23}
+        assert page_ranges(pages) == [(5, 5), (7, 7), (21, 23)]
+        assert format_page_ranges(page_ranges(pages)) == "5,7,21-23"
+
+    @pytest.mark.parametrize("spec", ["", "0", "5-2", "a-b", "3-"])
+    def test_invalid_specs(self, spec: str):
+        """Malformed specifications are rejected."""
+        with pytest.raises(ValueError):
+            parse_page_ranges(spec)
+
+
+# ------------------------------------------------------------------
+# Lazy conversion
+# ------------------------------------------------------------------
+
+
+class TestLazyConversion:
+    """Tests for DoclingConverter's lazy mode and on-demand pages."""
+
+    def test_only_selected_pages_converted(self, tmp_path: Path, fake_docling):
+        """Deferred pages are skipped and reported."""
+        pdf = make_pdf(tmp_path / "esa.pdf", _document_pages(8, {5}))
+
+        result = DoclingConverter(lazy=POLICY).convert(pdf)
+
+        assert fake_docling == [(1, 2), (5, 5)]
+        assert result.metadata["deferred_pages"] == [[3, 4], [6, 8]]
+        assert result.metadata["converted_page_count"] == 3
+        assert result.page_count == 8
+        assert "Page 5" in result.text and "Page 3" not in result.text
+
+    def test_saved_document_keeps_page_numbers(self, tmp_path: Path, fake_docling):
+        """The stored document numbers pages as the PDF does, gaps and all."""
+        pdf = make_pdf(tmp_path / "esa.pdf", _document_pages(8, {5}))
+        result = DoclingConverter(lazy=POLICY).convert(pdf)
+
+        saved = save_document(result.document, tmp_path / f"esa{DOCUMENT_SUFFIX}")
+
+        assert sorted(load_document(saved).pages) == [1, 2, 5]
+
+    def test_small_pdf_not_lazy(self, tmp_path: Path, fake_docling):
+        """PDFs under the threshold convert in one pass."""
+        pdf = make_pdf(tmp_path / "memo.pdf", _document_pages(3, set()))
+
+        result = DoclingConverter(lazy=POLICY).convert(pdf)
+
+        assert len(fake_docling) == 1
+        assert "deferred_pages" not in result.metadata
+
+    def test_convert_pages(self, tmp_path: Path, fake_docling):
+        """Specific pages can be converted on demand."""
+        pdf = make_pdf(tmp_path / "esa.pdf", _document_pages(8, set()))
+
+        result = DoclingConverter().convert_pages(pdf, [7, 3, 99])
+
+        assert fake_docling == [(3, 3), (7, 7)]
+        assert result.metadata["pages"] == [[3, 3], [7, 7]]
+        assert result.text.index("Page 3") < result.text.index("Page 7")
+        assert sorted(result.document.pages) == [3, 7]
+
+    def test_convert_pages_out_of_range(self, tmp_path: Path, fake_docling):
+        """Asking only for missing pages fails cleanly."""
+        pdf = make_pdf(tmp_path / "esa.pdf", _document_pages(2, set()))
+
+        result = DoclingConverter().convert_pages(pdf, [40])
+
+        assert result.success is False
+        assert result.confidence_reason == "no such pages"
+
+
+def _redact(path: Path, index: bool = False) -> RedactionResult:
+    """Stand-in for redact_file: finds nothing to redact, one parcel."""
+    indexed = [IndexedEntity("parcel_number", "0123", 0, 4, 0.7)] if index else []
+    return RedactionResult(str(path), "", entities_found=0, indexed=indexed)
+
+
+class TestConvertDeferred:
+    """Tests for the on-demand API used by the CLI."""
+
+    @pytest.fixture
+    def opportunity(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(deferred, "redact_file", _redact)
+        pdf = make_pdf(tmp_path / "esa.pdf", _document_pages(8, set()))
+        converted = tmp_path / "_converted"
+        converted.mkdir()
+        manifest = {
+            "files": [
+                {
+                    "original_path": str(pdf),
+                    "relative_path": "esa.pdf",
+                    "converted_filename": "esa.md",
+                    "file_type": "pdf",
+                    "converter": "DoclingConverter",
+                    "success": True,
+                    "size_bytes": pdf.stat().st_size,
+                    "profile": "balanced",
+                    "deferred_pages": [[3, 8]],
+                }
+            ]
+        }
+        (converted / "manifest.json").write_text(json.dumps(manifest))
+        return tmp_path
+
+    def test_pages_converted_and_manifest_updated(
+        self, opportunity: Path, fake_docling
+    ):
+        """The pages are written to their own file and no longer deferred."""
+        path = deferred.convert_deferred(opportunity, "esa.pdf", "4-5")
+
+        assert path.name == "esa.pages-4-5.md"
+        text = path.read_text()
+        assert "Page selection:** 4-5" in text and "Page 4" in text
+        manifest = json.loads(
+            (opportunity / "_converted" / "manifest.json").read_text()
+        )
+        entry = manifest["files"][0]
+        assert entry["deferred_pages"] == [[3, 3], [6, 8]]
+        assert entry["on_demand"][0]["pages"] == [[4, 5]]
+
+    def test_repeat_request_reuses_file(self, opportunity: Path, fake_docling):
+        """Asking for the same pages again does not reconvert."""
+        first = deferred.convert_deferred(opportunity, "esa.md", "6")
+        fake_docling.clear()
+
+        assert deferred.convert_deferred(opportunity, "esa.md", [6]) == first
+        assert fake_docling == []
+
+    def test_pages_join_existing_entity_index(self, opportunity: Path, fake_docling):
+        """A folder with an entity index gets the new pages' entities."""
+        index_path = opportunity / "_converted" / "entity-index.json"
+        index_path.write_text(json.dumps({"entities": [
+            {"type": "person", "value": "x", "file": "esa.md", "offset": 0, "length": 1}
+        ]}))
+        (opportunity / "_converted" / "esa.md").write_text("Draft.\n")
+
+        path = deferred.convert_deferred(opportunity, "esa.pdf", "4")
+
+        saved = json.loads(index_path.read_text())
+        assert sorted(e["file"] for e in saved["entities"]) == ["esa.md", path.name]
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_no_index_is_created(self, opportunity: Path, fake_docling):
+        """Without an entity index the pages are only redacted."""
+        deferred.convert_deferred(opportunity, "esa.pdf", "4")
+
+        assert not (opportunity / "_converted" / "entity-index.json").exists()
+
+    def test_cli_reports_unknown_file(self, opportunity: Path, capsys):
+        """The CLI exits non-zero with a message for bad input."""
+        assert deferred.main([str(opportunity), "nope.pdf", "1"]) == 1
+        assert "No file 'nope.pdf'" in capsys.readouterr().err
@@ -0,0 +1,69 @@
+"""
+Tests for the shared manifest writers.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from converters.manifest import update_json, write_json_atomic
+
+
+class TestUpdateJson:
+    """Tests for locked read-modify-write of JSON files."""
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path: Path):
+        """Writers that overlap in time all see each other's changes."""
+        path = tmp_path / "manifest.json"
+        write_json_atomic(path, {"count": 0})
+
+        def bump() -> None:
+            for _ in range(10):
+                with update_json(path) as data:
+                    count = data["count"]
+                    # Widen the window between read and write.
+                    time.sleep(0.001)
+                    data["count"] = count + 1
+
+        threads = [threading.Thread(target=bump) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert json.loads(path.read_text())["count"] == 40
+
+    def test_missing_file_is_created(self, tmp_path: Path):
+        path = tmp_path / "report.json"
+
+        with update_json(path) as data:
+            assert data == {}
+            data["files"] = []
+
+        assert json.loads(path.read_text()) == {"files": []}
+
+    def test_unchanged_file_is_not_rewritten(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        path.write_text('{"files": []}')
+
+        with update_json(path) as data:
+            data["files"] = []
+
+        assert path.read_text() == '{"files": []}'
+
+    def test_failed_update_leaves_file(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        write_json_atomic(path, {"count": 1})
+
+        with pytest.raises(ValueError):
+            with update_json(path) as data:
+                data["count"] = 2
+                raise ValueError("no entry")
+
+        assert json.loads(path.read_text()) == {"count": 1}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json"]
@@ -0,0 +1,149 @@
+"""Tests for the lightweight CSV, HTML and DOCX converters."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import docx
+
+from converters import ConfidenceLevel
+from converters.native_converter import CsvConverter, DocxConverter, HtmlConverter
+
+
+# ------------------------------------------------------------------
+# CsvConverter
+# ------------------------------------------------------------------
+
+
+class TestCsvConverter:
+    """Tests for streaming CSV conversion."""
+
+    def test_basic_table(self, tmp_path: Path):
+        """A CSV becomes a pipe table with a header separator."""
+        path = tmp_path / "sites.csv"
+        path.write_text("Name,MW\nSite A,50\nSite B,120\n")
+
+        result = CsvConverter().convert(path)
+
+        assert result.success is True
+        assert result.method == "native-csv"
+        assert result.confidence == ConfidenceLevel.HIGH
+        assert result.text.splitlines() == [
+            "| Name | MW |",
+            "|---|---|",
+            "| Site A | 50 |",
+            "| Site B | 120 |",
+        ]
+        assert result.metadata["rows"] == 3
+        assert result.metadata["columns"] == 2
+
+    def test_ragged_rows_and_pipes(self, tmp_path: Path):
+        """Short rows are padded and pipes inside cells are escaped."""
+        path = tmp_path / "ragged.csv"
+        path.write_text('a,b,c\n1\n"x|y",2,3\n')
+
+        lines = CsvConverter().convert(path).text.splitlines()
+
+        assert lines[2] == "| 1 |  |  |"
+        assert lines[3] == "| x\\|y | 2 | 3 |"
+
+    def test_semicolon_delimiter(self, tmp_path: Path):
+        """European-style semicolon CSVs are sniffed correctly."""
+        path = tmp_path / "eu.csv"
+        path.write_text("Name;Price\nA;1,5\nB;2,0\n")
+
+        lines = CsvConverter().convert(path).text.splitlines()
+
+        assert lines[0] == "| Name | Price |"
+        assert lines[2] == "| A | 1,5 |"
+
+    def test_cp1252_fallback(self, tmp_path: Path):
+        """Non-UTF-8 exports still convert."""
+        path = tmp_path / "legacy.csv"
+        path.write_bytes("Owner,City\nJos\xe9,M\xe1laga\n".encode("cp1252"))
+
+        result = CsvConverter().convert(path)
+
+        assert "José" in result.text
+
+    def test_missing_file(self, tmp_path: Path):
+        """A missing file is reported as a failure."""
+        result = CsvConverter().convert(tmp_path / "missing.csv")
+        assert result.success is False
+        assert result.confidence_reason == "file not found"
+
+
+# ------------------------------------------------------------------
+# HtmlConverter
+# ------------------------------------------------------------------
+
+
+class TestHtmlConverter:
+    """Tests for HTML conversion."""
+
+    def test_structure(self, tmp_path: Path):
+        """Headings, paragraphs, lists and tables map to markdown."""
+        path = tmp_path / "page.html"
+        path.write_text(
+            "<html><head><title>x</title><style>p{}</style></head><body>"
+            "<h1>Site Overview</h1><p>The site has <b>50 MW</b> &amp; more.</p>"
+            "<ul><li>One</li><li>Two</li></ul>"
+            "<h2>Power</h2>"
+            "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>"
+            "<script>var x = 1;</script></body></html>"
+        )
+
+        result = HtmlConverter().convert(path)
+
+        assert result.success is True
+        assert result.text == (
+            "# Site Overview\n\n"
+            "The site has **50 MW** & more.\n\n"
+            "- One\n- Two\n\n"
+            "## Power\n\n"
+            "| A | B |\n|---|---|\n| 1 | 2 |"
+        )
+
+
+# ------------------------------------------------------------------
+# DocxConverter
+# ------------------------------------------------------------------
+
+
+class TestDocxConverter:
+    """Tests for Word document conversion."""
+
+    def test_structure(self, tmp_path: Path):
+        """Headings, lists and tables come out in document order."""
+        document = docx.Document()
+        document.add_heading("Lease Summary", 1)
+        document.add_paragraph("Tenant shall pay rent.")
+        document.add_paragraph("First item", style="List Bullet")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Term"
+        table.cell(0, 1).text = "Value"
+        table.cell(1, 0).text = "Years"
+        table.cell(1, 1).text = "10"
+        path = tmp_path / "lease.docx"
+        document.save(str(path))
+
+        result = DocxConverter().convert(path)
+
+        assert result.success is True
+        assert result.text == (
+            "## Lease Summary\n\n"
+            "Tenant shall pay rent.\n\n"
+            "- First item\n\n"
+            "| Term | Value |\n|---|---|\n| Years | 10 |"
+        )
+        assert result.metadata["tables"] == 1
+
+    def test_corrupt_file_reports_failure(self, tmp_path: Path):
+        """A file python-docx cannot open is a failure, not a crash."""
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip")
+
+        result = DocxConverter().convert(path)
+
+        assert result.success is False
+        assert result.confidence_reason == "converter crashed"
@@ -0,0 +1,220 @@
+"""
+Tests for page-level caching of PDF conversions.
+
+Docling is replaced with a fake that builds a real ``DoclingDocument`` from
+each page's text layer, so page splitting and reassembly are exercised
+without the Docling models.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import fitz
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+)
+
+from converters import docling_converter, pipeline
+from converters.docling_converter import DoclingConverter
+from converters.page_cache import CACHE_DIR_NAME, PageCache, page_fingerprints
+from converters.profiles import get_profile
+from converters.redactor import RedactionReport
+from converters.workspace import work_dir
+from tests.test_text_layer import BODY_TEXT, make_pdf
+
+
+# ------------------------------------------------------------------
+# Fakes
+# ------------------------------------------------------------------
+
+
+def _convert_pages(path: Path, first: int, last: int) -> DoclingDocument:
+    """A DoclingDocument holding the text layer of pages first..last."""
+    document = DoclingDocument(name=path.stem)
+    with fitz.open(str(path)) as pdf:
+        last = min(last, pdf.page_count)
+        for page_no in range(first, last + 1):
+            document.add_page(page_no=page_no, size=Size(width=612, height=792))
+            text = pdf[page_no - 1].get_text().strip() or f"[scan {page_no}]"
+            document.add_text(
+                label=DocItemLabel.TEXT,
+                text=text,
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    bbox=BoundingBox(l=0, t=0, r=1, b=1),
+                    charspan=(0, len(text)),
+                ),
+            )
+    return document
+
+
+class _FakeConverter:
+    def __init__(self, do_ocr: bool, calls: list) -> None:
+        self.do_ocr = do_ocr
+        self.calls = calls
+
+    def convert(self, source, raises_on_error=True, page_range=(1, 10**9)):
+        self.calls.append(page_range)
+        return SimpleNamespace(
+            status=docling_converter.ConversionStatus.SUCCESS,
+            errors=[],
+            document=_convert_pages(Path(source), *page_range),
+        )
+
+
+@pytest.fixture
+def fake_docling(monkeypatch):
+    """Replace the Docling converters with page-aware fakes."""
+    calls: list[tuple[int, int]] = []
+    monkeypatch.setattr(
+        docling_converter,
+        "_get_converter",
+        lambda profile=None, do_ocr=True: _FakeConverter(do_ocr, calls),
+    )
+    return calls
+
+
+def _pages(n: int, **changes: str) -> list[str]:
+    texts = [f"Page {i} {BODY_TEXT}" for i in range(1, n + 1)]
+    for key, text in changes.items():
+        texts[int(key.lstrip("p")) - 1] = text
+    return texts
+
+
+# ------------------------------------------------------------------
+# Fingerprints
+# ------------------------------------------------------------------
+
+
+class TestPageFingerprints:
+    """Tests for per-page content fingerprints."""
+
+    def test_unchanged_pages_keep_their_fingerprint(self, tmp_path: Path):
+        """Editing one page only changes that page's fingerprint."""
+        before = page_fingerprints(make_pdf(tmp_path / "a.pdf", _pages(3)))
+        after = page_fingerprints(
+            make_pdf(tmp_path / "b.pdf", _pages(3, p2="Revised pricing page"))
+        )
+
+        assert before[0] == after[0]
+        assert before[1] != after[1]
+        assert before[2] == after[2]
+
+    def test_unreadable_pdf(self, tmp_path: Path):
+        """A file PyMuPDF cannot open has no fingerprints."""
+        bogus = tmp_path / "bogus.pdf"
+        bogus.write_bytes(b"not a pdf")
+
+        assert page_fingerprints(bogus) is None
+
+    def test_key_depends_on_profile(self, tmp_path: Path):
+        """Output from different profiles is cached separately."""
+        cache = PageCache(tmp_path)
+
+        assert cache.key("abc", get_profile("fast")) != cache.key(
+            "abc", get_profile("accurate")
+        )
+
+
+# ------------------------------------------------------------------
+# Incremental conversion
+# ------------------------------------------------------------------
+
+
+class TestIncrementalConversion:
+    """Tests that revised PDFs only convert their changed pages."""
+
+    def test_first_conversion_populates_cache(self, tmp_path: Path, fake_docling):
+        """A cold cache converts everything and stores every page."""
+        pdf = make_pdf(tmp_path / "om.pdf", _pages(3))
+        converter = DoclingConverter(page_cache=PageCache(tmp_path / "cache"))
+
+        result = converter.convert(pdf)
+
+        assert len(fake_docling) == 1
+        assert result.metadata["pages_reused"] == 0
+        assert result.metadata["pages_converted"] == 3
+        assert len(list((tmp_path / "cache").rglob("*.json.gz"))) == 3
+
+    def test_revised_pdf_converts_only_changed_page(
+        self, tmp_path: Path, fake_docling
+    ):
+        """Unchanged pages come from the cache, in the right order."""
+        cache = PageCache(tmp_path / "cache")
+        converter = DoclingConverter(page_cache=cache)
+        converter.convert(make_pdf(tmp_path / "om.pdf", _pages(3)))
+        fake_docling.clear()
+
+        revised = make_pdf(
+            tmp_path / "om.pdf", _pages(3, p2="Revised pricing page")
+        )
+        result = converter.convert(revised)
+
+        assert fake_docling == [(2, 2)]
+        assert result.metadata["pages_reused"] == 2
+        assert result.metadata["pages_converted"] == 1
+        assert result.page_count == 3
+        text = result.text
+        assert text.index("Page 1") < text.index("Revised pricing") < text.index("Page 3")
+
+    def test_moved_pages_take_their_new_numbers(
+        self, tmp_path: Path, fake_docling
+    ):
+        """A cached page reused at another position is renumbered to it."""
+        converter = DoclingConverter(page_cache=PageCache(tmp_path / "cache"))
+        converter.convert(make_pdf(tmp_path / "om.pdf", _pages(2)))
+        fake_docling.clear()
+
+        texts = [f"Cover letter {BODY_TEXT}"] + _pages(2)
+        result = converter.convert(make_pdf(tmp_path / "om.pdf", texts))
+
+        assert fake_docling == [(1, 1)]
+        assert sorted(result.document.pages) == [1, 2, 3]
+        text = result.text
+        assert text.index("Cover letter") < text.index("Page 1") < text.index("Page 2")
+
+    def test_fully_cached_pdf_converts_nothing(self, tmp_path: Path, fake_docling):
+        """A resent, unchanged PDF is assembled entirely from the cache."""
+        converter = DoclingConverter(page_cache=PageCache(tmp_path / "cache"))
+        pdf = make_pdf(tmp_path / "om.pdf", _pages(2))
+        first = converter.convert(pdf)
+        fake_docling.clear()
+
+        second = converter.convert(pdf)
+
+        assert fake_docling == []
+        assert second.metadata["pages_reused"] == 2
+        assert second.text == first.text
+
+    def test_no_cache_reports_nothing(self, tmp_path: Path, fake_docling):
+        """Without a page cache no page statistics are recorded."""
+        result = DoclingConverter().convert(make_pdf(tmp_path / "om.pdf", _pages(2)))
+
+        assert "pages_reused" not in result.metadata
+
+    def test_pipeline_cache_stays_out_of_converted(
+        self, tmp_path: Path, fake_docling, monkeypatch
+    ):
+        """The pipeline keeps cached (unredacted) pages in the work folder."""
+        monkeypatch.setattr(
+            pipeline, "redact_converted_folder", lambda path, **_: RedactionReport()
+        )
+        folder = tmp_path / "deal"
+        folder.mkdir()
+        make_pdf(folder / "om.pdf", _pages(2))
+        legacy = folder / "_converted" / "_cache" / "pages"
+        legacy.mkdir(parents=True)
+
+        result = pipeline.convert_folder(folder)
+
+        pages = work_dir(folder) / CACHE_DIR_NAME / "pages"
+        assert len(list(pages.rglob("*.json.gz"))) == 2
+        assert not legacy.parent.exists()
+        assert not list(result.converted_dir.rglob("*.json.gz"))
@@ -0,0 +1,79 @@
+"""
+Tests for redacting a folder with several worker processes.
+
+Uses the SSN-finding fake model from ``test_redaction_batching``; forked
+workers inherit it from the test process.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from converters import redactor, resources
+from tests.test_redaction_batching import _filler, fake_model  # noqa: F401  (fixture)
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "serial"
+    folder.mkdir()
+    for n in range(12):
+        lines = [_filler(300 + 41 * n)]
+        if n % 2:
+            lines.append(f"Guarantor SSN 123-45-{n:04d}.")
+        if n % 3 == 0:
+            lines.append("Wire to routing 021000021 today.")
+        lines.append(_filler(900 - 37 * n))
+        (folder / f"doc{n:02d}.md").write_text("\n".join(lines) + "\n")
+    return folder
+
+
+def _report(report: redactor.RedactionReport) -> dict:
+    return {**asdict(report), "elapsed_seconds": 0}
+
+
+def _saved_report(folder: Path) -> dict:
+    saved = json.loads((folder / "redaction-report.json").read_text())
+    return {**saved, "elapsed_seconds": 0, "chars_per_second": 0}
+
+
+class TestParallelRedaction:
+    """Tests for redact_converted_folder with workers."""
+
+    def test_same_output_as_serial(self, folder: Path, fake_model):
+        parallel = folder.with_name("parallel")
+        shutil.copytree(folder, parallel)
+
+        serial_report = redactor.redact_converted_folder(folder, batch_size=2)
+        assert len(fake_model.batches) > 3
+        fake_model.batches.clear()
+        parallel_report = redactor.redact_converted_folder(
+            parallel, batch_size=2, workers=3
+        )
+
+        # Every batch ran in a worker.
+        assert fake_model.batches == []
+        assert serial_report.total_entities == 10
+        for path in folder.glob("*.md"):
+            assert (parallel / path.name).read_bytes() == path.read_bytes()
+        assert _report(parallel_report) == _report(serial_report)
+        assert _saved_report(parallel) == _saved_report(folder)
+
+    def test_workers_split_the_core_budget(self, fake_model, monkeypatch):
+        monkeypatch.setattr(resources, "_settings", resources.split_budget(8))
+
+        with redactor._worker_pool(4):
+            settings = redactor._pool.apply(resources.thread_settings)
+
+        assert redactor._pool is None
+        assert settings == resources.split_budget(8, 4)
+        assert settings.intra_op_threads == 2
+
+    def test_one_worker_stays_in_process(self, fake_model):
+        with redactor._worker_pool(1):
+            assert redactor._pool is None
@@ -0,0 +1,85 @@
+"""Tests for named conversion profiles and per-file-type resolution."""
+
+from __future__ import annotations
+
+import pytest
+
+from converters.docling_converter import _build_pdf_pipeline_options
+from converters.profiles import (
+    DEFAULT_PROFILE,
+    PROFILES,
+    get_profile,
+    resolve_profile,
+)
+
+
+def test_default_profile():
+    assert get_profile(None).name == DEFAULT_PROFILE
+
+
+def test_unknown_profile_raises():
+    with pytest.raises(ValueError, match="Unknown conversion profile"):
+        get_profile("turbo")
+
+
+def test_profile_lookup_is_case_insensitive():
+    assert get_profile("FAST") is PROFILES["fast"]
+
+
+def test_per_type_override_wins():
+    overrides = {"xlsx": "fast"}
+    assert resolve_profile("xlsx", "accurate", overrides).name == "fast"
+    assert resolve_profile("pdf", "accurate", overrides).name == "accurate"
+
+
+def test_cache_keys_are_distinct():
+    keys = {profile.cache_key for profile in PROFILES.values()}
+    assert len(keys) == len(PROFILES)
+
+
+def test_accurate_profile_matches_original_settings():
+    """The accurate profile OCRs every page with accurate TableFormer."""
+    profile = get_profile("accurate")
+    opts = _build_pdf_pipeline_options(profile, do_ocr=True)
+
+    assert profile.ocr == "always"
+    assert opts.do_ocr is True
+    assert opts.table_structure_options.mode.value == "accurate"
+    assert opts.table_structure_options.do_cell_matching is True
+
+
+def test_fast_profile_options():
+    """The fast profile uses FastTableFormer and a lower OCR render scale."""
+    profile = get_profile("fast")
+    opts = _build_pdf_pipeline_options(profile, do_ocr=True)
+
+    assert opts.table_structure_options.mode.value == "fast"
+    if "scale" in type(opts.ocr_options).model_fields:
+        assert opts.ocr_options.scale == profile.ocr_scale
+
+
+def test_retry_pass_options():
+    """The OCR retry pass renders at a higher scale than the first pass."""
+    profile = get_profile("balanced")
+    first = _build_pdf_pipeline_options(profile, do_ocr=True)
+    retry = _build_pdf_pipeline_options(profile, do_ocr=True, retry=True)
+
+    assert profile.ocr_retry_scale > profile.ocr_scale
+    if "scale" in type(retry.ocr_options).model_fields:
+        assert first.ocr_options.scale == profile.ocr_scale
+        assert retry.ocr_options.scale == profile.ocr_retry_scale
+
+
+@pytest.mark.parametrize(
+    ("name", "first_pass"), [("balanced", "fast"), ("accurate", "accurate")]
+)
+def test_macos_first_pass_recognition(monkeypatch, name, first_pass):
+    """Only balanced trades first-pass Vision quality for the retry."""
+    monkeypatch.setattr("platform.system", lambda: "Darwin")
+    profile = get_profile(name)
+
+    first = _build_pdf_pipeline_options(profile, do_ocr=True)
+    retry = _build_pdf_pipeline_options(profile, do_ocr=True, retry=True)
+
+    assert first.ocr_options.recognition == first_pass
+    assert retry.ocr_options.recognition == "accurate"
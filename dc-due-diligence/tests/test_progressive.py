@@ -0,0 +1,234 @@
+"""
+Tests for progressive conversion: instant text-layer drafts and their
+background Docling refinement.
+
+Docling is replaced with the page-aware fake from ``test_page_cache`` and
+PII redaction is stubbed out, so no models are needed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from converters import pipeline, redactor, refine
+from converters.base import ConfidenceLevel
+from converters.draft_converter import DRAFT_METHOD, TextLayerDraftConverter
+from converters.redactor import IndexedEntity, RedactionReport, RedactionResult
+from tests.test_page_cache import fake_docling  # noqa: F401  (fixture)
+from tests.test_text_layer import BODY_TEXT, make_pdf
+
+
+# ------------------------------------------------------------------
+# Drafts
+# ------------------------------------------------------------------
+
+
+class TestTextLayerDraftConverter:
+    """Tests for drafting PDFs from their embedded text layer."""
+
+    def test_born_digital_pdf(self, tmp_path: Path):
+        """Every page's text ends up in the draft, in order."""
+        pdf = make_pdf(
+            tmp_path / "om.pdf", [f"Page one {BODY_TEXT}", f"Page two {BODY_TEXT}"]
+        )
+
+        result = TextLayerDraftConverter().convert(pdf)
+
+        assert result.success is True
+        assert result.method == DRAFT_METHOD
+        assert result.confidence == ConfidenceLevel.MEDIUM
+        assert result.page_count == 2
+        assert result.text.index("Page one") < result.text.index("Page two")
+
+    def test_scanned_pages_left_as_placeholders(self, tmp_path: Path):
+        """Pages without a usable text layer are marked, not dropped."""
+        pdf = make_pdf(tmp_path / "mixed.pdf", [BODY_TEXT, None])
+
+        result = TextLayerDraftConverter().convert(pdf)
+
+        assert result.success is True
+        assert "page 2: no usable text layer" in result.text
+        assert result.metadata["ocr_pages"] == [2]
+
+    def test_fully_scanned_pdf_has_no_draft(self, tmp_path: Path):
+        """A scan cannot be drafted."""
+        pdf = make_pdf(tmp_path / "scan.pdf", [None, None])
+
+        result = TextLayerDraftConverter().convert(pdf)
+
+        assert result.success is False
+        assert result.confidence_reason == "no usable text layer"
+
+
+# ------------------------------------------------------------------
+# Progressive pipeline and refinement
+# ------------------------------------------------------------------
+
+
+def _manifest(folder: Path) -> dict:
+    return json.loads((folder / "_converted" / "manifest.json").read_text())
+
+
+def _entry(folder: Path, relative_path: str) -> dict:
+    return next(
+        f for f in _manifest(folder)["files"] if f["relative_path"] == relative_path
+    )
+
+
+def _redact(path: Path, index: bool = False) -> RedactionResult:
+    """Stand-in for redact_file: finds nothing to redact, one utility."""
+    indexed = [IndexedEntity("utility", "dominion energy", 0, 15, 0.8)] if index else []
+    return RedactionResult(str(path), "", entities_found=0, indexed=indexed)
+
+
+def _write_index(folder: Path, *files: str) -> Path:
+    """An entity index from an earlier run, with one entry per file."""
+    index_path = folder / "_converted" / "entity-index.json"
+    entities = [
+        {"type": "person", "value": "draft", "file": name, "offset": 0, "length": 5}
+        for name in files
+    ]
+    index_path.write_text(json.dumps({"entities": entities}))
+    return index_path
+
+
+class TestProgressiveConversion:
+    """Tests for convert_folder(progressive=True) and converters.refine."""
+
+    @pytest.fixture
+    def started(self, monkeypatch) -> list[Path]:
+        """Stub out redaction and record background refinement launches."""
+        launches: list[Path] = []
+        monkeypatch.setattr(
+            pipeline, "redact_converted_folder", lambda path, **_: RedactionReport()
+        )
+        monkeypatch.setattr(
+            pipeline, "_start_refinement", lambda root, **kwargs: launches.append(root)
+        )
+        monkeypatch.setattr(refine, "redact_file", _redact)
+        return launches
+
+    @pytest.fixture
+    def opportunity(self, tmp_path: Path, started) -> Path:
+        folder = tmp_path / "deal"
+        folder.mkdir()
+        make_pdf(folder / "om.pdf", [f"Page 1 {BODY_TEXT}", f"Page 2 {BODY_TEXT}"])
+        make_pdf(folder / "survey.pdf", [None])
+        return folder
+
+    def test_drafts_written_and_refinement_queued(
+        self, opportunity: Path, started: list[Path], fake_docling
+    ):
+        """Drafts land immediately; Docling is not run in the foreground."""
+        result = pipeline.convert_folder(opportunity, progressive=True)
+
+        assert fake_docling == []
+        assert started == [opportunity.resolve()]
+        assert result.pending_count == 2
+        assert result.failed_count == 0
+
+        draft = _entry(opportunity, "om.pdf")
+        assert draft["method"] == DRAFT_METHOD
+        assert draft["refinement"] == "pending"
+        assert "Page 2" in Path(draft["converted_path"]).read_text()
+
+        scan = _entry(opportunity, "survey.pdf")
+        assert scan["success"] is False
+        assert scan["refinement"] == "pending"
+        assert scan["converted_filename"] == "survey.md"
+
+    def test_refinement_replaces_drafts(self, opportunity: Path, fake_docling):
+        """Each file is reconverted in place and its entry marked done."""
+        pipeline.convert_folder(opportunity, progressive=True)
+
+        assert refine.refine_folder(opportunity) == 2
+
+        converted = opportunity / "_converted"
+        for name in ("om.pdf", "survey.pdf"):
+            entry = _entry(opportunity, name)
+            assert entry["refinement"] == "done"
+            assert entry["method"] == "docling"
+            assert "**Method:** docling" in Path(entry["converted_path"]).read_text()
+        assert _manifest(opportunity)["pipeline_summary"]["converted"] == 2
+        report = json.loads((converted / "redaction-report.json").read_text())
+        assert report["files_scanned"] == 2
+        assert not list(converted.glob("*.tmp"))
+        assert not (converted / refine.REFINE_LOCK_FILENAME).exists()
+
+    def test_failed_refinement_keeps_draft(self, opportunity: Path, fake_docling):
+        """When Docling fails, agents keep reading the draft."""
+        pipeline.convert_folder(opportunity, progressive=True)
+        draft_path = Path(_entry(opportunity, "om.pdf")["converted_path"])
+        draft = draft_path.read_text()
+        (opportunity / "om.pdf").unlink()
+
+        refine.refine_folder(opportunity)
+
+        entry = _entry(opportunity, "om.pdf")
+        assert entry["refinement"] == "failed"
+        assert entry["method"] == DRAFT_METHOD
+        assert draft_path.read_text() == draft
+
+    def test_running_refinement_is_not_duplicated(
+        self, opportunity: Path, fake_docling
+    ):
+        """A live lock holder makes a second refinement a no-op."""
+        pipeline.convert_folder(opportunity, progressive=True)
+        lock = opportunity / "_converted" / refine.REFINE_LOCK_FILENAME
+        lock.write_text(str(os.getpid()))
+
+        assert refine.refine_folder(opportunity) == 0
+        assert fake_docling == []
+
+    def test_refinement_indexes_refined_files(self, opportunity: Path, fake_docling):
+        """Refined files replace their drafts' entries in the entity index."""
+        pipeline.convert_folder(opportunity, progressive=True)
+        index_path = _write_index(opportunity, "om.md")
+
+        refine.refine_folder(opportunity, index_entities=True)
+
+        saved = json.loads(index_path.read_text())
+        assert sorted((e["file"], e["value"]) for e in saved["entities"]) == [
+            ("om.md", "dominion energy"),
+            ("survey.md", "dominion energy"),
+        ]
+        assert _manifest(opportunity)["redaction_summary"]["entities_indexed"] == 2
+        report = json.loads(
+            (opportunity / "_converted" / "redaction-report.json").read_text()
+        )
+        fingerprint = redactor.config_fingerprint(index=True)
+        assert {f["config"] for f in report["files"]} == {fingerprint}
+
+    def test_refinement_without_index_drops_stale_entries(
+        self, opportunity: Path, fake_docling
+    ):
+        """A draft's entries do not outlive the draft."""
+        pipeline.convert_folder(opportunity, progressive=True)
+        index_path = _write_index(opportunity, "om.md", "other.md")
+        (opportunity / "_converted" / "other.md").write_text("Unrelated.\n")
+
+        refine.refine_folder(opportunity)
+
+        saved = json.loads(index_path.read_text())
+        assert [e["file"] for e in saved["entities"]] == ["other.md"]
+
+    def test_refinement_command_carries_options(self, tmp_path: Path, monkeypatch):
+        """Options the background process needs are passed on its command line."""
+        commands: list[list[str]] = []
+        monkeypatch.setattr(
+            pipeline.subprocess,
+            "Popen",
+            lambda command, **_: commands.append(command) or SimpleNamespace(pid=1),
+        )
+        (tmp_path / "_converted").mkdir()
+
+        pipeline._start_refinement(tmp_path, prepare_images=False, index_entities=True)
+
+        (command,) = commands
+        assert "--no-image-prep" in command
+        assert "--index-entities" in command
@@ -0,0 +1,125 @@
+"""
+Tests for selecting the GLiNER inference backend and for the cached,
+int8-quantized ONNX export.
+
+GLiNER itself is replaced with a fake that records how it was loaded and
+"exports" by writing placeholder files, so no model is downloaded.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import gliner
+import pytest
+
+from converters import redactor, resources
+
+
+class _FakeGLiNER:
+    """Records loads and exports instead of touching a real model."""
+
+    loads: list[dict] = []
+    exports: list[Path] = []
+
+    @classmethod
+    def from_pretrained(cls, model_id, **kwargs):
+        cls.loads.append({"model_id": model_id, **kwargs})
+        return cls()
+
+    def export_to_onnx(self, save_dir, quantize=False, quantized_filename="", **kwargs):
+        save_dir = Path(save_dir)
+        save_dir.mkdir(parents=True)
+        self.exports.append(save_dir)
+        (save_dir / "model.onnx").write_bytes(b"fp32")
+        (save_dir / "gliner_config.json").write_text("{}")
+        quantized = save_dir / quantized_filename if quantize else None
+        if quantized is not None:
+            quantized.write_bytes(b"int8")
+        return {
+            "onnx_path": str(save_dir / "model.onnx"),
+            "quantized_path": str(quantized) if quantized else None,
+        }
+
+
+@pytest.fixture
+def fake_gliner(tmp_path: Path, monkeypatch):
+    """Install the fake, an empty model cache and a clean backend choice."""
+    _FakeGLiNER.loads = []
+    _FakeGLiNER.exports = []
+    monkeypatch.setattr(gliner, "GLiNER", _FakeGLiNER)
+    monkeypatch.setenv(redactor.MODEL_CACHE_ENV, str(tmp_path / "models"))
+    monkeypatch.delenv(redactor.REDACTION_BACKEND_ENV, raising=False)
+    monkeypatch.setattr(redactor, "_models", {})
+    monkeypatch.setattr(redactor, "_backend", None)
+    monkeypatch.setattr(resources, "_settings", resources.split_budget(4, 2))
+    monkeypatch.setattr(redactor, "apply_thread_settings", lambda settings=None: None)
+    return _FakeGLiNER
+
+
+class TestBackendSelection:
+    """Tests for choosing between the torch and ONNX backends."""
+
+    def test_default_is_torch(self, fake_gliner):
+        assert redactor.get_backend() == "torch"
+
+    def test_environment_selects_backend(self, fake_gliner, monkeypatch):
+        monkeypatch.setenv(redactor.REDACTION_BACKEND_ENV, "ONNX")
+        assert redactor.get_backend() == "onnx"
+
+    def test_unknown_backend_raises(self, fake_gliner):
+        with pytest.raises(ValueError, match="Unknown redaction backend"):
+            redactor.set_backend("tensorrt")
+
+    def test_torch_backend_loads_checkpoint(self, fake_gliner):
+        redactor._get_model()
+
+        assert fake_gliner.loads == [{"model_id": "urchade/gliner_multi_pii-v1"}]
+
+
+class TestOnnxBackend:
+    """Tests for exporting, caching and loading the int8 ONNX model."""
+
+    def test_first_use_exports_quantized_model(self, fake_gliner, tmp_path: Path):
+        redactor.set_backend("onnx")
+
+        redactor._get_model()
+
+        model_dir = redactor._onnx_model_dir()
+        assert model_dir.is_relative_to(tmp_path / "models")
+        assert (model_dir / "model_quantized.onnx").exists()
+        assert not (model_dir / "model.onnx").exists()
+        load = fake_gliner.loads[-1]
+        assert load["load_onnx_model"] is True
+        assert load["onnx_model_file"] == "model_quantized.onnx"
+        assert load["model_dir"] == str(model_dir)
+        assert load["session_options"].intra_op_num_threads == 2
+        assert load["session_options"].inter_op_num_threads == 1
+
+    def test_cached_export_is_reused(self, fake_gliner, monkeypatch):
+        redactor.set_backend("onnx")
+        redactor._get_model()
+        monkeypatch.setattr(redactor, "_models", {})
+
+        redactor._get_model()
+
+        assert len(fake_gliner.exports) == 1
+
+    def test_failed_quantization_leaves_no_cache(self, fake_gliner, monkeypatch):
+        """ONNX Runtime failing to quantize is an error, not a cached model."""
+        monkeypatch.setattr(
+            _FakeGLiNER,
+            "export_to_onnx",
+            lambda self, save_dir, **kwargs: (
+                Path(save_dir).mkdir(parents=True)
+                or {"onnx_path": None, "quantized_path": None}
+            ),
+        )
+        redactor.set_backend("onnx")
+
+        with pytest.raises(RuntimeError, match="quantize"):
+            redactor._get_model()
+        assert not redactor._onnx_model_dir().exists()
+        assert not redactor._onnx_model_dir().with_name(
+            f"{redactor._onnx_model_dir().name}.partial"
+        ).exists()
@@ -0,0 +1,117 @@
+"""
+Tests for batched GLiNER inference across chunks and files.
+
+The model is replaced with a fake that "detects" SSN-shaped strings and
+records the batches it is given, so no model is downloaded.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from converters import redactor
+
+_SSN = re.compile(r"\d{3}-\d{2}-\d{4}")
+
+
+class _FakeModel:
+    """Finds SSN-shaped strings; records each batch of texts."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def inference(self, texts, labels, threshold=0.5, batch_size=8):
+        self.batches.append(list(texts))
+        return [
+            [
+                {
+                    "start": m.start(),
+                    "end": m.end(),
+                    "text": m.group(),
+                    "label": "social security number",
+                    "score": 0.9,
+                }
+                for m in _SSN.finditer(text)
+            ]
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def fake_model(monkeypatch) -> _FakeModel:
+    model = _FakeModel()
+    monkeypatch.setattr(redactor, "_get_model", lambda: model)
+    return model
+
+
+def _filler(chars: int) -> str:
+    sentence = "The site has 120 MW of firm capacity. "
+    return (sentence * (chars // len(sentence) + 1))[:chars]
+
+
+class TestBatchedDetection:
+    """Tests for pooling chunks into batches and mapping entities back."""
+
+    def test_short_texts_share_a_batch(self, fake_model: _FakeModel):
+        texts = ["SSN 123-45-6789", "no pii here", "SSN 987-65-4321 and more"]
+
+        results = redactor._detect_pii_gliner_many(texts, batch_size=8)
+
+        assert len(fake_model.batches) == 1
+        assert [len(r) for r in results] == [1, 0, 1]
+        assert results[2][0]["start"] == 4
+        assert results[2][0]["source"] == "gliner"
+
+    def test_batches_are_length_bucketed(self, fake_model: _FakeModel):
+        texts = ["a" * 10, "b" * 500, "c" * 20, "d" * 600]
+
+        redactor._detect_pii_gliner_many(texts, batch_size=2, gate=False)
+
+        assert [[t[0] for t in batch] for batch in fake_model.batches] == [
+            ["a", "c"],
+            ["b", "d"],
+        ]
+
+    def test_long_text_offsets_are_absolute(self, fake_model: _FakeModel):
+        """Entities in later chunks land at their position in the file."""
+        text = _filler(2500) + " SSN 123-45-6789. " + _filler(2500)
+
+        (entity,) = redactor._detect_pii_gliner_many(
+            [text, "short"], gate=False
+        )[0]
+
+        assert text[entity["start"] : entity["end"]] == "123-45-6789"
+        # Four full-context chunks of the long text, plus "short".
+        assert len(fake_model.batches[0]) == 5
+
+    def test_empty_text(self, fake_model: _FakeModel):
+        assert redactor._detect_pii_gliner_many(["", "   "]) == [[], []]
+        assert fake_model.batches == []
+
+
+class TestFolderRedaction:
+    """Tests for redact_converted_folder with batched inference."""
+
+    def test_matches_file_by_file_redaction(self, tmp_path: Path, fake_model):
+        texts = {
+            "a.md": "Seller SSN 123-45-6789.\n" + _filler(3000),
+            "b.md": _filler(200),
+            "c.md": _filler(1500) + " guarantor 555-12-3456 " + _filler(40),
+        }
+        for name, text in texts.items():
+            (tmp_path / name).write_text(text)
+        expected = {name: redactor.redact_text(text) for name, text in texts.items()}
+
+        report = redactor.redact_converted_folder(tmp_path, batch_size=4)
+
+        for name, result in expected.items():
+            assert (tmp_path / name).read_text() == result.redacted_text
+        assert report.total_entities == 2
+        assert report.characters_scanned == sum(map(len, texts.values()))
+        saved = json.loads((tmp_path / "redaction-report.json").read_text())
+        assert saved["characters_scanned"] == report.characters_scanned
+        assert saved["chars_per_second"] > 0
@@ -0,0 +1,93 @@
+"""
+Tests for the two-stage PII cascade: a small screening model decides which
+chunks the full GLiNER model reads.
+
+Both models are fakes that record what they are given, so nothing is
+downloaded.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from converters import redactor
+from tests.test_redaction_batching import _FakeModel
+
+
+class _FakeScreen:
+    """Flags chunks containing "SSN"; records chunks and thresholds."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.thresholds: list[float] = []
+
+    def inference(self, texts, labels, threshold=0.5, batch_size=8):
+        self.seen.extend(texts)
+        self.thresholds.append(threshold)
+        return [
+            [{"start": 0, "end": 3, "text": t[:3], "label": "ssn", "score": 0.2}]
+            if "SSN" in t
+            else []
+            for t in texts
+        ]
+
+
+@pytest.fixture
+def models(monkeypatch):
+    """Install a fake full model and screening model; clear the cascade."""
+    full = _FakeModel()
+    screen = _FakeScreen()
+    loaded: list[str] = []
+    monkeypatch.setattr(redactor, "_get_model", lambda: full)
+    monkeypatch.setattr(
+        redactor,
+        "_get_screen_model",
+        lambda name: loaded.append(name) or screen,
+    )
+    monkeypatch.delenv(redactor.SCREEN_MODEL_ENV, raising=False)
+    monkeypatch.setattr(redactor, "_screen_model", None)
+    return full, screen, loaded
+
+
+TEXTS = [
+    "Guarantor SSN 123-45-6789 signs the estoppel.",
+    "Account reference 555-12-3456 for the escrow deposit.",
+]
+
+
+class TestCascade:
+    """Tests for screening chunks before the full model."""
+
+    def test_off_by_default(self, models):
+        full, screen, loaded = models
+
+        results = redactor._detect_pii_gliner_many(TEXTS)
+
+        assert redactor.get_cascade() is None
+        assert loaded == []
+        assert [len(r) for r in results] == [1, 1]
+
+    def test_only_flagged_chunks_reach_full_model(self, models):
+        full, screen, loaded = models
+        redactor.set_cascade("small-pii")
+
+        results = redactor._detect_pii_gliner_many(TEXTS)
+
+        assert loaded == ["small-pii"]
+        assert sorted(screen.seen) == sorted(TEXTS)
+        assert full.batches == [[TEXTS[0]]]
+        assert [len(r) for r in results] == [1, 0]
+        assert screen.thresholds == [redactor._SCREEN_THRESHOLD]
+
+    def test_nothing_flagged_skips_full_model(self, models):
+        full, screen, _ = models
+        redactor.set_cascade("small-pii")
+
+        assert redactor._detect_pii_gliner_many([TEXTS[1]]) == [[]]
+        assert full.batches == []
+
+    def test_configured_from_environment(self, models, monkeypatch):
+        monkeypatch.setenv(redactor.SCREEN_MODEL_ENV, "small-pii")
+        assert redactor.get_cascade() == "small-pii"
+
+        assert redactor.set_cascade("") is None
@@ -0,0 +1,93 @@
+"""
+Tests for merging overlapping detections and splicing placeholders into text.
+"""
+
+from __future__ import annotations
+
+import random
+
+from converters import redactor
+
+
+def _ent(start: int, end: int, label: str, source: str = "gliner", score: float = 0.9):
+    return {"start": start, "end": end, "label": label, "score": score, "source": source}
+
+
+class TestMergeDetections:
+    """Tests for the interval sweep in _merge_detections."""
+
+    def test_overlapping_gliner_spans_coalesce(self):
+        """The same value seen in two overlapping chunks becomes one span."""
+        merged = redactor._merge_detections(
+            [
+                _ent(10, 21, "social security number", score=0.6),
+                _ent(14, 25, "tax identification number", score=0.8),
+                _ent(40, 50, "iban"),
+            ],
+            [],
+        )
+
+        assert [(e["start"], e["end"], e["label"]) for e in merged] == [
+            (10, 25, "tax identification number"),
+            (40, 50, "iban"),
+        ]
+
+    def test_gliner_names_a_span_regex_overlaps(self):
+        merged = redactor._merge_detections(
+            [_ent(4, 11, "iban", score=0.4)],
+            [_ent(0, 11, "ssn", source="regex", score=1.0)],
+        )
+
+        assert merged == [_ent(0, 11, "iban", score=0.4)]
+
+    def test_adjacent_spans_stay_separate(self):
+        merged = redactor._merge_detections(
+            [_ent(0, 5, "cvv")], [_ent(5, 9, "ssn", source="regex")]
+        )
+        assert [(e["start"], e["end"]) for e in merged] == [(0, 5), (5, 9)]
+
+    def test_independent_of_input_order(self):
+        entities = [
+            _ent(start, end, label, score=score)
+            for start, end, label, score in [
+                (0, 10, "cvv", 0.5),
+                (3, 7, "iban", 0.5),
+                (8, 20, "passport number", 0.7),
+                (30, 35, "cvv", 0.3),
+                (33, 40, "iban", 0.3),
+            ]
+        ]
+        expected = redactor._merge_detections(entities, [])
+
+        for seed in range(5):
+            shuffled = entities[:]
+            random.Random(seed).shuffle(shuffled)
+            assert redactor._merge_detections(shuffled, []) == expected
+        assert [(e["start"], e["end"]) for e in expected] == [(0, 20), (30, 40)]
+
+
+class TestApplyRedactions:
+    """Tests for assembling the redacted text."""
+
+    def test_overlapping_spans_do_not_corrupt_text(self):
+        text = "Pay to IBAN DE89370400440532013000 today."
+        start = text.index("DE89")
+        gliner = [
+            _ent(start, start + 22, "iban"),
+            _ent(start + 2, start + 22, "bank account number", score=0.5),
+        ]
+
+        result = redactor._apply_redactions(text, gliner)
+
+        assert result.redacted_text == "Pay to IBAN [REDACTED: iban] today."
+        assert result.entities_found == 1
+
+    def test_many_entities_in_document_order(self):
+        text = " ".join(f"SSN 123-45-{n:04d}." for n in range(2000))
+
+        result = redactor._apply_redactions(text, [])
+
+        assert result.entities_found == 2000
+        assert result.redacted_text == " ".join(["SSN [REDACTED: ssn]."] * 2000)
+        starts = [e.start for e in result.entities]
+        assert starts == sorted(starts)
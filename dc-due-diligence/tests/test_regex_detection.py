@@ -0,0 +1,83 @@
+"""
+Tests for the single-pass regex scanner and its check-digit validation.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from benchmarks.pii_corpus import (
+    FIXED_SHAPE_LABELS,
+    make_corpus,
+    make_credit_card,
+    make_iban,
+    make_routing_number,
+)
+from converters import redactor
+
+
+def _labels(text: str) -> list[tuple[str, str]]:
+    return [(e["label"], e["text"]) for e in redactor._detect_pii_regex(text)]
+
+
+class TestValidators:
+    """Tests for the check-digit functions."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_generated_values_pass(self, seed: int):
+        rng = random.Random(seed)
+        assert redactor._luhn_valid(make_credit_card(rng))
+        assert redactor._iban_valid(make_iban(rng))
+        assert redactor._routing_number_valid(make_routing_number(rng))
+
+    def test_known_values(self):
+        assert redactor._luhn_valid("4111 1111 1111 1111")
+        assert not redactor._luhn_valid("4111 1111 1111 1112")
+        assert redactor._iban_valid("GB82WEST12345698765432")
+        assert not redactor._iban_valid("GB82WEST12345698765433")
+        assert redactor._routing_number_valid("021000021")
+        assert not redactor._routing_number_valid("021000022")
+
+
+class TestDetectPiiRegex:
+    """Tests for _detect_pii_regex."""
+
+    def test_each_shape_gets_its_label(self):
+        text = (
+            "SSN 123-45-6789, EIN 12-3456789, card 4111-1111-1111-1111, "
+            "card 4012888888881881, IBAN DE89370400440532013000, "
+            "routing 021000021."
+        )
+
+        assert _labels(text) == [
+            ("ssn", "123-45-6789"),
+            ("ein", "12-3456789"),
+            ("credit_card", "4111-1111-1111-1111"),
+            ("credit_card", "4012888888881881"),
+            ("iban", "DE89370400440532013000"),
+            ("routing_number", "021000021"),
+        ]
+
+    def test_failed_check_digits_are_not_redacted(self):
+        text = (
+            "Invoice 4111111111111112, order 1234 5678 9012 3456, "
+            "ref DE00370400440532013000, PO 123456789."
+        )
+        assert _labels(text) == []
+
+    def test_matches_do_not_overlap(self):
+        entities = redactor._detect_pii_regex(
+            " ".join(document.text for document in make_corpus(20, seed=5))
+        )
+
+        for previous, current in zip(entities, entities[1:]):
+            assert previous["end"] <= current["start"]
+
+    def test_planted_values_are_found(self):
+        for document in make_corpus(20, seed=2):
+            spans = {(e["start"], e["end"]) for e in redactor._detect_pii_regex(document.text)}
+            for value in document.planted:
+                if value.label in FIXED_SHAPE_LABELS:
+                    assert (value.start, value.end) in spans
@@ -0,0 +1,85 @@
+"""Tests for the CPU core budget shared by Docling, OCR and GLiNER."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import torch
+from docling.datamodel.base_models import InputFormat
+
+from converters import pipeline, resources
+from converters.docling_converter import _build_converter
+from converters.profiles import get_profile
+from converters.redactor import RedactionReport
+
+
+@pytest.fixture(autouse=True)
+def restore_threads(monkeypatch):
+    """Undo budget changes: module state, environment and torch's pool."""
+    monkeypatch.setattr(resources, "_settings", None)
+    for name in (*resources._THREAD_ENV_VARS, resources.CPU_CORES_ENV):
+        monkeypatch.delenv(name, raising=False)
+    threads = torch.get_num_threads()
+    yield
+    torch.set_num_threads(threads)
+
+
+class TestBudget:
+    """Tests for splitting and applying the core budget."""
+
+    def test_split_between_workers(self):
+        settings = resources.split_budget(8, workers=3)
+        assert settings.intra_op_threads == 2
+        assert settings.inter_op_threads == 1
+
+    def test_more_workers_than_cores(self):
+        assert resources.split_budget(2, workers=4).intra_op_threads == 1
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            resources.split_budget(0)
+
+    def test_budget_from_environment(self, monkeypatch):
+        monkeypatch.setenv(resources.CPU_CORES_ENV, "3")
+        assert resources.thread_settings().cores == 3
+
+    def test_configure_sizes_runtimes(self):
+        """Environment variables and torch's pool follow the budget."""
+        resources.configure(cores=4, workers=2)
+
+        assert torch.get_num_threads() == 2
+        for name in resources._THREAD_ENV_VARS:
+            assert os.environ[name] == "2"
+
+
+class TestConsumers:
+    """Tests for the budget reaching Docling and the manifest."""
+
+    def test_docling_models_use_budget(self):
+        resources.configure(cores=3)
+
+        converter = _build_converter(get_profile("fast"))
+
+        options = converter.format_to_options[InputFormat.PDF].pipeline_options
+        assert options.accelerator_options.num_threads == 3
+
+    def test_manifest_records_settings(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(
+            pipeline, "redact_converted_folder", lambda path, **_: RedactionReport()
+        )
+        folder = tmp_path / "deal"
+        folder.mkdir()
+        (folder / "notes.txt").write_text("unsupported")
+
+        result = pipeline.convert_folder(folder, cpu_cores=2)
+
+        manifest = json.loads(result.manifest_path.read_text())
+        assert manifest["thread_settings"] == {
+            "cores": 2,
+            "workers": 1,
+            "intra_op_threads": 2,
+            "inter_op_threads": 1,
+        }
@@ -0,0 +1,212 @@
+"""
+Tests for the streaming Excel converter.
+
+Workbooks are generated with openpyxl in a temporary directory, so no
+sample files are needed.  Nothing writes XLSB, so :func:`make_xlsb` packs
+the few binary records pyxlsb reads by hand.
+"""
+
+from __future__ import annotations
+
+import datetime
+import struct
+import zipfile
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from converters.base import ConfidenceLevel
+from converters.spreadsheet_converter import SpreadsheetConverter
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def make_workbook(path: Path, sheets: dict[str, list[list]]) -> Path:
+    """Write an XLSX with one sheet per entry of *sheets*."""
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+def _record(record_id: int, payload: bytes = b"") -> bytes:
+    """One BIFF12 record; *payload* must be shorter than 128 bytes."""
+    # Record ids are stored as their little-endian bytes, high bit included.
+    header = record_id.to_bytes(2 if record_id > 0x7F else 1, "little")
+    return header + bytes([len(payload)]) + payload
+
+
+def _xl_string(text: str) -> bytes:
+    return struct.pack("<I", len(text)) + text.encode("utf-16-le")
+
+
+def make_xlsb(path: Path, name: str, rows: list[list[str | float]]) -> Path:
+    """Write a one-sheet XLSB holding inline strings and numbers."""
+    bounds = struct.pack("<4I", 0, len(rows) - 1, 0, max(map(len, rows)) - 1)
+    sheet = _record(0x0194, bounds)  # DIMENSION
+    sheet += _record(0x0191)  # SHEETDATA
+    for r, row in enumerate(rows):
+        sheet += _record(0x0000, struct.pack("<I", r))  # ROW
+        for c, value in enumerate(row):
+            cell = struct.pack("<2I", c, 0)
+            if isinstance(value, str):
+                sheet += _record(0x0008, cell + _xl_string(value))  # FORMULA_STRING
+            else:
+                sheet += _record(0x0005, cell + struct.pack("<d", value))  # FLOAT
+    sheet += _record(0x0192)  # SHEETDATA_END
+
+    sheet_entry = struct.pack("<2I", 0, 1) + _xl_string("rId1") + _xl_string(name)
+    workbook = _record(0x018F)  # SHEETS
+    workbook += _record(0x019C, sheet_entry)  # SHEET
+    workbook += _record(0x0190)  # SHEETS_END
+
+    rels = (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Target="worksheets/sheet1.bin"/>'
+        "</Relationships>"
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("xl/_rels/workbook.bin.rels", rels)
+        archive.writestr("xl/workbook.bin", workbook)
+        archive.writestr("xl/worksheets/sheet1.bin", sheet)
+    return path
+
+
+def _table_lines(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line.startswith("|")]
+
+
+# ------------------------------------------------------------------
+# SpreadsheetConverter
+# ------------------------------------------------------------------
+
+
+class TestSpreadsheetConverter:
+    """Tests for sheet-by-sheet markdown output."""
+
+    def test_sheets_become_headed_tables(self, tmp_path: Path):
+        """Each sheet gets a heading, a size summary and a pipe table."""
+        xlsx = make_workbook(
+            tmp_path / "model.xlsx",
+            {
+                "Load Schedule": [
+                    ["Phase", "MW", "Energized"],
+                    ["1", 10.0, datetime.datetime(2026, 1, 1)],
+                    ["2", 12.5, datetime.datetime(2027, 6, 30)],
+                ],
+                "Summary": [["Total MW", 22.5]],
+            },
+        )
+
+        result = SpreadsheetConverter().convert(xlsx)
+
+        assert result.success is True
+        assert result.confidence == ConfidenceLevel.HIGH
+        assert result.method == "openpyxl-stream"
+        assert result.page_count == 2
+        assert "## Load Schedule" in result.text
+        assert "_3 rows x 3 columns_" in result.text
+        assert "| Phase | MW | Energized |" in result.text
+        assert "| 1 | 10 | 2026-01-01 |" in result.text
+        assert "| 2 | 12.5 | 2027-06-30 |" in result.text
+        assert result.text.index("## Load Schedule") < result.text.index("## Summary")
+        assert result.metadata["sheets"] == [
+            {"name": "Load Schedule", "rows": 3, "columns": 3, "rows_written": 3},
+            {"name": "Summary", "rows": 1, "columns": 2, "rows_written": 1},
+        ]
+
+    def test_empty_rows_and_trailing_cells_dropped(self, tmp_path: Path):
+        """Blank rows are skipped and the width ignores trailing blanks."""
+        xlsx = make_workbook(
+            tmp_path / "sparse.xlsx",
+            {"Data": [["a", "b", None], [None, None], ["c", "d", ""]]},
+        )
+
+        result = SpreadsheetConverter().convert(xlsx)
+
+        assert _table_lines(result.text) == ["| a | b |", "|---|---|", "| c | d |"]
+        assert result.metadata["sheets"][0]["columns"] == 2
+
+    def test_giant_sheet_sampled_head_and_tail(self, tmp_path: Path):
+        """Sheets over the cap keep their first and last rows only."""
+        rows = [["Row"]] + [[f"r{i}"] for i in range(1, 101)]
+        xlsx = make_workbook(tmp_path / "big.xlsx", {"Big": rows})
+
+        result = SpreadsheetConverter(max_rows_per_sheet=10, tail_rows=3).convert(xlsx)
+
+        lines = _table_lines(result.text)
+        assert lines[:3] == ["| Row |", "|---|", "| r1 |"]
+        assert "| ... 91 rows omitted ... |" in lines
+        assert lines[-3:] == ["| r98 |", "| r99 |", "| r100 |"]
+        assert "r50" not in result.text
+        assert "_101 rows x 1 columns; showing first 7 and last 3 rows_" in result.text
+        assert result.confidence == ConfidenceLevel.MEDIUM
+        assert result.metadata["partial"] is True
+        assert result.metadata["sheets"][0]["rows_written"] == 10
+
+    def test_no_cap_writes_every_row(self, tmp_path: Path):
+        """max_rows_per_sheet=None disables sampling."""
+        rows = [[i] for i in range(50)]
+        xlsx = make_workbook(tmp_path / "all.xlsx", {"All": rows})
+
+        result = SpreadsheetConverter(max_rows_per_sheet=None).convert(xlsx)
+
+        assert len(_table_lines(result.text)) == 51
+        assert result.metadata["partial"] is False
+
+    def test_empty_workbook_is_low_confidence(self, tmp_path: Path):
+        """A workbook with no values converts but is flagged LOW."""
+        xlsx = make_workbook(tmp_path / "empty.xlsx", {"Blank": []})
+
+        result = SpreadsheetConverter().convert(xlsx)
+
+        assert result.success is True
+        assert result.confidence == ConfidenceLevel.LOW
+        assert "_Empty sheet._" in result.text
+
+    def test_xlsb_dates_stay_serial_numbers(self, tmp_path: Path):
+        """XLSB carries no number formats we can read, so dates stay serials."""
+        xlsb = make_xlsb(
+            tmp_path / "model.xlsb",
+            "Load Schedule",
+            [["Phase", "MW", "Energized"], ["1", 10.0, 45292.0]],
+        )
+
+        result = SpreadsheetConverter().convert(xlsb)
+
+        assert result.success is True
+        assert result.method == "xlsb-stream"
+        assert "## Load Schedule" in result.text
+        assert "| Phase | MW | Energized |" in result.text
+        assert "| 1 | 10 | 45292 |" in result.text
+
+    def test_corrupt_workbook_fails_cleanly(self, tmp_path: Path):
+        """An unreadable workbook yields a failed result instead of raising."""
+        bogus = tmp_path / "bogus.xlsb"
+        bogus.write_bytes(b"not a workbook")
+
+        result = SpreadsheetConverter().convert(bogus)
+
+        assert result.success is False
+        assert result.method == "xlsb-stream"
+        assert result.confidence_reason == "converter crashed"
+
+    def test_missing_file(self, tmp_path: Path):
+        """A missing file is reported, not raised."""
+        result = SpreadsheetConverter().convert(tmp_path / "missing.xlsx")
+
+        assert result.success is False
+        assert result.confidence_reason == "file not found"
+
+    def test_invalid_cap_rejected(self):
+        """A non-positive row cap is a programming error."""
+        with pytest.raises(ValueError):
+            SpreadsheetConverter(max_rows_per_sheet=0)
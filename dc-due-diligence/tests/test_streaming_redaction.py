@@ -0,0 +1,145 @@
+"""
+Tests for redacting large files as a stream.
+
+Block sizes are shrunk so small files exercise many block boundaries.  Uses
+the SSN-finding fake model from ``test_redaction_batching``.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from converters import redactor
+from converters.detection_cache import DetectionCache
+from tests.test_redaction_batching import _filler, fake_model  # noqa: F401  (fixture)
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Stream every file, 3,000 characters at a time."""
+    monkeypatch.setattr(redactor, "_STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(redactor, "_STREAM_BLOCK_CHARS", 3000)
+    monkeypatch.setattr(redactor, "_STREAM_CONTEXT", 1000)
+
+
+def _document(values: int, spacing: int = 200) -> str:
+    """Prose with an SSN, EIN or routing number every *spacing* or so
+    characters."""
+    lines = []
+    for n in range(values):
+        lines.append(_filler(spacing + 37 * (n % 11)))
+        if n % 3 == 0:
+            lines.append(f"Guarantor SSN 123-45-{n:04d}")
+        elif n % 3 == 1:
+            lines.append(f"Seller EIN 12-{n:07d}, signed.")
+        else:
+            lines.append("Wire to routing 021000021 today.")
+    return "\n".join(lines) + "\n"
+
+
+class TestStreamedRedaction:
+    """Tests for _redact_stream."""
+
+    def test_same_output_as_in_memory(self, tmp_path: Path, fake_model, small_blocks):
+        text = _document(120)
+        path = tmp_path / "report.md"
+        path.write_text(text)
+        expected = redactor._apply_redactions(
+            text, redactor._detect_pii_gliner_many([text])[0]
+        )
+
+        chars, result = redactor._redact_stream(path)
+
+        assert chars == len(text)
+        assert path.read_text() == expected.redacted_text
+        assert result.entities_found == expected.entities_found == 120
+        for entity in result.entities:
+            assert text[entity.start : entity.end][-4:].isdigit()
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_line_endings_are_kept(self, tmp_path: Path, fake_model, small_blocks):
+        path = tmp_path / "export.md"
+        path.write_bytes(("row,SSN 123-45-6789\r\n" + _filler(90) + "\r\n").encode() * 300)
+
+        redactor._redact_stream(path)
+
+        data = path.read_bytes()
+        assert data.count(b"\r\n") == 600
+        assert b"6789" not in data
+
+    def test_clean_file_is_not_rewritten(self, tmp_path: Path, fake_model, small_blocks):
+        path = tmp_path / "om.md"
+        path.write_text(_filler(20_000))
+        before = path.stat().st_mtime_ns
+
+        _, result = redactor._redact_stream(path)
+
+        assert result.entities_found == 0
+        assert path.stat().st_mtime_ns == before
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failure_leaves_original(self, tmp_path: Path, fake_model, small_blocks, monkeypatch):
+        path = tmp_path / "report.md"
+        path.write_text(_document(60))
+        calls = []
+
+        def failing(text):
+            calls.append(text)
+            if len(calls) > 2:
+                raise RuntimeError("model crashed")
+            return []
+
+        monkeypatch.setattr(redactor, "_detect_pii_regex", failing)
+
+        with pytest.raises(RuntimeError):
+            redactor._redact_stream(path)
+
+        assert path.read_text() == _document(60)
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_memory_does_not_grow_with_file(self, tmp_path: Path, fake_model, monkeypatch):
+        monkeypatch.setattr(redactor, "_STREAM_BLOCK_CHARS", 50_000)
+        peaks = []
+        # The same values in 0.5 and 2 MB: only entity records may grow.
+        for spacing in (5000, 20_000):
+            path = tmp_path / f"export{spacing}.md"
+            path.write_text(_document(100, spacing=spacing))
+            tracemalloc.start()
+            redactor._redact_stream(path, cache=DetectionCache(max_entries=10))
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        assert peaks[1] < 1.2 * peaks[0]
+        assert peaks[1] < path.stat().st_size / 2
+
+
+class TestFolderStreaming:
+    """Tests for large files in redact_converted_folder."""
+
+    def test_large_files_are_streamed(self, tmp_path: Path, fake_model, monkeypatch):
+        monkeypatch.setattr(redactor, "_STREAM_MIN_BYTES", 10_000)
+        monkeypatch.setattr(redactor, "_STREAM_BLOCK_CHARS", 3000)
+        streamed = []
+        stream = redactor._redact_stream
+        monkeypatch.setattr(
+            redactor,
+            "_redact_stream",
+            lambda path, *args: streamed.append(path.name) or stream(path, *args),
+        )
+        big = _document(60)
+        (tmp_path / "big.md").write_text(big)
+        (tmp_path / "small.md").write_text("Taxpayer SSN 123-45-6789.\n")
+
+        report = redactor.redact_converted_folder(tmp_path)
+
+        assert streamed == ["big.md"]
+        assert report.total_entities == 61
+        assert report.characters_scanned == len(big) + 26
+        saved = json.loads((tmp_path / "redaction-report.json").read_text())
+        big_entry = next(f for f in saved["files"] if f["file"] == "big.md")
+        assert big_entry["sha256"] == redactor._file_sha256(tmp_path / "big.md")
+        assert redactor.redact_converted_folder(tmp_path).files_skipped == 2
@@ -0,0 +1,254 @@
+"""
+Tests for per-page text-layer analysis and text-layer-aware OCR routing.
+
+PDFs are built by hand (Helvetica text only) so the tests need neither
+sample files nor the Docling models.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from converters import docling_converter
+from converters.docling_converter import DoclingConverter
+from converters.text_layer import (
+    PageTextLayer,
+    TextLayerReport,
+    analyze_pdf_text_layer,
+    garbled_ratio,
+)
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+BODY_TEXT = (
+    "The substation at the north end of the parcel delivers 50 MW of "
+    "firm capacity under the existing utility service agreement."
+)
+
+
+def make_pdf(path: Path, pages: list[str | None]) -> Path:
+    """Write a minimal PDF with one page per entry.
+
+    A string becomes a line of Helvetica text on that page; None produces
+    a blank page with no text layer (what a scan looks like to pdfium).
+    """
+    objects: list[bytes] = []
+    page_ids: list[int] = []
+    font_id = 3 + 2 * len(pages)
+
+    for index, text in enumerate(pages):
+        page_id = 3 + 2 * index
+        content_id = page_id + 1
+        page_ids.append(page_id)
+        if text:
+            escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            stream = f"BT /F1 10 Tf 20 700 Td ({escaped}) Tj ET".encode("latin-1")
+        else:
+            stream = b""
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode()
+            + stream
+            + b"\nendstream"
+        )
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    header_objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+    ]
+    font = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    all_objects = header_objects + objects + [font]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(all_objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(all_objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(all_objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_at}\n%%EOF\n"
+    ).encode()
+
+    path.write_bytes(bytes(out))
+    return path
+
+
+def _report(flags: list[bool]) -> TextLayerReport:
+    report = TextLayerReport(path=Path("/tmp/x.pdf"))
+    for index, needs_ocr in enumerate(flags, start=1):
+        report.pages.append(
+            PageTextLayer(
+                page_no=index,
+                char_count=0 if needs_ocr else 500,
+                garbled_ratio=0.0,
+                image_coverage=0.0,
+                needs_ocr=needs_ocr,
+            )
+        )
+    return report
+
+
+# ------------------------------------------------------------------
+# analyze_pdf_text_layer
+# ------------------------------------------------------------------
+
+
+class TestAnalyzeTextLayer:
+    """Tests for the per-page OCR decision."""
+
+    def test_born_digital_pages_skip_ocr(self, tmp_path: Path):
+        """Pages with a real text layer do not need OCR."""
+        pdf = make_pdf(tmp_path / "deck.pdf", [BODY_TEXT, BODY_TEXT])
+
+        report = analyze_pdf_text_layer(pdf)
+
+        assert report is not None
+        assert report.page_count == 2
+        assert report.ocr_pages == []
+        assert report.is_scanned is False
+
+    def test_image_only_pages_need_ocr(self, tmp_path: Path):
+        """Pages without any text layer are routed to OCR."""
+        pdf = make_pdf(tmp_path / "scan.pdf", [None, None, BODY_TEXT])
+
+        report = analyze_pdf_text_layer(pdf)
+
+        assert report is not None
+        assert report.ocr_pages == [1, 2]
+        assert report.is_scanned is True
+
+    def test_keep_text(self, tmp_path: Path):
+        """The page text is returned only when requested."""
+        pdf = make_pdf(tmp_path / "deck.pdf", [BODY_TEXT])
+
+        assert analyze_pdf_text_layer(pdf).pages[0].text == ""
+        kept = analyze_pdf_text_layer(pdf, keep_text=True)
+        assert "substation" in kept.pages[0].text
+
+    def test_unreadable_pdf_returns_none(self, tmp_path: Path):
+        """A file pdfium cannot open yields None instead of raising."""
+        bogus = tmp_path / "bogus.pdf"
+        bogus.write_bytes(b"not a pdf at all")
+
+        assert analyze_pdf_text_layer(bogus) is None
+
+    def test_garbled_ratio(self):
+        """Unmapped glyphs and private-use codepoints count as garbled."""
+        assert garbled_ratio("clean text") == 0.0
+        assert garbled_ratio("\ufffd\ufffd\ue000ab") == pytest.approx(0.6)
+        assert garbled_ratio("   ") == 0.0
+
+    def test_ocr_segments(self):
+        """Contiguous pages with the same decision are grouped."""
+        report = _report([False, False, True, True, False])
+
+        assert report.ocr_segments() == [
+            (False, 1, 2),
+            (True, 3, 4),
+            (False, 5, 5),
+        ]
+
+
+# ------------------------------------------------------------------
+# DoclingConverter OCR routing
+# ------------------------------------------------------------------
+
+
+class _FakeDocument:
+    def __init__(self, pages: int) -> None:
+        self.pages = {n: None for n in range(1, pages + 1)}
+
+    def export_to_markdown(self) -> str:
+        return BODY_TEXT * 5
+
+
+class _FakeResult:
+    def __init__(self, pages: int) -> None:
+        self.status = docling_converter.ConversionStatus.SUCCESS
+        self.errors = []
+        self.document = _FakeDocument(pages)
+
+
+class _FakeConverter:
+    def __init__(self, do_ocr: bool, calls: list) -> None:
+        self.do_ocr = do_ocr
+        self.calls = calls
+
+    def convert(self, source, raises_on_error=True, page_range=(1, 10**9)):
+        self.calls.append((self.do_ocr, page_range))
+        first, last = page_range
+        return _FakeResult(min(last, 3) - first + 1)
+
+
+@pytest.fixture
+def fake_docling(monkeypatch):
+    """Replace the Docling converters with fakes that record their calls."""
+    calls: list[tuple[bool, tuple[int, int]]] = []
+    monkeypatch.setattr(
+        docling_converter,
+        "_get_converter",
+        lambda profile=None, do_ocr=True: _FakeConverter(do_ocr, calls),
+    )
+    monkeypatch.setattr(
+        docling_converter,
+        "_SegmentedConversion",
+        lambda results, first_pages: results[0],
+    )
+    return calls
+
+
+class TestOcrRouting:
+    """Tests that OCR is only enabled for pages that need it."""
+
+    def test_text_layer_pdf_never_ocrd(self, tmp_path: Path, fake_docling):
+        """A fully born-digital PDF goes through the no-OCR converter."""
+        pdf = make_pdf(tmp_path / "deck.pdf", [BODY_TEXT, BODY_TEXT, BODY_TEXT])
+
+        result = DoclingConverter().convert(pdf)
+
+        assert result.success is True
+        assert [do_ocr for do_ocr, _ in fake_docling] == [False]
+        assert result.metadata["ocr_routing"] == "none"
+        assert result.metadata["ocr_page_count"] == 0
+        assert result.is_scanned is False
+
+    def test_mixed_pdf_routed_per_page(self, tmp_path: Path, fake_docling):
+        """Only the image-only page range is converted with OCR."""
+        pdf = make_pdf(tmp_path / "mixed.pdf", [BODY_TEXT, None, BODY_TEXT])
+
+        result = DoclingConverter().convert(pdf)
+
+        assert fake_docling == [
+            (False, (1, 1)),
+            (True, (2, 2)),
+            (False, (3, 3)),
+        ]
+        assert result.metadata["ocr_routing"] == "per-page"
+        assert result.metadata["ocr_pages"] == [2]
+        assert result.metadata["ocr_page_count"] == 1
+        assert result.is_scanned is False
+
+    def test_scanned_pdf_fully_ocrd(self, tmp_path: Path, fake_docling):
+        """A PDF with no text layer anywhere is OCR'd in one pass."""
+        pdf = make_pdf(tmp_path / "scan.pdf", [None, None, None])
+
+        result = DoclingConverter().convert(pdf)
+
+        assert [do_ocr for do_ocr, _ in fake_docling] == [True]
+        assert result.metadata["ocr_routing"] == "all"
+        assert result.metadata["ocr_page_count"] == 3
+        assert result.is_scanned is True
@@ -0,0 +1,127 @@
+"""
+Tests for the token-aware chunker that packs text up to GLiNER's context.
+
+A fake tokenizer stands in for the model's, so nothing is downloaded.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from converters import redactor
+from tests.test_redaction_batching import _filler, fake_model  # noqa: F401  (fixture)
+
+
+class _Encoding(dict):
+    """The parts of a transformers ``BatchEncoding`` the chunker reads."""
+
+    def word_ids(self) -> list[int]:
+        return self["input_ids"]
+
+
+class _FakeTokenizer:
+    """One subword per started 4 characters of each word."""
+
+    is_fast = True
+    model_max_length = 512
+
+    def __call__(self, words, is_split_into_words=False, add_special_tokens=True):
+        # The word index stands in for the subword id.
+        ids = [i for i, word in enumerate(words) for _ in range(len(word) // 4 + 1)]
+        return _Encoding(input_ids=ids)
+
+
+def _words(text: str) -> list[str]:
+    return redactor._WORD_PATTERN.findall(text)
+
+
+class TestChunkText:
+    """Tests for packing words into model-sized chunks."""
+
+    def test_offsets_map_back_to_text(self):
+        text = "  " + _filler(9000) + "\n"
+
+        chunks = redactor._chunk_text(text)
+
+        for chunk in chunks:
+            offset = chunk["offset"]
+            assert text[offset : offset + len(chunk["text"])] == chunk["text"]
+            assert chunk["text"] == chunk["text"].strip()
+        assert chunks[0]["offset"] == 2
+        assert chunks[-1]["text"].endswith(text.strip()[-10:])
+
+    def test_chunks_fill_the_word_limit(self):
+        chunks = redactor._chunk_text(_filler(9000))
+
+        sizes = [len(_words(chunk["text"])) for chunk in chunks]
+        assert all(size == redactor._CHUNK_MAX_WORDS for size in sizes[:-1])
+        assert sizes[-1] <= redactor._CHUNK_MAX_WORDS
+
+    def test_overlap_is_the_minimum(self):
+        first, second, *_ = redactor._chunk_text(_filler(9000))
+
+        shared = first["offset"] + len(first["text"]) - second["offset"]
+        assert len(_words(first["text"][-shared:])) == redactor._CHUNK_OVERLAP_WORDS
+
+    def test_subword_budget(self):
+        limits = redactor._ChunkLimits(
+            max_words=384, max_tokens=100, tokenizer=_FakeTokenizer()
+        )
+        text = "ABCDEFGHIJKLMNOP " * 200  # five subwords per word
+
+        chunks = redactor._chunk_text(text, limits)
+
+        assert {len(_words(chunk["text"])) for chunk in chunks[:-1]} == {20}
+
+    def test_short_and_blank_text(self):
+        assert redactor._chunk_text("  SSN 123-45-6789 ") == [
+            {"text": "SSN 123-45-6789", "offset": 2}
+        ]
+        assert redactor._chunk_text(" \n ") == []
+
+    @pytest.mark.parametrize("shift", range(0, 40, 3))
+    def test_entity_across_a_boundary_is_found(self, fake_model, shift):
+        text = _filler(1580 + shift) + " SSN 123-45-6789 " + _filler(3000)
+
+        (entity,) = redactor._detect_pii_gliner_many([text], gate=False)[0]
+
+        assert text[entity["start"] : entity["end"]] == "123-45-6789"
+
+    def test_fewer_passes_than_character_chunks(self, fake_model):
+        # Sentences differ, so no chunk repeats and none is cached.
+        text = " ".join(
+            f"Building {i} has {i % 90 + 10} MW of firm capacity." for i in range(1200)
+        )
+
+        redactor._detect_pii_gliner_many([text], gate=False)
+
+        passes = sum(len(batch) for batch in fake_model.batches)
+        # 1000-character chunks with 200 characters of overlap took 63.
+        assert passes == 29
+
+
+class TestChunkLimits:
+    """Tests for reading the limits from a loaded model."""
+
+    def test_fake_model_gets_defaults(self, fake_model):
+        limits = redactor._chunk_limits(fake_model)
+
+        assert limits.max_words == redactor._CHUNK_MAX_WORDS
+        assert limits.max_tokens is None
+
+    def test_prompt_is_taken_from_the_budget(self):
+        class _Processor:
+            transformer_tokenizer = _FakeTokenizer()
+            words_splitter = None
+
+        class _Config:
+            max_len = 256
+
+        class _Model:
+            config = _Config()
+            data_processor = _Processor()
+
+        limits = redactor._chunk_limits(_Model())
+
+        assert limits.max_words == 256
+        assert 0 < limits.max_tokens < 512 - 2 * len(redactor._REDACT_LABELS)